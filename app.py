@@ -4,11 +4,17 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import asyncio
 from backend.models.draft import Draft
 from backend.models.player_pool import PlayerPool
+from backend.mcp_clients.draft_client import close_draft_client
+from backend.utils.mcp_cache import cleanup_mcp_servers
 
 async def main():
     draft = await Draft.get(id=None)
     player_pool = await PlayerPool.get(id=None)
-    await draft.run(player_pool.id)
+    try:
+        await draft.run(player_pool.id)
+    finally:
+        await cleanup_mcp_servers()
+        await close_draft_client()
 
 if __name__ == "__main__":
     print(f"Starting MLB Draft Oracle simulated draft...")
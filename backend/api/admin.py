@@ -20,6 +20,7 @@ async def cleanup_database():
     - All draft teams
     - All draft history
     - All draft tasks
+    - All agent sessions
     
     Use this to reset the database to a clean state.
     After calling this endpoint, the next draft creation will:
@@ -44,7 +45,8 @@ async def cleanup_database():
             Player, 
             PlayerPool, 
             Team,
-            DraftTask
+            DraftTask,
+            AgentSession
         )
         
         deleted_counts = {}
@@ -59,42 +61,49 @@ async def cleanup_database():
             deleted_counts['draft_tasks'] = draft_tasks_count
             logger.info(f"✓ Deleted {draft_tasks_count} draft tasks")
             
-            # 2. Delete draft history
+            # 2. Delete agent sessions
+            logger.info("Deleting agent sessions...")
+            agent_sessions_count = session.query(AgentSession).count()
+            session.query(AgentSession).delete()
+            deleted_counts['agent_sessions'] = agent_sessions_count
+            logger.info(f"✓ Deleted {agent_sessions_count} agent sessions")
+            
+            # 3. Delete draft history
             logger.info("Deleting draft history...")
             draft_history_count = session.query(DraftHistory).count()
             session.query(DraftHistory).delete()
             deleted_counts['draft_history'] = draft_history_count
             logger.info(f"✓ Deleted {draft_history_count} draft history records")
             
-            # 3. Delete draft teams
+            # 4. Delete draft teams
             logger.info("Deleting draft teams...")
             draft_teams_count = session.query(DraftTeam).count()
             session.query(DraftTeam).delete()
             deleted_counts['draft_teams'] = draft_teams_count
             logger.info(f"✓ Deleted {draft_teams_count} draft team records")
             
-            # 4. Delete teams
+            # 5. Delete teams
             logger.info("Deleting teams...")
             teams_count = session.query(Team).count()
             session.query(Team).delete()
             deleted_counts['teams'] = teams_count
             logger.info(f"✓ Deleted {teams_count} teams")
             
-            # 5. Delete drafts
+            # 6. Delete drafts
             logger.info("Deleting drafts...")
             drafts_count = session.query(Draft).count()
             session.query(Draft).delete()
             deleted_counts['drafts'] = drafts_count
             logger.info(f"✓ Deleted {drafts_count} drafts")
             
-            # 6. Delete players
+            # 7. Delete players
             logger.info("Deleting players...")
             players_count = session.query(Player).count()
             session.query(Player).delete()
             deleted_counts['players'] = players_count
             logger.info(f"✓ Deleted {players_count} players")
             
-            # 7. Delete player pools
+            # 8. Delete player pools
             logger.info("Deleting player pools...")
             player_pools_count = session.query(PlayerPool).count()
             session.query(PlayerPool).delete()
@@ -155,7 +164,8 @@ async def get_database_stats():
             Player, 
             PlayerPool, 
             Team,
-            DraftTask
+            DraftTask,
+            AgentSession
         )
         
         stats = {}
@@ -168,6 +178,7 @@ async def get_database_stats():
             stats['players'] = session.query(Player).count()
             stats['player_pools'] = session.query(PlayerPool).count()
             stats['draft_tasks'] = session.query(DraftTask).count()
+            stats['agent_sessions'] = session.query(AgentSession).count()
         
         total_records = sum(stats.values())
         
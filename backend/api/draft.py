@@ -7,6 +7,7 @@ from backend.data.postgresql.unified_db import read_drafts
 import logging
 from typing import List, Dict, Optional
 from backend.models.draft_teams import DraftTeams
+from backend.utils.util import DrafterMode
 import json
 from fastapi import APIRouter
 import os
@@ -53,6 +54,10 @@ class DraftResponse(PydanticBaseModel):
     draft_order: List[str]
     is_complete: bool
 
+class DrafterModeRequest(PydanticBaseModel):
+    mode: Optional[DrafterMode] = None
+    team_name: Optional[str] = None
+
 class DraftsResponse(PydanticBaseModel):
     draft_id: str
     name: str
@@ -257,6 +262,37 @@ async def resume_draft(draft_id: str):
         logging.error(f"Error resuming draft {draft_id}: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Error resuming draft: {str(e)}")
 
+@router.put("/drafts/{draft_id}/drafter-mode")
+async def set_drafter_mode(draft_id: str, request: DrafterModeRequest):
+    """
+    Choose the drafter used for picks: "llm" (researcher + drafter agents), "structured"
+    (researcher + a drafter returning a typed pick committed locally) or "heuristic" (no LLM).
+
+    With team_name, sets (or clears, when mode is null) that team's override.
+    Without it, sets the draft-wide default.
+    """
+    logger.info(f"PUT /drafts/{draft_id}/drafter-mode - mode={request.mode}, team={request.team_name}")
+    draft = await Draft.get(draft_id.lower())
+    if not draft:
+        raise HTTPException(status_code=404, detail="Draft not found")
+
+    if request.team_name:
+        team = next((t for t in draft.teams.teams if t.name.lower() == request.team_name.lower()), None)
+        if not team:
+            raise HTTPException(status_code=404, detail="Team not found in draft")
+        team.drafter_mode = request.mode
+    else:
+        if request.mode is None:
+            raise HTTPException(status_code=400, detail="mode is required when no team_name is given")
+        draft.drafter_mode = request.mode
+
+    draft.save()
+    return {
+        "draft_id": draft.id,
+        "drafter_mode": draft.drafter_mode,
+        "team_modes": {t.name: t.drafter_mode for t in draft.teams.teams}
+    }
+
 @router.get("/drafts/{draft_id}/teams/{team_name}/round/{round}/pick/{pick}/select-player", response_model=DraftResponse)
 async def select_player(draft_id: str, team_name: str, round: int, pick: int):
     """Select player endpoint - PostgreSQL RDS only"""
@@ -41,6 +41,15 @@ app.include_router(draft_history.router, prefix="/v1")
 app.include_router(admin.router, prefix="/v1")
 
 
+@app.on_event("shutdown")
+async def shutdown_mcp_clients():
+    """Stop pooled MCP server processes"""
+    from backend.mcp_clients.draft_client import close_draft_client
+    from backend.utils.mcp_cache import cleanup_mcp_servers
+    await cleanup_mcp_servers()
+    await close_draft_client()
+
+
 @app.get("/health")
 def health_check():
     """Health check MLB Draft Oracle API"""
@@ -52,6 +52,10 @@ python_env = {
 # Clean up empty values to avoid issues
 python_env = {k: v for k, v in python_env.items() if v}
 
+# URL of a shared streamable HTTP draft server (e.g. http://localhost:8001/mcp).
+# When set, drafter agents connect to it instead of spawning draft_server.py per pick.
+drafter_mcp_server_url = os.getenv("DRAFT_MCP_URL")
+
 drafter_mcp_server_params = [
     {
         "command": PYTHON_CMD,
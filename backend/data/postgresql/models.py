@@ -50,6 +50,11 @@ class DraftTask(Base):
     task_id = Column(String, primary_key=True, index=True)
     data = Column(JSONB)
 
+class AgentSession(Base):
+    __tablename__ = 'agent_sessions'
+    id = Column(String, primary_key=True, index=True)
+    data = Column(JSONB)
+
 # Create all tables in PostgreSQL RDS
 try:
     Base.metadata.create_all(bind=engine)
@@ -7,7 +7,7 @@ SQLite code has been commented out but preserved for potential rollback.
 """
 import json
 import logging
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +39,16 @@ def read_draft(id: str) -> Optional[dict]:
     # return sqlite_read_draft(id)
 
 
+def read_draft_field(id: str, *path: str) -> Optional[Any]:
+    """Read a single field of a draft (e.g. "teams", "teams") without loading the whole draft."""
+    return _read_draft_field_postgres(id, list(path))
+
+
+def read_draft_version(id: str) -> Optional[Tuple[Any, Any]]:
+    """(current_pick, is_complete) of a draft, which every pick changes; None if the draft doesn't exist."""
+    return _read_draft_version_postgres(id)
+
+
 def read_drafts() -> List[Optional[dict]]:
     """Read all drafts from PostgreSQL RDS."""
     return _read_drafts_postgres()
@@ -163,6 +173,20 @@ def read_draft_history(id: str) -> Optional[dict]:
     # return sqlite_read_draft_history(id)
 
 
+# ============================================================================
+# AGENT SESSION OPERATIONS
+# ============================================================================
+
+def write_agent_session(id: str, data: dict) -> None:
+    """Write a team's agent session state to PostgreSQL RDS."""
+    _write_agent_session_postgres(id, data)
+
+
+def read_agent_session(id: str) -> Optional[dict]:
+    """Read a team's agent session state from PostgreSQL RDS."""
+    return _read_agent_session_postgres(id)
+
+
 # ============================================================================
 # POSTGRESQL IMPLEMENTATION (Active)
 # ============================================================================
@@ -196,6 +220,34 @@ def _read_draft_postgres(id: str) -> Optional[dict]:
         return None
 
 
+def _read_draft_field_postgres(id: str, path: List[str]) -> Optional[Any]:
+    """Read one field of a draft from PostgreSQL, extracted server-side"""
+    from backend.data.postgresql.connection import DatabaseSession
+    from sqlalchemy import text
+    
+    # data holds the serialized draft document; parse it in PostgreSQL and only ship the requested path
+    query = text("SELECT ((data #>> '{}')::jsonb #> CAST(:path AS text[]))::text FROM drafts WHERE id = :id")
+    with DatabaseSession() as session:
+        row = session.execute(query, {"id": id.lower(), "path": path}).first()
+        if row is None or row[0] is None:
+            return None
+        return json.loads(row[0])
+
+
+def _read_draft_version_postgres(id: str) -> Optional[Tuple[Any, Any]]:
+    """Read a draft's pick counters from PostgreSQL, extracted server-side"""
+    from backend.data.postgresql.connection import DatabaseSession
+    from sqlalchemy import text
+    
+    query = text(
+        "SELECT (data #>> '{}')::jsonb ->> 'current_pick', (data #>> '{}')::jsonb ->> 'is_complete' "
+        "FROM drafts WHERE id = :id"
+    )
+    with DatabaseSession() as session:
+        row = session.execute(query, {"id": id.lower()}).first()
+        return (row[0], row[1]) if row is not None else None
+
+
 def _read_drafts_postgres() -> List[Optional[dict]]:
     """Read all drafts from PostgreSQL"""
     from backend.data.postgresql.connection import DatabaseSession
@@ -385,6 +437,34 @@ def _read_draft_history_postgres(id: str) -> Optional[dict]:
             return json.loads(result.data)
         return None
 
+def _write_agent_session_postgres(id: str, data: dict) -> None:
+    """Write agent session to PostgreSQL"""
+    from backend.data.postgresql.connection import DatabaseSession
+    from backend.data.postgresql.models import AgentSession
+    from sqlalchemy.dialects.postgresql import insert
+    
+    with DatabaseSession() as session:
+        json_data = json.dumps(data, default=str)
+        insert_stmt = insert(AgentSession).values(id=id.lower(), data=json_data)
+        do_update_stmt = insert_stmt.on_conflict_do_update(
+            index_elements=['id'], 
+            set_=dict(data=json_data)
+        )
+        session.execute(do_update_stmt)
+        logger.info(f"Wrote agent session {id} to PostgreSQL")
+
+
+def _read_agent_session_postgres(id: str) -> Optional[dict]:
+    """Read agent session from PostgreSQL"""
+    from backend.data.postgresql.connection import DatabaseSession
+    from backend.data.postgresql.models import AgentSession
+    
+    with DatabaseSession() as session:
+        result = session.query(AgentSession).filter_by(id=id.lower()).first()
+        if result:
+            return json.loads(result.data)
+        return None
+
 # ============================================================================
 # DRAFT TASK OPERATIONS
 # ============================================================================
@@ -0,0 +1,148 @@
+"""
+Deterministic (no-LLM) drafter.
+
+Picks the best available player for a team's needed positions by scoring
+each candidate's season stats against the rest of the available pool,
+weighted by the team's draft strategy.
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+import logging
+from backend.models.players import Player
+from backend.utils.util import pitcher_position_set
+from backend.templates.strategies import early_ace_strategy, balanced_strategy, power_hitting_focus_strategy, speed_strategy, hitters_first_strategy, pitching_heavy_strategy
+
+logger = logging.getLogger(__name__)
+
+# Stat weights per strategy. Keys are PlayerStatistics fields.
+HITTER_WEIGHTS = {
+    balanced_strategy: {"r": 1.0, "hr": 1.0, "rbi": 1.0, "sb": 1.0, "avg": 1.0, "obp": 1.0, "slg": 1.0},
+    power_hitting_focus_strategy: {"r": 0.5, "hr": 2.0, "rbi": 2.0, "sb": 0.25, "avg": 0.5, "obp": 0.5, "slg": 1.5},
+    speed_strategy: {"r": 1.5, "hr": 0.5, "rbi": 0.5, "sb": 3.0, "avg": 1.0, "obp": 1.0, "slg": 0.5},
+}
+PITCHER_WEIGHTS = {
+    balanced_strategy: {"w": 1.0, "k": 1.0, "era": 1.0, "whip": 1.0, "s": 1.0},
+    early_ace_strategy: {"w": 1.5, "k": 2.0, "era": 1.5, "whip": 1.5, "s": 0.25},
+    pitching_heavy_strategy: {"w": 1.5, "k": 1.5, "era": 1.5, "whip": 1.5, "s": 1.0},
+}
+
+# Bonus added to a candidate's score when its position suits the strategy.
+PITCHER_BONUS = {
+    early_ace_strategy: 0.25,
+    pitching_heavy_strategy: 0.2,
+    hitters_first_strategy: -0.25,
+}
+
+# Rate stats where a lower value is better.
+LOWER_IS_BETTER = {"era", "whip"}
+
+# Rate stats are shrunk toward the pool minimum until the player reaches this volume.
+FULL_SAMPLE_AT_BATS = 300
+FULL_SAMPLE_INNINGS = 60.0
+
+
+def _to_float(value, default: float = 0.0) -> float:
+    """Parse MLB Stats API values such as '.285', '3.12', '-.--' or 45."""
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _is_pitcher(player: Player) -> bool:
+    return player.position in pitcher_position_set
+
+
+def _sample_weight(player: Player) -> float:
+    """Fraction of a full sample the player's rate stats are based on (0..1)."""
+    if _is_pitcher(player):
+        return min(1.0, _to_float(player.stats.innings_pitched) / FULL_SAMPLE_INNINGS)
+    return min(1.0, _to_float(player.stats.at_bats) / FULL_SAMPLE_AT_BATS)
+
+
+def _stat_value(player: Player, stat: str) -> Optional[float]:
+    raw = getattr(player.stats, stat, None)
+    if raw is None:
+        return None
+    if stat in LOWER_IS_BETTER and _to_float(raw, default=-1.0) < 0:
+        return None
+    return _to_float(raw)
+
+
+def _normalized_scores(candidates: List[Player], weights: Dict[str, float]) -> Dict[int, float]:
+    """Weighted min-max score (0..1) of each candidate against the others in its group."""
+    ranges: Dict[str, Tuple[float, float]] = {}
+    for stat in weights:
+        values = [v for v in (_stat_value(p, stat) for p in candidates) if v is not None]
+        if values:
+            ranges[stat] = (min(values), max(values))
+
+    scores = {}
+    total_weight = sum(weights[stat] for stat in ranges) or 1.0
+    for player in candidates:
+        sample = _sample_weight(player)
+        score = 0.0
+        for stat, (low, high) in ranges.items():
+            value = _stat_value(player, stat)
+            if value is None or high == low:
+                continue
+            normalized = (value - low) / (high - low)
+            if stat in LOWER_IS_BETTER:
+                normalized = 1.0 - normalized
+            if stat in LOWER_IS_BETTER or stat in {"avg", "obp", "slg"}:
+                normalized *= sample
+            score += weights[stat] * normalized
+        scores[player.id] = score / total_weight
+    return scores
+
+
+def rank_players(available_players: Iterable[Player], needed_positions: Iterable[str], strategy: str) -> List[Tuple[Player, float]]:
+    """
+    Rank available players at the needed positions for a strategy.
+
+    Returns:
+        List of (player, score) tuples, best first. Ties break on player id
+        so the ordering is deterministic.
+    """
+    needed = {getattr(pos, "value", pos) for pos in needed_positions}
+    candidates = [p for p in available_players if not p.is_drafted and p.position in needed]
+    if not candidates:
+        return []
+
+    hitters = [p for p in candidates if not _is_pitcher(p)]
+    pitchers = [p for p in candidates if _is_pitcher(p)]
+    scores = {}
+    scores.update(_normalized_scores(hitters, HITTER_WEIGHTS.get(strategy, HITTER_WEIGHTS[balanced_strategy])))
+    scores.update(_normalized_scores(pitchers, PITCHER_WEIGHTS.get(strategy, PITCHER_WEIGHTS[balanced_strategy])))
+
+    # Only nudge toward/away from pitchers when there is actually a choice of position.
+    if pitchers and hitters:
+        bonus = PITCHER_BONUS.get(strategy, 0.0)
+        for p in pitchers:
+            scores[p.id] += bonus
+
+    ranked = sorted(candidates, key=lambda p: (-scores[p.id], p.id))
+    return [(p, round(scores[p.id], 4)) for p in ranked]
+
+
+def select_heuristic_player(available_players: Iterable[Player], needed_positions: Iterable[str], strategy: str) -> Optional[Tuple[Player, str]]:
+    """
+    Pick the best available player for a team.
+
+    Returns:
+        (player, rationale) or None if no available player fits a needed position.
+    """
+    needed_positions = list(needed_positions)
+    ranked = rank_players(available_players, needed_positions, strategy)
+    if not ranked:
+        logger.warning(f"[select_heuristic_player] No available players for positions {needed_positions}")
+        return None
+
+    player, score = ranked[0]
+    rationale = (
+        f"Heuristic pick: {player.name} ({player.position}, {player.team}) is the highest-rated "
+        f"available player at a needed position for this strategy (score {score:.2f})."
+    )
+    logger.info(f"[select_heuristic_player] Selected {player.name} ({player.position}) with score {score:.2f}")
+    return player, rationale
@@ -1,118 +1,107 @@
 """
-Clean up S3 Vectors database by removing all test data.
+Clean up the S3 Vectors database.
+Deletes the keys recorded in the key manifest (see kb_manifest.py) in
+batches, optionally only those past a retention age or for one topic.
 This script directly accesses S3 Vectors without going through API Gateway.
 """
 
+import argparse
 import os
-import json
-import boto3
 from dotenv import load_dotenv, find_dotenv
-from pathlib import Path
-
 
 load_dotenv(override=True, dotenv_path=find_dotenv())
 
-# Get configuration
-VECTOR_BUCKET = os.getenv('VECTOR_BUCKET')
-INDEX_NAME = 'draft-research'
+# Imported after load_dotenv so the modules see the .env configuration
+from embeddings import get_embedding
+from ingest_pipeline import delete_vectors, expire_vectors
+from kb_manifest import get_manifest, KB_MANIFEST_URL
+from vector_store import get_vector_store, VECTOR_STORE, VECTOR_BUCKET, INDEX_NAME
 
-if not VECTOR_BUCKET:
+if VECTOR_STORE == 's3' and not os.getenv('VECTOR_BUCKET'):
     print("Error: VECTOR_BUCKET not found in .env")
     exit(1)
 
-# Initialize S3 Vectors client
-s3_vectors = boto3.client('s3vectors')
+# S3 Vectors limits topK to 30
+SCAN_BATCH_SIZE = 30
+
 
 def delete_all_vectors():
-    """Delete all vectors from the index."""
-    print("Cleaning S3 Vectors database...")
-    print(f"Bucket: {VECTOR_BUCKET}")
-    print(f"Index: {INDEX_NAME}")
-    print()
-    
+    """Delete every vector recorded in the manifest."""
+    keys = get_manifest().keys()
+    if not keys:
+        print("✅ No vectors in the manifest - database is already empty")
+        return 0
+    print(f"Deleting {len(keys)} vectors...")
+    deleted = delete_vectors(keys)
+    print(f"\n✅ Successfully deleted {deleted} vectors")
+    return deleted
+
+
+def delete_unlisted_vectors():
+    """
+    Delete vectors ingested before the manifest existed.
+    S3 Vectors doesn't have a list operation, so this searches broadly with a
+    generic embedding and deletes each batch of results until none are left.
+    """
+    print("Searching for vectors missing from the manifest...")
+    dummy_vector = get_embedding("document")
+    store = get_vector_store()
     deleted_count = 0
-    
-    try:
-        # S3 Vectors doesn't have a list operation, so we need to search broadly
-        print("Searching for vectors to delete...")
-        
-        # Get a real embedding for a generic search term
-        sagemaker_runtime = boto3.client('sagemaker-runtime')
-        SAGEMAKER_ENDPOINT = os.getenv('SAGEMAKER_ENDPOINT', 'mlbdraftoracle-embedding-endpoint')
-        
-        response = sagemaker_runtime.invoke_endpoint(
-            EndpointName=SAGEMAKER_ENDPOINT,
-            ContentType='application/json',
-            Body='{"inputs": "document"}'
-        )
-        
-        result = json.loads(response['Body'].read().decode())
-        # Extract from nested array [[[embedding]]]
-        dummy_vector = result[0][0]
-        
-        # S3 Vectors limits topK to 30, so we need to loop
-        all_vectors = []
-        batch_size = 30
-        
-        while True:
-            response = s3_vectors.query_vectors(
-                vectorBucketName=VECTOR_BUCKET,
-                indexName=INDEX_NAME,
-                queryVector={"float32": dummy_vector},
-                topK=batch_size,
-                returnMetadata=True
-            )
-            
-            vectors = response.get('vectors', [])
-            if not vectors:
-                break
-                
-            all_vectors.extend(vectors)
-            
-            # Delete this batch before getting more
-            print(f"  Found batch of {len(vectors)} vectors...")
-            for vector in vectors:
-                try:
-                    s3_vectors.delete_vectors(
-                        vectorBucketName=VECTOR_BUCKET,
-                        indexName=INDEX_NAME,
-                        keys=[vector['key']]
-                    )
-                    deleted_count += 1
-                except Exception as e:
-                    print(f"  Error deleting {vector['key']}: {e}")
-            
-            # If we got less than batch_size, we're done
-            if len(vectors) < batch_size:
-                break
-        
-        if deleted_count > 0:
-            print(f"\n✅ Successfully deleted {deleted_count} vectors")
-        else:
-            print("✅ No vectors found - database is already empty")
-            
-    except Exception as e:
-        print(f"❌ Error during cleanup: {e}")
-        if deleted_count > 0:
-            print(f"   (Partially successful - deleted {deleted_count} vectors)")
+    while True:
+        vectors = store.query_vectors(dummy_vector, top_k=SCAN_BATCH_SIZE)
+        if not vectors:
+            break
+        print(f"  Found batch of {len(vectors)} vectors...")
+        deleted_count += delete_vectors([vector['key'] for vector in vectors])
+        if len(vectors) < SCAN_BATCH_SIZE:
+            break
+    print(f"\n✅ Deleted {deleted_count} unlisted vectors")
+    return deleted_count
+
 
 def main():
     """Clean up the S3 Vectors database."""
+    parser = argparse.ArgumentParser(description="Delete knowledge base vectors")
+    parser.add_argument("--older-than-days", type=float, help="Only delete vectors ingested more than N days ago")
+    parser.add_argument("--topic", help="Only delete vectors with this topic")
+    parser.add_argument("--scan", action="store_true", help="Also delete vectors not in the manifest (slow)")
+    args = parser.parse_args()
+
     print("=" * 60)
     print("S3 Vectors Database Cleanup")
     print("=" * 60)
+    print(f"Store: {VECTOR_STORE}")
+    print(f"Bucket: {VECTOR_BUCKET}")
+    print(f"Index: {INDEX_NAME}")
+    print(f"Manifest: {KB_MANIFEST_URL.split('@')[-1]} ({get_manifest().count()} keys)")
     print()
-    
+
+    if args.older_than_days is not None:
+        deleted = expire_vectors(args.older_than_days, topic=args.topic)
+        print(f"\n✅ Expired {deleted} vectors older than {args.older_than_days:g} days")
+        return
+
+    scope = f"ALL vectors with topic '{args.topic}'" if args.topic else "ALL vectors"
     # Confirm before deleting
-    response = input("⚠️  This will DELETE ALL vectors. Continue? (yes/no): ")
+    response = input(f"⚠️  This will DELETE {scope}. Continue? (yes/no): ")
     if response.lower() != 'yes':
         print("Cleanup cancelled.")
         return
-    
+
     print()
-    delete_all_vectors()
-    
+    try:
+        if args.topic:
+            deleted = delete_vectors(get_manifest().keys(topic=args.topic))
+            print(f"\n✅ Successfully deleted {deleted} vectors")
+        else:
+            delete_all_vectors()
+            if args.scan:
+                delete_unlisted_vectors()
+    except Exception as e:
+        print(f"❌ Error during cleanup: {e}")
+
     print("\n💡 Tip: Run test_api.py to add new test data")
 
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,2 @@
+# test_ingest_s3vectors.py and test_search_s3vectors.py are manual scripts against a deployed bucket, not unit tests
+collect_ignore = ["test_ingest_s3vectors.py", "test_search_s3vectors.py"]
@@ -0,0 +1,198 @@
+"""
+Ingest-time duplicate suppression for the knowledge base.
+
+The researcher re-ingests near-identical analyses of the same news on every
+scheduled run. Each document is fingerprinted before it is chunked:
+- an exact content hash (sha256 of the normalized text), and
+- a MinHash signature over word shingles, whose agreement rate estimates the
+  Jaccard similarity of two documents' shingle sets.
+
+Signatures live in the key manifest's database (see kb_manifest.py) with LSH
+banding: each signature is cut into DEDUP_BANDS bands and documents sharing
+any band are the only candidates compared, so a lookup is an indexed query
+rather than a scan.
+(SimHash at a few bits of Hamming distance is too strict for texts of a few
+hundred words, where a one-word edit already flips ~8 of 64 bits.)
+"""
+
+import hashlib
+import os
+import threading
+from array import array
+from typing import Dict, List, Optional
+
+from sqlalchemy import BigInteger, Column, Index, Integer, LargeBinary, MetaData, String, Table, and_, delete, insert, or_, select
+
+from embeddings import normalize_text
+from kb_manifest import MANIFEST_BATCH_SIZE, get_manifest
+
+DEDUP_ENABLED = os.environ.get('DEDUP_ENABLED', 'true').lower() == 'true'
+# skip: drop the duplicate; replace: re-ingest it under the existing document_id (newest text wins)
+DEDUP_MODE = os.environ.get('DEDUP_MODE', 'skip')
+DEDUP_MIN_SIMILARITY = float(os.environ.get('DEDUP_MIN_SIMILARITY', '0.8'))
+DEDUP_SHINGLE_WORDS = int(os.environ.get('DEDUP_SHINGLE_WORDS', '3'))
+
+NUM_PERM = 128
+DEDUP_BANDS = 32  # 4 rows per band: documents at Jaccard 0.8 become candidates with >99.9% probability
+ROWS_PER_BAND = NUM_PERM // DEDUP_BANDS
+
+metadata = MetaData()
+
+kb_signatures = Table(
+    'kb_signatures', metadata,
+    Column('document_id', String, primary_key=True),
+    Column('content_hash', String, nullable=False, index=True),
+    Column('chunk_count', Integer, nullable=False),
+    Column('minhash', LargeBinary, nullable=False),
+)
+
+kb_signature_bands = Table(
+    'kb_signature_bands', metadata,
+    Column('document_id', String, primary_key=True),
+    Column('band', Integer, primary_key=True),
+    Column('bucket', BigInteger, nullable=False),
+    Index('kb_signature_bands_bucket', 'band', 'bucket'),
+)
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def _permutations(count: int):
+    """Fixed (a, b) pairs for the universal hashes (a*x + b) mod p; stable across processes"""
+    params = []
+    for i in range(count):
+        digest = hashlib.blake2b(f"minhash-{i}".encode(), digest_size=16).digest()
+        a = int.from_bytes(digest[:8], 'big') % (_MERSENNE_PRIME - 1) + 1
+        b = int.from_bytes(digest[8:], 'big') % _MERSENNE_PRIME
+        params.append((a, b))
+    return params
+
+
+_PERMUTATIONS = _permutations(NUM_PERM)
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(normalize_text(text).encode('utf-8')).hexdigest()
+
+
+def shingles(text: str, shingle_words: int = DEDUP_SHINGLE_WORDS) -> set:
+    words = normalize_text(text).split()
+    if len(words) <= shingle_words:
+        return {" ".join(words)}
+    return {" ".join(words[i:i + shingle_words]) for i in range(len(words) - shingle_words + 1)}
+
+
+def minhash(text: str) -> List[int]:
+    hashes = [
+        int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=4).digest(), 'big')
+        for shingle in shingles(text)
+    ]
+    return [
+        min((a * h + b) % _MERSENNE_PRIME & _MAX_HASH for h in hashes)
+        for a, b in _PERMUTATIONS
+    ]
+
+
+def similarity(signature: List[int], other: List[int]) -> float:
+    """Estimated Jaccard similarity of two MinHash signatures"""
+    return sum(1 for x, y in zip(signature, other) if x == y) / len(signature)
+
+
+def _band_hashes(signature: List[int]) -> List[int]:
+    bands = []
+    for i in range(DEDUP_BANDS):
+        rows = array('I', signature[i * ROWS_PER_BAND:(i + 1) * ROWS_PER_BAND]).tobytes()
+        # Signed, to fit a BIGINT column
+        bands.append(int.from_bytes(hashlib.blake2b(rows, digest_size=8).digest(), 'big', signed=True))
+    return bands
+
+
+class SignatureIndex:
+    """Document signatures and their LSH band buckets, in the manifest database."""
+
+    def __init__(self, engine=None, min_similarity: float = DEDUP_MIN_SIMILARITY):
+        self.min_similarity = min_similarity
+        self._engine = engine
+        self._lock = threading.Lock()
+        self._created = False
+
+    @property
+    def engine(self):
+        with self._lock:
+            if self._engine is None:
+                self._engine = get_manifest().engine
+            if not self._created:
+                metadata.create_all(self._engine)
+                self._created = True
+            return self._engine
+
+    def find_duplicate(self, text: str) -> Optional[Dict]:
+        """
+        Returns:
+            {"document_id", "chunk_count", "match": "exact"|"near", "similarity"} for the
+            most similar stored document, or None.
+        """
+        digest = content_hash(text)
+        with self.engine.connect() as conn:
+            row = conn.execute(
+                select(kb_signatures.c.document_id, kb_signatures.c.chunk_count)
+                .where(kb_signatures.c.content_hash == digest)
+                .limit(1)
+            ).first()
+            if row:
+                return {"document_id": row[0], "chunk_count": row[1], "match": "exact", "similarity": 1.0}
+            if self.min_similarity > 1:
+                return None
+            signature = minhash(text)
+            candidates = select(kb_signature_bands.c.document_id).where(or_(*(
+                and_(kb_signature_bands.c.band == band, kb_signature_bands.c.bucket == bucket)
+                for band, bucket in enumerate(_band_hashes(signature))
+            )))
+            rows = conn.execute(
+                select(kb_signatures.c.document_id, kb_signatures.c.chunk_count, kb_signatures.c.minhash)
+                .where(kb_signatures.c.document_id.in_(candidates))
+            ).all()
+        best = None
+        for document_id, chunk_count, blob in rows:
+            score = similarity(signature, array('I', bytes(blob)).tolist())
+            if score >= self.min_similarity and (best is None or score > best["similarity"]):
+                best = {"document_id": document_id, "chunk_count": chunk_count, "match": "near", "similarity": score}
+        return best
+
+    def add(self, document_id: str, text: str, chunk_count: int):
+        signature = minhash(text)
+        with self.engine.begin() as conn:
+            self._delete(conn, [document_id])
+            conn.execute(insert(kb_signatures), {
+                'document_id': document_id,
+                'content_hash': content_hash(text),
+                'chunk_count': chunk_count,
+                'minhash': array('I', signature).tobytes(),
+            })
+            conn.execute(insert(kb_signature_bands), [
+                {'document_id': document_id, 'band': band, 'bucket': bucket}
+                for band, bucket in enumerate(_band_hashes(signature))
+            ])
+
+    def remove(self, document_ids: List[str]):
+        """Forget deleted documents so they can be ingested again"""
+        with self.engine.begin() as conn:
+            self._delete(conn, list(document_ids))
+
+    @staticmethod
+    def _delete(conn, document_ids: List[str]):
+        for start in range(0, len(document_ids), MANIFEST_BATCH_SIZE):
+            batch = document_ids[start:start + MANIFEST_BATCH_SIZE]
+            conn.execute(delete(kb_signature_bands).where(kb_signature_bands.c.document_id.in_(batch)))
+            conn.execute(delete(kb_signatures).where(kb_signatures.c.document_id.in_(batch)))
+
+
+_signature_index: Optional[SignatureIndex] = None
+
+
+def get_signature_index() -> SignatureIndex:
+    global _signature_index
+    if _signature_index is None:
+        _signature_index = SignatureIndex()
+    return _signature_index
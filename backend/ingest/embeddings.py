@@ -0,0 +1,184 @@
+"""
+Embeddings from the SageMaker endpoint, with an LRU + on-disk cache.
+
+Shared by ingest (ingest_s3vectors), search (search_s3vectors) and the
+knowledge base MCP server. Entries are keyed by the normalized text and the
+embedding model id, so repeated queries ("top catchers 2025" from several
+agents, picks and drafts) skip the SageMaker round trip entirely and a model
+change never serves stale vectors.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import unicodedata
+from array import array
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import boto3
+
+SAGEMAKER_ENDPOINT = os.environ.get('SAGEMAKER_ENDPOINT', 'mlbdraftoracle-embedding-endpoint')
+# Identifies the model behind the endpoint; change it when the endpoint's model changes
+EMBEDDING_MODEL_ID = os.environ.get('EMBEDDING_MODEL_ID', SAGEMAKER_ENDPOINT)
+EMBEDDING_CACHE_SIZE = int(os.environ.get('EMBEDDING_CACHE_SIZE', '2048'))
+# Empty disables the on-disk layer (in-memory LRU only)
+EMBEDDING_CACHE_PATH = os.environ.get(
+    'EMBEDDING_CACHE_PATH',
+    os.path.join(tempfile.gettempdir(), 'mlbdraftoracle', 'embedding_cache.sqlite3')
+)
+
+_sagemaker_runtime = None
+
+
+def _get_sagemaker_runtime():
+    global _sagemaker_runtime
+    if _sagemaker_runtime is None:
+        _sagemaker_runtime = boto3.client('sagemaker-runtime')
+    return _sagemaker_runtime
+
+
+def normalize_text(text: str) -> str:
+    """Cache key text: Unicode-normalized, case- and whitespace-insensitive"""
+    return " ".join(unicodedata.normalize('NFKC', text).casefold().split())
+
+
+def _unwrap_embedding(result):
+    """HuggingFace returns nested arrays ([[[embedding]]] or [[embedding]]); extract the actual embedding"""
+    while isinstance(result, list) and result and isinstance(result[0], list):
+        result = result[0]
+    return result
+
+
+class EmbeddingCache:
+    """Thread-safe in-memory LRU in front of an optional SQLite file of float32 vectors."""
+
+    def __init__(self, maxsize: int = EMBEDDING_CACHE_SIZE, path: Optional[str] = EMBEDDING_CACHE_PATH):
+        self.maxsize = maxsize
+        self.path = path or None
+        self._memory: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(text: str, model_id: str = EMBEDDING_MODEL_ID) -> str:
+        return hashlib.sha256(f"{model_id}\0{normalize_text(text)}".encode('utf-8')).hexdigest()
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._db is None and self.path:
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                self._db = sqlite3.connect(self.path, check_same_thread=False)
+                self._db.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)")
+                self._db.commit()
+            except sqlite3.Error as e:
+                print(f"Embedding cache: disk layer disabled ({e})")
+                self.path = None
+                self._db = None
+        return self._db
+
+    def _remember(self, key: str, vector: List[float]):
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        found = {}
+        with self._lock:
+            missing = []
+            for key in keys:
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    found[key] = vector
+                else:
+                    missing.append(key)
+            db = self._connect() if missing else None
+            if db is not None:
+                for start in range(0, len(missing), 500):
+                    batch = missing[start:start + 500]
+                    rows = db.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(batch))})", batch
+                    ).fetchall()
+                    for key, blob in rows:
+                        vector = array('f', blob).tolist()
+                        self._remember(key, vector)
+                        found[key] = vector
+            self.hits += len(found)
+            self.misses += len(set(keys) - set(found))
+        return found
+
+    def set_many(self, vectors: Dict[str, List[float]]):
+        with self._lock:
+            for key, vector in vectors.items():
+                self._remember(key, vector)
+            db = self._connect()
+            if db is not None:
+                db.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    [(key, array('f', vector).tobytes()) for key, vector in vectors.items()]
+                )
+                db.commit()
+
+
+embedding_cache = EmbeddingCache()
+
+
+def _invoke_endpoint(inputs) -> object:
+    response = _get_sagemaker_runtime().invoke_endpoint(
+        EndpointName=SAGEMAKER_ENDPOINT,
+        ContentType='application/json',
+        Body=json.dumps({'inputs': inputs})
+    )
+    return json.loads(response['Body'].read().decode())
+
+
+def _embed_uncached(texts: List[str]) -> List[List[float]]:
+    if len(texts) == 1:
+        return [_unwrap_embedding(_invoke_endpoint(texts[0]))]
+    result = _invoke_endpoint(texts)
+    if isinstance(result, list) and len(result) == 1 and isinstance(result[0], list) and len(result[0]) == len(texts):
+        result = result[0]  # Batch wrapped in an extra list
+    if not isinstance(result, list) or len(result) != len(texts):
+        raise ValueError(f"Embedding endpoint returned {len(result) if isinstance(result, list) else 'no'} results for {len(texts)} inputs")
+    return [_unwrap_embedding(item) for item in result]
+
+
+def get_embeddings(texts: List[str]) -> List[List[float]]:
+    """
+    Embed several texts; cache misses go to SageMaker in one batched request.
+
+    Returns:
+        One embedding per input text, in order.
+    """
+    keys = [EmbeddingCache.key(text) for text in texts]
+    found = embedding_cache.get_many(keys)
+
+    # Embed each distinct missing text once
+    missing = {}
+    for key, text in zip(keys, texts):
+        if key not in found and key not in missing:
+            missing[key] = text
+    if missing:
+        vectors = _embed_uncached(list(missing.values()))
+        computed = dict(zip(missing.keys(), vectors))
+        embedding_cache.set_many(computed)
+        found.update(computed)
+
+    return [found[key] for key in keys]
+
+
+def get_embedding(text: str) -> List[float]:
+    """
+    Get embedding vector for one text (cached).
+
+    Returns:
+        List of floats representing the embedding vector
+    """
+    return get_embeddings([text])[0]
@@ -0,0 +1,222 @@
+"""
+Player entity linking for knowledge base chunks.
+
+At ingest each chunk is matched against the player pools' name
+index: every full player name that appears in the text (accent-folded, so
+"Acuna" finds Ronald Acuña Jr.) tags the chunk with that player's MLB id.
+The ids go into the chunk's `player_ids` metadata and into a player -> chunk
+table next to the key manifest (see kb_manifest.py), so "everything we know
+about player X" is an indexed lookup plus get_vectors, with no embedding call.
+
+The name index comes from PLAYER_INDEX_PATH (a JSON list of {"id", "name"}
+or a saved player pool) when set, else the union of every `player_pool` row
+in the manifest database (the app's Postgres when it shares DB_URL). Pool
+ids are uuid4 strings with no creation order, and player ids are MLB ids
+shared across pools, so merging them never links a chunk to the wrong player.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+import unicodedata
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import Column, Index, Integer, MetaData, String, Table, delete, insert, select
+
+from kb_manifest import MANIFEST_BATCH_SIZE, get_manifest, kb_vectors, unique_by_key
+
+PLAYER_INDEX_PATH = os.environ.get('PLAYER_INDEX_PATH')
+PLAYER_INDEX_TTL_SECONDS = float(os.environ.get('PLAYER_INDEX_TTL_SECONDS', '3600'))
+
+# Dropped from player names so "Bobby Witt Jr." also matches "Bobby Witt"
+NAME_SUFFIXES = frozenset({'jr', 'sr', 'ii', 'iii', 'iv'})
+
+metadata = MetaData()
+
+kb_player_chunks = Table(
+    'kb_player_chunks', metadata,
+    Column('player_id', Integer, primary_key=True),
+    Column('key', String, primary_key=True),
+    Index('kb_player_chunks_key', 'key'),
+)
+
+# The app's player pools (backend/data/postgresql/models.py); read-only here
+player_pool_table = Table(
+    'player_pool', MetaData(),
+    Column('id', String, primary_key=True),
+    Column('data'),  # JSONB holding the pool as a JSON string (or object)
+)
+
+
+def name_tokens(text: str) -> List[str]:
+    """Lowercase, accent-folded word tokens"""
+    folded = unicodedata.normalize('NFKD', text.casefold())
+    folded = "".join(c for c in folded if not unicodedata.combining(c))
+    return re.findall(r"[a-z0-9]+", folded)
+
+
+class PlayerNameIndex:
+    """Full player names (as token tuples) -> MLB player ids."""
+
+    def __init__(self, players: List[Dict[str, Any]]):
+        self.names: Dict[Tuple[str, ...], Set[int]] = {}
+        self.players: Dict[int, str] = {}
+        for player in players:
+            tokens = tuple(token for token in name_tokens(player.get('name', '')) if token not in NAME_SUFFIXES)
+            # Single-token names ("Ohtani" alone) would match too much prose
+            if len(tokens) < 2 or player.get('id') is None:
+                continue
+            player_id = int(player['id'])
+            self.names.setdefault(tokens, set()).add(player_id)
+            self.players[player_id] = player['name']
+        self.lengths = sorted({len(tokens) for tokens in self.names}, reverse=True)
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def find(self, text: str) -> List[int]:
+        """Ids of every player whose full name appears in the text, in order of first mention"""
+        tokens = name_tokens(text)
+        found: List[int] = []
+        for start in range(len(tokens)):
+            for length in self.lengths:
+                ids = self.names.get(tuple(tokens[start:start + length]))
+                if ids:
+                    found.extend(sorted(player_id for player_id in ids if player_id not in found))
+                    break
+        return found
+
+    def lookup(self, name: str) -> List[int]:
+        """Ids for a player name as an agent might type it"""
+        tokens = tuple(token for token in name_tokens(name) if token not in NAME_SUFFIXES)
+        return sorted(self.names.get(tokens, ()))
+
+
+def _players_from_pool(data: Any) -> List[Dict[str, Any]]:
+    """Players from a saved player pool ({"players": [...]}, possibly JSON-encoded) or a plain list"""
+    if isinstance(data, str):
+        data = json.loads(data)
+    if isinstance(data, dict):
+        data = data.get('players', [])
+    return [player for player in data or [] if isinstance(player, dict)]
+
+
+def load_players() -> List[Dict[str, Any]]:
+    """Players from PLAYER_INDEX_PATH, else every saved player pool (one entry per player id)"""
+    if PLAYER_INDEX_PATH:
+        with open(PLAYER_INDEX_PATH) as f:
+            return _players_from_pool(json.load(f))
+    players: Dict[Any, Dict[str, Any]] = {}
+    with get_manifest().engine.connect() as conn:
+        for data in conn.execute(select(player_pool_table.c.data)).scalars():
+            for player in _players_from_pool(data):
+                players.setdefault(player.get('id'), player)
+    return list(players.values())
+
+
+_name_index: Optional[PlayerNameIndex] = None
+_name_index_loaded_at = 0.0
+_name_index_lock = threading.Lock()
+
+
+def get_player_name_index() -> PlayerNameIndex:
+    """The player pools' name index, reloaded every PLAYER_INDEX_TTL_SECONDS"""
+    global _name_index, _name_index_loaded_at
+    with _name_index_lock:
+        if _name_index is None or time.monotonic() - _name_index_loaded_at > PLAYER_INDEX_TTL_SECONDS:
+            try:
+                _name_index = PlayerNameIndex(load_players())
+                print(f"Player name index loaded ({len(_name_index)} players)")
+            except Exception as e:
+                print(f"Warning: player name index unavailable, chunks won't be linked to players: {e}")
+                _name_index = _name_index or PlayerNameIndex([])
+            _name_index_loaded_at = time.monotonic()
+        return _name_index
+
+
+class PlayerChunkIndex:
+    """Player id -> chunk keys, in the manifest database."""
+
+    def __init__(self, engine=None):
+        self._engine = engine
+        self._lock = threading.Lock()
+        self._created = False
+
+    @property
+    def engine(self):
+        with self._lock:
+            if self._engine is None:
+                self._engine = get_manifest().engine
+            if not self._created:
+                metadata.create_all(self._engine)
+                self._created = True
+            return self._engine
+
+    def add(self, vectors: List[Dict[str, Any]]):
+        """Record stored vectors' links: [{"key", "metadata": {"player_ids"?}}, ...]"""
+        vectors = unique_by_key(vectors)
+        keys = [vector['key'] for vector in vectors]
+        rows = [
+            {'player_id': player_id, 'key': vector['key']}
+            for vector in vectors
+            for player_id in dict.fromkeys(vector['metadata'].get('player_ids', []))
+        ]
+        with self.engine.begin() as conn:
+            self._delete(conn, keys)
+            for start in range(0, len(rows), MANIFEST_BATCH_SIZE):
+                conn.execute(insert(kb_player_chunks), rows[start:start + MANIFEST_BATCH_SIZE])
+
+    def remove(self, keys: List[str]):
+        with self.engine.begin() as conn:
+            self._delete(conn, list(keys))
+
+    @staticmethod
+    def _delete(conn, keys: List[str]):
+        for start in range(0, len(keys), MANIFEST_BATCH_SIZE):
+            conn.execute(delete(kb_player_chunks).where(kb_player_chunks.c.key.in_(keys[start:start + MANIFEST_BATCH_SIZE])))
+
+    def keys(self, player_ids: List[int], limit: Optional[int] = None) -> List[str]:
+        """Chunk keys mentioning any of the players, most recently ingested first"""
+        query = (
+            select(kb_player_chunks.c.key)
+            .join(kb_vectors, kb_vectors.c.key == kb_player_chunks.c.key, isouter=True)
+            .where(kb_player_chunks.c.player_id.in_(player_ids))
+            .group_by(kb_player_chunks.c.key, kb_vectors.c.ingested_at)
+            .order_by(kb_vectors.c.ingested_at.desc().nullslast(), kb_player_chunks.c.key)
+        )
+        if limit:
+            query = query.limit(limit)
+        with self.engine.connect() as conn:
+            return list(conn.execute(query).scalars())
+
+
+def link_players(vectors: List[Dict[str, Any]]) -> int:
+    """
+    Tag vector records with the ids of the players their text mentions
+    (metadata "player_ids"), in place.
+
+    Returns:
+        Number of records linked to at least one player.
+    """
+    name_index = get_player_name_index()
+    if not len(name_index):
+        return 0
+    linked = 0
+    for vector in vectors:
+        player_ids = name_index.find(vector['metadata'].get('text', ''))
+        if player_ids:
+            vector['metadata']['player_ids'] = player_ids
+            linked += 1
+    return linked
+
+
+_player_chunk_index: Optional[PlayerChunkIndex] = None
+
+
+def get_player_chunk_index() -> PlayerChunkIndex:
+    global _player_chunk_index
+    if _player_chunk_index is None:
+        _player_chunk_index = PlayerChunkIndex()
+    return _player_chunk_index
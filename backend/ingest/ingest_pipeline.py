@@ -0,0 +1,239 @@
+"""
+Batched, chunked ingestion into the knowledge base.
+
+Long analyses are split into overlapping word windows so each vector covers
+one focused passage (a search for "closer depth" matches the paragraph about
+closers rather than a whole team preview). Chunks from every document in a
+request are embedded in batches of EMBED_BATCH_SIZE and written with bulk
+put_vectors calls instead of one embedding and one write per document.
+Exact and near-duplicate documents are suppressed first (see dedup.py), and
+every stored key is recorded in the key manifest (see kb_manifest.py) so
+deletes and retention expiry work from known keys. Chunk text is also added
+to the BM25 index used for hybrid search (see lexical_index.py), and chunks
+are linked to the players they mention (see entity_linking.py).
+"""
+
+import datetime
+import os
+import uuid
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import create_engine
+
+from dedup import DEDUP_ENABLED, DEDUP_MODE, SignatureIndex, get_signature_index
+from embeddings import get_embeddings
+from entity_linking import get_player_chunk_index, link_players
+from kb_manifest import get_manifest, unique_by_key
+from lexical_index import get_lexical_index
+from vector_store import S3_VECTORS_BATCH_SIZE, get_vector_store
+
+INGEST_CHUNK_WORDS = int(os.environ.get('INGEST_CHUNK_WORDS', '200'))
+INGEST_CHUNK_OVERLAP_WORDS = int(os.environ.get('INGEST_CHUNK_OVERLAP_WORDS', '40'))
+EMBED_BATCH_SIZE = int(os.environ.get('EMBED_BATCH_SIZE', '32'))
+MAX_INGEST_DOCUMENTS = int(os.environ.get('MAX_INGEST_DOCUMENTS', '100'))
+# Default retention for expire_vectors(); unset keeps vectors forever
+KB_RETENTION_DAYS = os.environ.get('KB_RETENTION_DAYS')
+
+
+def chunk_text(text: str, chunk_words: int = INGEST_CHUNK_WORDS, overlap_words: int = INGEST_CHUNK_OVERLAP_WORDS) -> List[str]:
+    """
+    Split text into windows of `chunk_words` words, each repeating the last
+    `overlap_words` words of the previous one so no passage is cut in half.
+    Texts no longer than one window come back as a single chunk.
+    """
+    words = text.split()
+    if len(words) <= chunk_words:
+        return [" ".join(words)] if words else []
+    step = max(1, chunk_words - overlap_words)
+    chunks = []
+    for start in range(0, len(words), step):
+        chunks.append(" ".join(words[start:start + chunk_words]))
+        if start + chunk_words >= len(words):
+            break
+    return chunks
+
+
+def timestamp_epoch(value: Any) -> Optional[float]:
+    """
+    Seconds since the epoch for an ISO-8601 timestamp (naive means UTC), or None.
+    Stored as timestamp_epoch so searches can filter date windows numerically.
+    """
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        parsed = datetime.datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed.timestamp()
+
+
+def build_chunks(document: Dict[str, Any], timestamp: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Chunk one document ({"text", "metadata"?, "document_id"?}) into vector
+    records without embeddings. Keys are "<document_id>-<chunk_index>".
+    """
+    document_id = document.get('document_id') or str(uuid.uuid4())
+    metadata = document.get('metadata') or {}
+    timestamp = timestamp or datetime.datetime.utcnow().isoformat()
+    chunks = chunk_text(document['text'])
+    epoch = timestamp_epoch(metadata.get('timestamp', timestamp))
+    if epoch is None:
+        epoch = timestamp_epoch(timestamp)
+    return [
+        {
+            "key": f"{document_id}-{i}",
+            "metadata": {
+                "text": chunk,
+                "timestamp": timestamp,
+                "document_id": document_id,
+                "chunk_index": i,
+                "chunk_count": len(chunks),
+                **metadata,  # Include any additional metadata
+                "timestamp_epoch": epoch
+            }
+        }
+        for i, chunk in enumerate(chunks)
+    ]
+
+
+def ingest_documents(documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Chunk, embed and store documents, suppressing duplicates of documents
+    already in the knowledge base (or earlier in the same request).
+
+    Args:
+        documents: [{"text": ..., "metadata": {...}, "document_id": optional}, ...]
+
+    Returns:
+        One {"document_id", "chunks"} summary per document, in order; duplicates
+        also carry "duplicate_of" and "match" ("exact" or "near").
+    """
+    timestamp = datetime.datetime.utcnow().isoformat()
+    signatures = get_signature_index() if DEDUP_ENABLED else None
+    # Catches duplicates within this request without registering anything before it is stored
+    batch_signatures = SignatureIndex(create_engine('sqlite://')) if DEDUP_ENABLED else None
+    summaries = []
+    # By document id, so a later document under the same id (given, or merged into it in
+    # replace mode) overwrites the earlier one's pending chunks instead of repeating its keys
+    chunks_by_document = {}
+    accepted = {}
+    stored_chunk_counts = {}
+    for document in documents:
+        duplicate, stored = None, False
+        if signatures is not None:
+            duplicate = batch_signatures.find_duplicate(document['text'])
+            if duplicate is None:
+                duplicate = signatures.find_duplicate(document['text'])
+                stored = duplicate is not None
+        if duplicate and DEDUP_MODE != 'replace':
+            summaries.append({
+                "document_id": duplicate["document_id"],
+                "chunks": 0,
+                "duplicate_of": duplicate["document_id"],
+                "match": duplicate["match"]
+            })
+            continue
+        if duplicate:
+            # Merge: overwrite the existing document's chunks with the newer text
+            document = {**document, "document_id": duplicate["document_id"]}
+        chunks = build_chunks(document, timestamp)
+        if not chunks:
+            summaries.append({"document_id": document.get('document_id'), "chunks": 0})
+            continue
+        document_id = chunks[0]["metadata"]["document_id"]
+        summary = {"document_id": document_id, "chunks": len(chunks)}
+        if duplicate:
+            summary.update(duplicate_of=duplicate["document_id"], match=duplicate["match"])
+            if stored:
+                stored_chunk_counts[document_id] = duplicate["chunk_count"]
+        if batch_signatures is not None:
+            batch_signatures.add(document_id, document['text'], len(chunks))
+        summaries.append(summary)
+        chunks_by_document.pop(document_id, None)
+        chunks_by_document[document_id] = chunks
+        accepted.pop(document_id, None)
+        accepted[document_id] = (document['text'], len(chunks))
+
+    records = unique_by_key([chunk for chunks in chunks_by_document.values() for chunk in chunks])
+    # Stored chunks past the end of a replacement's text
+    stale_keys = [
+        f"{document_id}-{i}"
+        for document_id, chunk_count in stored_chunk_counts.items()
+        for i in range(len(chunks_by_document[document_id]), chunk_count)
+    ]
+
+    linked = link_players(records)
+    store = get_vector_store()
+    manifest = get_manifest()
+    lexical_index = get_lexical_index()
+    player_chunks = get_player_chunk_index()
+    pending = []
+    for start in range(0, len(records), EMBED_BATCH_SIZE):
+        batch = records[start:start + EMBED_BATCH_SIZE]
+        embeddings = get_embeddings([record["metadata"]["text"] for record in batch])
+        for record, embedding in zip(batch, embeddings):
+            pending.append({**record, "data": {"float32": embedding}})
+        if len(pending) >= S3_VECTORS_BATCH_SIZE:
+            store.put_vectors(pending)
+            manifest.add(pending)
+            lexical_index.add(pending)
+            player_chunks.add(pending)
+            pending = []
+    if pending:
+        store.put_vectors(pending)
+        manifest.add(pending)
+        lexical_index.add(pending)
+        player_chunks.add(pending)
+    if stale_keys:
+        store.delete_vectors(stale_keys)
+        manifest.remove(stale_keys)
+        lexical_index.remove(stale_keys)
+        player_chunks.remove(stale_keys)
+
+    # Register signatures only once the vectors are stored
+    if signatures is not None:
+        for document_id, (text, chunk_count) in accepted.items():
+            signatures.add(document_id, text, chunk_count)
+
+    skipped = len(documents) - len(accepted)
+    print(f"Ingested {len(accepted)} documents as {len(records)} chunks ({skipped} duplicates or empty skipped, {linked} chunks linked to players)")
+    return summaries
+
+
+def delete_vectors(keys: List[str]) -> int:
+    """
+    Delete vectors by key from the store, the manifest, the BM25 index and the
+    player links; documents left without vectors are dropped from the
+    duplicate index.
+
+    Returns:
+        Number of keys deleted.
+    """
+    keys = list(keys)
+    if not keys:
+        return 0
+    get_vector_store().delete_vectors(keys)
+    removed_documents = get_manifest().remove(keys)
+    get_lexical_index().remove(keys)
+    get_player_chunk_index().remove(keys)
+    if DEDUP_ENABLED and removed_documents:
+        get_signature_index().remove(sorted(removed_documents))
+    print(f"Deleted {len(keys)} vectors ({len(removed_documents)} documents removed)")
+    return len(keys)
+
+
+def expire_vectors(retention_days: Optional[float] = None, topic: Optional[str] = None) -> int:
+    """
+    Delete vectors ingested more than `retention_days` (default KB_RETENTION_DAYS) ago.
+
+    Returns:
+        Number of keys deleted (0 when no retention is configured).
+    """
+    if retention_days is None:
+        if not KB_RETENTION_DAYS:
+            return 0
+        retention_days = float(KB_RETENTION_DAYS)
+    cutoff = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=retention_days)
+    return delete_vectors(get_manifest().keys(older_than=cutoff, topic=topic))
@@ -4,42 +4,18 @@ Lambda function for ingesting text into S3 Vectors with embeddings.
 
 import json
 import os
-import boto3
-import datetime
-import uuid
+from ingest_pipeline import ingest_documents, delete_vectors, expire_vectors, MAX_INGEST_DOCUMENTS
+from kb_manifest import get_manifest
+from vector_store import VECTOR_STORE, VECTOR_BUCKET, INDEX_NAME
 
 # Environment variables
-VECTOR_BUCKET = os.environ.get('VECTOR_BUCKET', 'mlbdraftoracle-vectors')
 SAGEMAKER_ENDPOINT = os.environ.get('SAGEMAKER_ENDPOINT')
-INDEX_NAME = os.environ.get('INDEX_NAME', 'draft-research')
-
-# Initialize AWS clients
-sagemaker_runtime = boto3.client('sagemaker-runtime')
-s3_vectors = boto3.client('s3vectors')
-
-
-def get_embedding(text):
-    """Get embedding vector from SageMaker endpoint."""
-    response = sagemaker_runtime.invoke_endpoint(
-        EndpointName=SAGEMAKER_ENDPOINT,
-        ContentType='application/json',
-        Body=json.dumps({'inputs': text})
-    )
-    
-    result = json.loads(response['Body'].read().decode())
-    # HuggingFace returns nested array [[[embedding]]], extract the actual embedding
-    if isinstance(result, list) and len(result) > 0:
-        if isinstance(result[0], list) and len(result[0]) > 0:
-            if isinstance(result[0][0], list):
-                return result[0][0]  # Extract from [[[embedding]]]
-            return result[0]  # Extract from [[embedding]]
-    return result  # Return as-is if not nested
 
 
 def lambda_handler(event, context):
     """
     Main Lambda handler.
-    Expects JSON body with:
+    Expects JSON body with either a single document:
     {
         "text": "Text to ingest",
         "metadata": {
@@ -47,56 +23,91 @@ def lambda_handler(event, context):
             "category": "optional category"
         }
     }
+    or a batch:
+    {
+        "documents": [
+            {"text": "...", "metadata": {...}, "document_id": "optional id"},
+            ...
+        ]
+    }
+    Long texts are split into overlapping chunks, one vector per chunk.
+
+    Direct invocations (e.g. a scheduled rule, not API Gateway) can also run
+    maintenance over the key manifest:
+    {"action": "expire", "retention_days": 30, "topic": "optional topic"}
+    {"action": "delete", "document_id": "..."}
     """
     try:
+        if event.get('action'):
+            return maintenance_handler(event)
+        
         # Parse the request body
         if isinstance(event.get('body'), str):
             body = json.loads(event['body'])
         else:
             body = event.get('body', {})
         
-        text = body.get('text')
-        metadata = body.get('metadata', {})
+        documents = body.get('documents')
+        single = documents is None
+        if single:
+            documents = [{'text': body.get('text'), 'metadata': body.get('metadata', {})}]
         
-        if not text:
+        if not isinstance(documents, list) or not documents:
+            return {
+                'statusCode': 400,
+                'body': json.dumps({'error': 'documents must be a non-empty list'})
+            }
+        if len(documents) > MAX_INGEST_DOCUMENTS:
+            return {
+                'statusCode': 400,
+                'body': json.dumps({'error': f'At most {MAX_INGEST_DOCUMENTS} documents per request'})
+            }
+        if any(not isinstance(doc, dict) or not doc.get('text') for doc in documents):
             return {
                 'statusCode': 400,
                 'body': json.dumps({'error': 'Missing required field: text'})
             }
         
-        # Get embedding from SageMaker
-        print(f"Getting embedding for text: {text[:100]}...")
-        embedding = get_embedding(text)
-        
-        # Generate unique ID for the vector
-        vector_id = str(uuid.uuid4())
-        
-        # Store in S3 Vectors
-        print(f"Storing vector in bucket: {VECTOR_BUCKET}, index: {INDEX_NAME}")
-        s3_vectors.put_vectors(
-            vectorBucketName=VECTOR_BUCKET,
-            indexName=INDEX_NAME,
-            vectors=[{
-                "key": vector_id,
-                "data": {"float32": embedding},
-                "metadata": {
-                    "text": text,
-                    "timestamp": datetime.datetime.utcnow().isoformat(),
-                    **metadata  # Include any additional metadata
-                }
-            }]
-        )
+        # Chunk, embed in batches and store in bulk (S3 Vectors, or local with VECTOR_STORE=local)
+        print(f"Ingesting {len(documents)} documents into {VECTOR_STORE} store, bucket: {VECTOR_BUCKET}, index: {INDEX_NAME}")
+        summaries = ingest_documents(documents)
         
+        if single:
+            skipped = 'duplicate_of' in summaries[0] and not summaries[0]['chunks']
+            response_body = {
+                'message': 'Duplicate document skipped' if skipped else 'Document indexed successfully',
+                **summaries[0]
+            }
+        else:
+            response_body = {
+                'message': f"{sum(1 for summary in summaries if summary['chunks'])} of {len(summaries)} documents indexed",
+                'documents': summaries
+            }
         return {
             'statusCode': 200,
-            'body': json.dumps({
-                'message': 'Document indexed successfully',
-                'document_id': vector_id
-            })
+            'body': json.dumps(response_body)
         }
     except Exception as e:
         print(f"Error: {str(e)}")
         return {
             'statusCode': 500,
             'body': json.dumps({'error': str(e)})
-        }
\ No newline at end of file
+        }
+
+
+def maintenance_handler(event):
+    """Expire or delete vectors by key from the manifest (direct invocation only)"""
+    action = event['action']
+    if action == 'expire':
+        deleted = expire_vectors(event.get('retention_days'), topic=event.get('topic'))
+    elif action == 'delete' and event.get('document_id'):
+        deleted = delete_vectors(get_manifest().keys(document_id=event['document_id']))
+    else:
+        return {
+            'statusCode': 400,
+            'body': json.dumps({'error': f'Unknown action: {action}'})
+        }
+    return {
+        'statusCode': 200,
+        'body': json.dumps({'action': action, 'deleted': deleted})
+    }
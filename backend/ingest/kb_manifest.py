@@ -0,0 +1,151 @@
+"""
+Manifest of the vector keys stored in the knowledge base.
+
+S3 Vectors has no cheap "list everything" for cleanup, so ingest records each
+key it writes (with its document, topic and ingest time) in a small table.
+Cleanup, retention expiry and bulk deletes then select keys here and delete
+them in batches instead of rediscovering them through similarity queries.
+
+The table lives in KB_MANIFEST_URL (any SQLAlchemy URL), else the app's
+Postgres DB_URL, else a local SQLite file. In Lambda (DEPLOYMENT_ENVIRONMENT
+=LAMBDA) the SQLite fallback is refused: /tmp is per container and is lost
+on every cold start, so the manifest, BM25 index and player links would
+silently diverge from the vector store.
+"""
+
+import datetime
+import os
+import tempfile
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import Column, DateTime, Index, MetaData, String, Table, create_engine, delete, func, insert, select
+from sqlalchemy.pool import NullPool
+
+KB_MANIFEST_URL = os.environ.get('KB_MANIFEST_URL') or os.environ.get('DB_URL') or 'sqlite:///' + os.path.join(
+    tempfile.gettempdir(), 'mlbdraftoracle', 'kb_manifest.sqlite3'
+)
+IS_LAMBDA = os.environ.get('DEPLOYMENT_ENVIRONMENT') == 'LAMBDA'
+# Parameters per statement stay well under SQLite's and Postgres' limits
+MANIFEST_BATCH_SIZE = 500
+
+metadata = MetaData()
+
+kb_vectors = Table(
+    'kb_vectors', metadata,
+    Column('key', String, primary_key=True),
+    Column('document_id', String, nullable=False),
+    Column('topic', String),
+    Column('ingested_at', DateTime(timezone=True), nullable=False),
+    Index('kb_vectors_document_id', 'document_id'),
+    Index('kb_vectors_topic', 'topic'),
+    Index('kb_vectors_ingested_at', 'ingested_at'),
+)
+
+
+def _batches(items: List[Any], size: int = MANIFEST_BATCH_SIZE) -> Iterable[List[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def unique_by_key(vectors: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """One vector per key (the last one given wins), so a bulk insert can't hit the primary key twice"""
+    return list({vector['key']: vector for vector in vectors}.values())
+
+
+class KeyManifest:
+    """Vector keys by document, topic and ingest time."""
+
+    def __init__(self, url: str = KB_MANIFEST_URL):
+        self.url = url
+        self._engine = None
+        self._lock = threading.Lock()
+
+    @property
+    def engine(self):
+        with self._lock:
+            if self._engine is None:
+                if IS_LAMBDA and self.url.startswith('sqlite:'):
+                    message = (
+                        f"Refusing SQLite knowledge base manifest {self.url} in Lambda: "
+                        "set KB_MANIFEST_URL (or DB_URL) to the shared Postgres database"
+                    )
+                    print(f"ERROR: {message}")
+                    raise RuntimeError(message)
+                if self.url.startswith('sqlite:///'):
+                    os.makedirs(os.path.dirname(self.url[len('sqlite:///'):]) or '.', exist_ok=True)
+                    self._engine = create_engine(self.url)
+                else:
+                    # No connection pooling in Lambda
+                    self._engine = create_engine(self.url, poolclass=NullPool, pool_pre_ping=True)
+                metadata.create_all(self._engine)
+            return self._engine
+
+    def add(self, vectors: List[Dict[str, Any]], ingested_at: Optional[datetime.datetime] = None):
+        """Record (or re-record) stored vectors: [{"key", "metadata": {"document_id", "topic"?}}, ...]"""
+        ingested_at = ingested_at or datetime.datetime.now(datetime.timezone.utc)
+        rows = [
+            {
+                'key': vector['key'],
+                'document_id': vector['metadata'].get('document_id', vector['key']),
+                'topic': vector['metadata'].get('topic'),
+                'ingested_at': ingested_at,
+            }
+            for vector in unique_by_key(vectors)
+        ]
+        with self.engine.begin() as conn:
+            for batch in _batches(rows):
+                conn.execute(delete(kb_vectors).where(kb_vectors.c.key.in_([row['key'] for row in batch])))
+                conn.execute(insert(kb_vectors), batch)
+
+    def remove(self, keys: List[str]) -> Set[str]:
+        """
+        Forget keys.
+
+        Returns:
+            The document ids that no longer have any keys.
+        """
+        document_ids = set()
+        with self.engine.begin() as conn:
+            for batch in _batches(list(keys)):
+                document_ids.update(conn.execute(
+                    select(kb_vectors.c.document_id).where(kb_vectors.c.key.in_(batch)).distinct()
+                ).scalars())
+                conn.execute(delete(kb_vectors).where(kb_vectors.c.key.in_(batch)))
+            remaining = set()
+            for batch in _batches(list(document_ids)):
+                remaining.update(conn.execute(
+                    select(kb_vectors.c.document_id).where(kb_vectors.c.document_id.in_(batch)).distinct()
+                ).scalars())
+        return document_ids - remaining
+
+    def keys(
+        self,
+        older_than: Optional[datetime.datetime] = None,
+        topic: Optional[str] = None,
+        document_id: Optional[str] = None,
+    ) -> List[str]:
+        """Keys matching every given condition (all keys if none)"""
+        query = select(kb_vectors.c.key)
+        if older_than is not None:
+            query = query.where(kb_vectors.c.ingested_at < older_than)
+        if topic is not None:
+            query = query.where(kb_vectors.c.topic == topic)
+        if document_id is not None:
+            query = query.where(kb_vectors.c.document_id == document_id)
+        with self.engine.connect() as conn:
+            return list(conn.execute(query).scalars())
+
+    def count(self) -> int:
+        with self.engine.connect() as conn:
+            return conn.execute(select(func.count()).select_from(kb_vectors)).scalar_one()
+
+
+_manifest: Optional[KeyManifest] = None
+
+
+def get_manifest() -> KeyManifest:
+    global _manifest
+    if _manifest is None:
+        _manifest = KeyManifest()
+    return _manifest
@@ -0,0 +1,152 @@
+"""
+BM25 inverted index over knowledge base chunk text.
+
+Embedding search is weak on exact player names ("Acuña", "Witt Jr."), so
+ingest also records each chunk's term frequencies in the key manifest's
+database (see kb_manifest.py). search() scores chunks with Okapi BM25, and
+the knowledge base server fuses those hits with the vector hits by
+reciprocal-rank fusion (rrf_fuse).
+"""
+
+import math
+import re
+import threading
+import unicodedata
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, delete, func, insert, select
+
+from kb_manifest import MANIFEST_BATCH_SIZE, get_manifest, unique_by_key
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+RRF_K = 60
+
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have he his in is it its of on or that the their "
+    "this to was were will with".split()
+)
+
+metadata = MetaData()
+
+kb_terms = Table(
+    'kb_terms', metadata,
+    Column('term', String, primary_key=True),
+    Column('key', String, primary_key=True, index=True),
+    Column('tf', Integer, nullable=False),
+)
+
+kb_chunk_lengths = Table(
+    'kb_chunk_lengths', metadata,
+    Column('key', String, primary_key=True),
+    Column('length', Integer, nullable=False),
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens with accents folded ("Acuña" matches "acuna"), stopwords dropped"""
+    folded = unicodedata.normalize('NFKD', text.casefold())
+    folded = "".join(c for c in folded if not unicodedata.combining(c))
+    return [token for token in re.findall(r"[a-z0-9]+", folded) if token not in STOPWORDS]
+
+
+class LexicalIndex:
+    """Term postings and chunk lengths in the manifest database."""
+
+    def __init__(self, engine=None):
+        self._engine = engine
+        self._lock = threading.Lock()
+        self._created = False
+
+    @property
+    def engine(self):
+        with self._lock:
+            if self._engine is None:
+                self._engine = get_manifest().engine
+            if not self._created:
+                metadata.create_all(self._engine)
+                self._created = True
+            return self._engine
+
+    def add(self, vectors: List[Dict[str, Any]]):
+        """Index stored vectors' text: [{"key", "metadata": {"text"}}, ...]"""
+        vectors = unique_by_key(vectors)
+        keys = [vector['key'] for vector in vectors]
+        postings = []
+        lengths = []
+        for vector in vectors:
+            tokens = tokenize(vector['metadata'].get('text', ''))
+            lengths.append({'key': vector['key'], 'length': len(tokens)})
+            postings.extend({'term': term, 'key': vector['key'], 'tf': tf} for term, tf in Counter(tokens).items())
+        with self.engine.begin() as conn:
+            self._delete(conn, keys)
+            if lengths:
+                conn.execute(insert(kb_chunk_lengths), lengths)
+            for start in range(0, len(postings), MANIFEST_BATCH_SIZE):
+                conn.execute(insert(kb_terms), postings[start:start + MANIFEST_BATCH_SIZE])
+
+    def remove(self, keys: List[str]):
+        with self.engine.begin() as conn:
+            self._delete(conn, list(keys))
+
+    @staticmethod
+    def _delete(conn, keys: List[str]):
+        for start in range(0, len(keys), MANIFEST_BATCH_SIZE):
+            batch = keys[start:start + MANIFEST_BATCH_SIZE]
+            conn.execute(delete(kb_terms).where(kb_terms.c.key.in_(batch)))
+            conn.execute(delete(kb_chunk_lengths).where(kb_chunk_lengths.c.key.in_(batch)))
+
+    def search(self, query: str, top_k: int) -> List[Tuple[str, float]]:
+        """
+        Returns:
+            Up to top_k (key, bm25_score) pairs, best first; empty if no query term is indexed.
+        """
+        terms = sorted(set(tokenize(query)))
+        if not terms:
+            return []
+        with self.engine.connect() as conn:
+            chunk_count, average_length = conn.execute(
+                select(func.count(), func.avg(kb_chunk_lengths.c.length))
+            ).one()
+            if not chunk_count:
+                return []
+            rows = conn.execute(
+                select(kb_terms.c.term, kb_terms.c.key, kb_terms.c.tf, kb_chunk_lengths.c.length)
+                .join(kb_chunk_lengths, kb_chunk_lengths.c.key == kb_terms.c.key)
+                .where(kb_terms.c.term.in_(terms))
+            ).all()
+        document_frequency = Counter(term for term, _, _, _ in rows)
+        average_length = float(average_length or 1) or 1.0
+        scores: Dict[str, float] = {}
+        for term, key, tf, length in rows:
+            df = document_frequency[term]
+            idf = math.log(1 + (chunk_count - df + 0.5) / (df + 0.5))
+            norm = tf + BM25_K1 * (1 - BM25_B + BM25_B * length / average_length)
+            scores[key] = scores.get(key, 0.0) + idf * tf * (BM25_K1 + 1) / norm
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)[:top_k]
+
+
+def rrf_fuse(rankings: List[List[str]], k: int = RRF_K) -> List[Tuple[str, float]]:
+    """
+    Reciprocal-rank fusion: each key scores sum(1 / (k + rank)) over the
+    rankings it appears in, so agreement between retrievers wins.
+
+    Returns:
+        (key, score) pairs, best first.
+    """
+    scores: Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, key in enumerate(ranking, 1):
+            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+_lexical_index: Optional[LexicalIndex] = None
+
+
+def get_lexical_index() -> LexicalIndex:
+    global _lexical_index
+    if _lexical_index is None:
+        _lexical_index = LexicalIndex()
+    return _lexical_index
@@ -53,7 +53,9 @@ def create_deployment_package():
     # Copy Lambda function code
     print("Copying Lambda function code...")
     
-    # Copy S3 Vectors Lambda handlers
+    # Copy S3 Vectors Lambda handlers and the modules they import
+    for module in ['embeddings.py', 'vector_store.py', 'dedup.py', 'kb_manifest.py', 'lexical_index.py', 'entity_linking.py', 'ingest_pipeline.py']:
+        shutil.copy(current_dir / module, package_dir)
     if (current_dir / 'ingest_s3vectors.py').exists():
         shutil.copy(current_dir / 'ingest_s3vectors.py', package_dir)
     if (current_dir / 'search_s3vectors.py').exists():
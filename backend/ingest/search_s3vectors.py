@@ -4,34 +4,11 @@ Lambda function for searching S3 Vectors.
 
 import json
 import os
-import boto3
+from embeddings import get_embedding
+from vector_store import get_vector_store, VECTOR_STORE, VECTOR_BUCKET, INDEX_NAME
 
 # Environment variables
-VECTOR_BUCKET = os.environ.get('VECTOR_BUCKET', 'mlbdraftoracle-vectors')
 SAGEMAKER_ENDPOINT = os.environ.get('SAGEMAKER_ENDPOINT')
-INDEX_NAME = os.environ.get('INDEX_NAME', 'draft-research')
-
-# Initialize AWS clients
-sagemaker_runtime = boto3.client('sagemaker-runtime')
-s3_vectors = boto3.client('s3vectors')
-
-
-def get_embedding(text):
-    """Get embedding vector from SageMaker endpoint."""
-    response = sagemaker_runtime.invoke_endpoint(
-        EndpointName=SAGEMAKER_ENDPOINT,
-        ContentType='application/json',
-        Body=json.dumps({'inputs': text})
-    )
-    
-    result = json.loads(response['Body'].read().decode())
-    # HuggingFace returns nested array [[[embedding]]], extract the actual embedding
-    if isinstance(result, list) and len(result) > 0:
-        if isinstance(result[0], list) and len(result[0]) > 0:
-            if isinstance(result[0][0], list):
-                return result[0][0]  # Extract from [[[embedding]]]
-            return result[0]  # Extract from [[embedding]]
-    return result  # Return as-is if not nested
 
 
 def lambda_handler(event, context):
@@ -62,20 +39,13 @@ def lambda_handler(event, context):
     print(f"Getting embedding for query: {query_text}")
     query_embedding = get_embedding(query_text)
     
-    # Search S3 Vectors
-    print(f"Searching in bucket: {VECTOR_BUCKET}, index: {INDEX_NAME}")
-    response = s3_vectors.query_vectors(
-        vectorBucketName=VECTOR_BUCKET,
-        indexName=INDEX_NAME,
-        queryVector={"float32": query_embedding},
-        topK=k,
-        returnDistance=True,
-        returnMetadata=True
-    )
+    # Search the vector store (S3 Vectors, or local with VECTOR_STORE=local)
+    print(f"Searching in {VECTOR_STORE} store, bucket: {VECTOR_BUCKET}, index: {INDEX_NAME}")
+    vectors = get_vector_store().query_vectors(query_embedding, top_k=k)
     
     # Format results
     results = []
-    for vector in response.get('vectors', []):
+    for vector in vectors:
         results.append({
             'id': vector['key'],
             'score': vector.get('distance', 0),
@@ -0,0 +1,66 @@
+"""Unit tests for ingest duplicate suppression (dedup.py)."""
+
+import pytest
+from sqlalchemy import create_engine
+
+from dedup import DEDUP_MIN_SIMILARITY, SignatureIndex, minhash, similarity
+
+ANALYSIS = (
+    "Ronald Acuna Jr. returned from the injured list on Tuesday and went two for four with a stolen base. "
+    "The Braves expect him to lead off every day, which makes him a first round target in points leagues "
+    "that reward speed and runs scored over the rest of the season."
+)
+
+
+@pytest.fixture
+def index():
+    return SignatureIndex(create_engine("sqlite://"))
+
+
+def test_exact_duplicate_ignores_case_and_whitespace(index):
+    index.add("doc-1", ANALYSIS, 1)
+    match = index.find_duplicate("  " + ANALYSIS.upper().replace(" ", "\n  "))
+    assert match == {"document_id": "doc-1", "chunk_count": 1, "match": "exact", "similarity": 1.0}
+
+
+def test_one_word_edit_is_a_near_duplicate(index):
+    index.add("doc-1", ANALYSIS, 1)
+    match = index.find_duplicate(ANALYSIS.replace("Tuesday", "Wednesday"))
+    assert match["document_id"] == "doc-1"
+    assert match["match"] == "near"
+    assert DEDUP_MIN_SIMILARITY <= match["similarity"] < 1.0
+
+
+def test_unrelated_text_is_not_a_duplicate(index):
+    index.add("doc-1", ANALYSIS, 1)
+    unrelated = (
+        "Bobby Witt Jr. hit his twentieth home run as Kansas City swept the Tigers, and the Royals "
+        "bullpen has not allowed a run in six straight games heading into the weekend series."
+    )
+    assert index.find_duplicate(unrelated) is None
+
+
+def test_threshold_is_respected():
+    edited = ANALYSIS.replace("Tuesday", "Wednesday")
+    score = similarity(minhash(ANALYSIS), minhash(edited))
+    strict = SignatureIndex(create_engine("sqlite://"), min_similarity=min(1.0, score + 0.01))
+    strict.add("doc-1", ANALYSIS, 1)
+    assert strict.find_duplicate(edited) is None
+
+
+def test_minhash_similarity_bounds():
+    assert similarity(minhash(ANALYSIS), minhash(ANALYSIS)) == 1.0
+    assert similarity(minhash(ANALYSIS), minhash("completely different words about pitching depth")) < 0.2
+
+
+def test_remove_forgets_documents(index):
+    index.add("doc-1", ANALYSIS, 1)
+    index.remove(["doc-1"])
+    assert index.find_duplicate(ANALYSIS) is None
+
+
+def test_add_replaces_a_documents_signature(index):
+    index.add("doc-1", ANALYSIS, 1)
+    index.add("doc-1", "completely different words about pitching depth", 2)
+    assert index.find_duplicate(ANALYSIS) is None
+    assert index.find_duplicate("completely different words about pitching depth")["chunk_count"] == 2
@@ -0,0 +1,148 @@
+"""Unit tests for chunking and ingestion (ingest_pipeline.py) against a local store and a SQLite manifest."""
+
+import hashlib
+import time
+
+import pytest
+
+import dedup
+import entity_linking
+import ingest_pipeline
+import kb_manifest
+import lexical_index
+from entity_linking import PlayerNameIndex
+from kb_manifest import KeyManifest
+from vector_store import LocalVectorStore
+
+
+def _words(count, start=0):
+    return " ".join(f"word{i}" for i in range(start, start + count))
+
+
+@pytest.mark.parametrize("text, chunk_words, overlap_words, expected", [
+    ("", 3, 1, []),
+    ("  \n ", 3, 1, []),
+    ("a  b\nc", 3, 1, ["a b c"]),
+    ("a b c d", 3, 1, ["a b c", "c d"]),
+    ("a b c d e", 3, 1, ["a b c", "c d e"]),
+    ("a b c d e f", 3, 0, ["a b c", "d e f"]),
+    ("a b c d", 2, 5, ["a b", "b c", "c d"]),
+])
+def test_chunk_text(text, chunk_words, overlap_words, expected):
+    assert ingest_pipeline.chunk_text(text, chunk_words, overlap_words) == expected
+
+
+def test_build_chunks_keys_and_metadata():
+    chunks = ingest_pipeline.build_chunks(
+        {"text": _words(361), "document_id": "doc", "metadata": {"topic": "injuries", "timestamp": "2025-04-01T00:00:00Z"}},
+        timestamp="2025-04-02T00:00:00",
+    )
+    assert [chunk["key"] for chunk in chunks] == ["doc-0", "doc-1", "doc-2"]
+    assert [chunk["metadata"]["chunk_index"] for chunk in chunks] == [0, 1, 2]
+    assert {chunk["metadata"]["chunk_count"] for chunk in chunks} == {3}
+    assert chunks[0]["metadata"]["topic"] == "injuries"
+    assert chunks[0]["metadata"]["timestamp_epoch"] == 1743465600.0
+
+
+def _fake_embeddings(texts):
+    return [list(hashlib.sha256(text.encode('utf-8')).digest()[:8]) for text in texts]
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = LocalVectorStore(str(tmp_path / "vectors"), use_hnsw=False)
+    monkeypatch.setattr(ingest_pipeline, "get_vector_store", lambda: store)
+    monkeypatch.setattr(ingest_pipeline, "get_embeddings", _fake_embeddings)
+    # The lexical index, player links and signatures share the manifest's database
+    monkeypatch.setattr(kb_manifest, "_manifest", KeyManifest(f"sqlite:///{tmp_path / 'manifest.sqlite3'}"))
+    monkeypatch.setattr(lexical_index, "_lexical_index", None)
+    monkeypatch.setattr(entity_linking, "_player_chunk_index", None)
+    monkeypatch.setattr(dedup, "_signature_index", None)
+    monkeypatch.setattr(entity_linking, "_name_index", PlayerNameIndex([{"id": 660670, "name": "Ronald Acuña Jr."}]))
+    monkeypatch.setattr(entity_linking, "_name_index_loaded_at", time.monotonic())
+    return store
+
+
+def test_ingest_keeps_the_last_document_given_an_id_twice(store):
+    summaries = ingest_pipeline.ingest_documents([
+        {"text": "x y z q", "document_id": "d1"},
+        {"text": "totally other words here now", "document_id": "d1"},
+    ])
+
+    assert [summary["document_id"] for summary in summaries] == ["d1", "d1"]
+    assert [vector["metadata"]["text"] for vector in store.get_vectors(["d1-0"])] == ["totally other words here now"]
+    assert kb_manifest.get_manifest().keys(document_id="d1") == ["d1-0"]
+    assert [key for key, _ in lexical_index.get_lexical_index().search("totally", top_k=5)] == ["d1-0"]
+    assert lexical_index.get_lexical_index().search("q", top_k=5) == []
+
+
+ANALYSIS = " ".join(f"word{i}" for i in range(60))
+
+
+def test_replace_mode_merges_in_batch_near_duplicates_into_one_document(store, monkeypatch):
+    monkeypatch.setattr(ingest_pipeline, "DEDUP_MODE", "replace")
+    revised = ANALYSIS.replace("word59", "revised")
+
+    summaries = ingest_pipeline.ingest_documents([
+        {"text": ANALYSIS, "document_id": "a"},
+        {"text": revised, "document_id": "b"},
+    ])
+
+    assert summaries[1]["document_id"] == "a"
+    assert summaries[1]["duplicate_of"] == "a"
+    assert kb_manifest.get_manifest().keys() == ["a-0"]
+    assert [vector["metadata"]["text"] for vector in store.get_vectors(["a-0"])] == [revised]
+
+
+def test_ingest_batches_embeddings_and_writes(store, monkeypatch):
+    monkeypatch.setattr(ingest_pipeline, "EMBED_BATCH_SIZE", 2)
+    monkeypatch.setattr(ingest_pipeline, "S3_VECTORS_BATCH_SIZE", 3)
+    embedded, written = [], []
+    monkeypatch.setattr(ingest_pipeline, "get_embeddings", lambda texts: embedded.append(len(texts)) or _fake_embeddings(texts))
+    put_vectors = store.put_vectors
+    monkeypatch.setattr(store, "put_vectors", lambda vectors: written.append(len(vectors)) or put_vectors(vectors))
+
+    summaries = ingest_pipeline.ingest_documents([
+        {"text": _words(361), "document_id": "a"},
+        {"text": "Ronald Acuña Jr. stole two bases " + _words(20, start=1000), "document_id": "b"},
+        {"text": _words(361, start=2000), "document_id": "c"},
+    ])
+
+    assert [summary["chunks"] for summary in summaries] == [3, 1, 3]
+    assert embedded == [2, 2, 2, 1]
+    assert written == [4, 3]
+    assert len(store) == 7
+    assert len(kb_manifest.get_manifest().keys()) == 7
+    assert entity_linking.get_player_chunk_index().keys([660670]) == ["b-0"]
+
+
+def test_skip_mode_reports_stored_duplicates(store):
+    ingest_pipeline.ingest_documents([{"text": _words(361), "document_id": "a"}])
+
+    summaries = ingest_pipeline.ingest_documents([{"text": _words(361).upper(), "document_id": "b"}])
+
+    assert summaries == [{"document_id": "a", "chunks": 0, "duplicate_of": "a", "match": "exact"}]
+    assert kb_manifest.get_manifest().keys(document_id="b") == []
+
+
+def test_replace_mode_deletes_stale_chunks(store, monkeypatch):
+    monkeypatch.setattr(ingest_pipeline, "DEDUP_MODE", "replace")
+    ingest_pipeline.ingest_documents([{"text": _words(361), "document_id": "a"}])
+
+    summaries = ingest_pipeline.ingest_documents([{"text": _words(360), "document_id": "b"}])
+
+    assert summaries[0] == {"document_id": "a", "chunks": 2, "duplicate_of": "a", "match": "near"}
+    assert sorted(kb_manifest.get_manifest().keys()) == ["a-0", "a-1"]
+    assert store.get_vectors(["a-2"]) == []
+    assert len(store) == 2
+
+
+def test_delete_vectors_forgets_removed_documents(store):
+    ingest_pipeline.ingest_documents([{"text": _words(50), "document_id": "a"}])
+
+    assert ingest_pipeline.delete_vectors(["a-0"]) == 1
+
+    assert len(store) == 0
+    assert kb_manifest.get_manifest().count() == 0
+    assert lexical_index.get_lexical_index().search("word1", top_k=5) == []
+    assert ingest_pipeline.ingest_documents([{"text": _words(50), "document_id": "a"}]) == [{"document_id": "a", "chunks": 1}]
@@ -0,0 +1,71 @@
+"""Unit tests for the BM25 index and reciprocal-rank fusion (lexical_index.py)."""
+
+import pytest
+from sqlalchemy import create_engine
+
+from lexical_index import LexicalIndex, rrf_fuse, tokenize
+
+
+def _chunk(key, text):
+    return {"key": key, "metadata": {"text": text}}
+
+
+@pytest.fixture
+def index():
+    return LexicalIndex(engine=create_engine("sqlite://"))
+
+
+def test_tokenize_folds_accents_and_drops_stopwords():
+    assert tokenize("Ronald Acuña Jr. is the best in the NL") == ["ronald", "acuna", "jr", "best", "nl"]
+
+
+def test_search_matches_accent_folded_names(index):
+    index.add([_chunk("a", "Ronald Acuña Jr. stole two bases"), _chunk("b", "Bobby Witt Jr. homered")])
+    assert [key for key, _ in index.search("acuna", top_k=5)] == ["a"]
+
+
+def test_search_ranks_by_bm25(index):
+    index.add([
+        _chunk("once", "Acuna doubled in the first inning against the Mets"),
+        _chunk("twice", "Acuna doubled and Acuna scored in the first inning"),
+        _chunk("none", "Witt homered in the first inning against the Mets"),
+    ])
+    results = index.search("Acuna", top_k=5)
+    assert [key for key, _ in results] == ["twice", "once"]
+    assert results[0][1] > results[1][1] > 0
+
+
+def test_search_respects_top_k_and_unknown_terms(index):
+    index.add([_chunk(str(i), f"closer depth chart note {i}") for i in range(5)])
+    assert len(index.search("closer", top_k=3)) == 3
+    assert index.search("shortstop", top_k=3) == []
+    assert index.search("the and of", top_k=3) == []
+
+
+def test_add_replaces_and_remove_deletes(index):
+    index.add([_chunk("a", "Acuna stole second")])
+    index.add([_chunk("a", "Witt stole second")])
+    assert index.search("acuna", top_k=5) == []
+    assert [key for key, _ in index.search("witt", top_k=5)] == ["a"]
+    index.remove(["a"])
+    assert index.search("witt", top_k=5) == []
+
+
+def test_rrf_fuse_scores():
+    fused = rrf_fuse([["a", "b", "c"], ["c", "a"]], k=60)
+    assert [key for key, _ in fused] == ["a", "c", "b"]
+    scores = dict(fused)
+    assert scores["a"] == pytest.approx(1 / 61 + 1 / 62)
+    assert scores["c"] == pytest.approx(1 / 63 + 1 / 61)
+    assert scores["b"] == pytest.approx(1 / 62)
+
+
+def test_rrf_fuse_empty():
+    assert rrf_fuse([]) == []
+    assert rrf_fuse([[], []]) == []
+
+
+def test_add_keeps_the_last_text_for_a_repeated_key(index):
+    index.add([_chunk("a", "Acuna doubled"), _chunk("a", "Witt homered")])
+    assert index.search("acuna", top_k=5) == []
+    assert [key for key, _ in index.search("witt", top_k=5)] == ["a"]
@@ -0,0 +1,109 @@
+"""Unit tests for metadata filters and the local vector store (vector_store.py)."""
+
+import pytest
+
+from vector_store import LocalVectorStore, VectorStore, matches_filter
+
+METADATA = {"topic": "injuries", "timestamp_epoch": 100.0, "player_ids": 7, "source": None}
+
+
+@pytest.mark.parametrize("filter, expected", [
+    (None, True),
+    ({}, True),
+    ({"topic": "injuries"}, True),
+    ({"topic": "prospects"}, False),
+    ({"topic": {"$eq": "injuries"}}, True),
+    ({"topic": {"$ne": "injuries"}}, False),
+    ({"topic": {"$in": ["injuries", "trades"]}}, True),
+    ({"topic": {"$nin": ["injuries", "trades"]}}, False),
+    ({"timestamp_epoch": {"$gt": 100}}, False),
+    ({"timestamp_epoch": {"$gte": 100}}, True),
+    ({"timestamp_epoch": {"$lt": 100}}, False),
+    ({"timestamp_epoch": {"$lte": 100}}, True),
+    ({"timestamp_epoch": {"$gte": 50, "$lt": 150}}, True),
+    ({"timestamp_epoch": {"$gt": "a string"}}, False),
+    ({"topic": {"$exists": True}}, True),
+    ({"missing": {"$exists": False}}, True),
+    ({"source": {"$exists": True}}, False),
+    ({"missing": {"$ne": "x"}}, True),
+    ({"missing": {"$gt": 1}}, False),
+    ({"$and": [{"topic": "injuries"}, {"timestamp_epoch": {"$gt": 50}}]}, True),
+    ({"$and": [{"topic": "injuries"}, {"timestamp_epoch": {"$gt": 150}}]}, False),
+    ({"$or": [{"topic": "trades"}, {"player_ids": {"$in": [7, 8]}}]}, True),
+    ({"$or": [{"topic": "trades"}, {"player_ids": {"$in": [8]}}]}, False),
+])
+def test_matches_filter(filter, expected):
+    assert matches_filter(METADATA, filter) is expected
+
+
+def test_matches_filter_rejects_unknown_operators():
+    with pytest.raises(ValueError):
+        matches_filter(METADATA, {"topic": {"$regex": "inj"}})
+
+
+def _vector(key, data, **metadata):
+    return {"key": key, "data": {"float32": data}, "metadata": {"text": key, **metadata}}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = LocalVectorStore(str(tmp_path), use_hnsw=False)
+    store.put_vectors([
+        _vector("x", [1.0, 0.0, 0.0], topic="a"),
+        _vector("y", [0.0, 1.0, 0.0], topic="b"),
+        _vector("xy", [1.0, 1.0, 0.0], topic="a"),
+    ])
+    return store
+
+
+def test_query_returns_nearest_first_with_cosine_distance(store):
+    results = store.query_vectors([2.0, 0.1, 0.0], top_k=2)
+    assert [r["key"] for r in results] == ["x", "xy"]
+    assert results[0]["distance"] == pytest.approx(1 - 2 / (4.01 ** 0.5), abs=1e-5)
+    assert results[0]["metadata"] == {"text": "x", "topic": "a"}
+
+
+def test_query_applies_filter(store):
+    results = store.query_vectors([0.0, 1.0, 0.0], top_k=3, filter={"topic": "a"})
+    assert [r["key"] for r in results] == ["xy", "x"]
+    assert store.query_vectors([0.0, 1.0, 0.0], top_k=3, filter={"topic": "c"}) == []
+
+
+def test_put_replaces_by_key(store):
+    store.put_vectors([_vector("x", [0.0, 0.0, 1.0], topic="c")])
+    assert len(store) == 3
+    assert store.query_vectors([0.0, 0.0, 1.0], top_k=1)[0]["key"] == "x"
+    assert store.get_vectors(["x"]) == [{"key": "x", "metadata": {"text": "x", "topic": "c"}}]
+
+
+def test_delete_removes_vectors(store):
+    store.delete_vectors(["x", "missing"])
+    assert len(store) == 2
+    assert "x" not in [r["key"] for r in store.query_vectors([1.0, 0.0, 0.0], top_k=3)]
+    assert store.get_vectors(["x", "y"]) == [{"key": "y", "metadata": {"text": "y", "topic": "b"}}]
+
+
+def test_reload_from_disk(store, tmp_path):
+    store.delete_vectors(["y"])
+    reloaded = LocalVectorStore(str(tmp_path), use_hnsw=False)
+    assert len(reloaded) == 2
+    assert [r["key"] for r in reloaded.query_vectors([1.0, 0.0, 0.0], top_k=3)] == ["x", "xy"]
+
+
+def test_dimension_mismatch_is_rejected(store):
+    with pytest.raises(ValueError):
+        store.put_vectors([_vector("z", [1.0, 0.0])])
+
+
+def test_hnsw_matches_exact_search(tmp_path):
+    pytest.importorskip("hnswlib")
+    store = LocalVectorStore(str(tmp_path), use_hnsw=True)
+    store.put_vectors([_vector(str(i), [float(i), 1.0, 0.5]) for i in range(20)])
+    store.delete_vectors(["19"])
+    reloaded = LocalVectorStore(str(tmp_path), use_hnsw=True)
+    assert [r["key"] for r in reloaded.query_vectors([18.0, 1.0, 0.5], top_k=2)] == ["18", "17"]
+
+
+def test_vector_store_is_abstract():
+    with pytest.raises(TypeError):
+        VectorStore()
@@ -0,0 +1,366 @@
+"""
+Vector store abstraction for the knowledge base.
+
+S3VectorStore wraps the `s3vectors` boto3 client used in production.
+LocalVectorStore keeps the same put/query/get/delete API on local disk so
+knowledge base search can run (and be benchmarked) without AWS: vectors
+live in a memory-mapped NumPy float32 matrix searched with exact cosine
+top-k (optionally through an HNSW index when hnswlib is installed), with
+metadata in a JSON sidecar.
+
+Vectors and results use the S3 Vectors shapes:
+    put:   {"key": str, "data": {"float32": [...]}, "metadata": {...}}
+    query: {"key": str, "distance": float, "metadata": {...}}  (cosine distance, 1 - similarity)
+
+Metadata filters use the S3 Vectors filter language ($eq, $ne, $gt, $gte,
+$lt, $lte, $in, $nin, $exists, $and, $or).
+"""
+
+import json
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional
+
+VECTOR_STORE = os.environ.get('VECTOR_STORE', 's3')  # "s3" or "local"
+VECTOR_BUCKET = os.environ.get('VECTOR_BUCKET', 'mlbdraftoracle-vectors')
+INDEX_NAME = os.environ.get('INDEX_NAME', 'draft-research')
+LOCAL_VECTOR_STORE_PATH = os.environ.get(
+    'LOCAL_VECTOR_STORE_PATH',
+    os.path.join(tempfile.gettempdir(), 'mlbdraftoracle', 'vector_store', INDEX_NAME)
+)
+LOCAL_VECTOR_STORE_HNSW = os.environ.get('LOCAL_VECTOR_STORE_HNSW', 'false').lower() == 'true'
+
+# S3 Vectors accepts at most 500 vectors / keys per request
+S3_VECTORS_BATCH_SIZE = 500
+
+
+def _compare(value: Any, operator: str, operand: Any) -> bool:
+    if operator == '$exists':
+        return (value is not None) == bool(operand)
+    if value is None:
+        return operator in ('$ne', '$nin')
+    if operator == '$eq':
+        return value == operand
+    if operator == '$ne':
+        return value != operand
+    if operator == '$in':
+        return value in operand
+    if operator == '$nin':
+        return value not in operand
+    try:
+        if operator == '$gt':
+            return value > operand
+        if operator == '$gte':
+            return value >= operand
+        if operator == '$lt':
+            return value < operand
+        if operator == '$lte':
+            return value <= operand
+    except TypeError:
+        return False
+    raise ValueError(f"Unsupported filter operator: {operator}")
+
+
+def matches_filter(metadata: Dict[str, Any], filter: Optional[Dict[str, Any]]) -> bool:
+    """Evaluate an S3 Vectors metadata filter against one vector's metadata"""
+    if not filter:
+        return True
+    for field, condition in filter.items():
+        if field == '$and':
+            if not all(matches_filter(metadata, sub) for sub in condition):
+                return False
+        elif field == '$or':
+            if not any(matches_filter(metadata, sub) for sub in condition):
+                return False
+        elif isinstance(condition, dict):
+            if not all(_compare(metadata.get(field), op, operand) for op, operand in condition.items()):
+                return False
+        elif metadata.get(field) != condition:
+            return False
+    return True
+
+
+def _batches(items: List[Any], size: int) -> Iterable[List[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class VectorStore(ABC):
+    """Interface shared by the S3 Vectors and local backends."""
+
+    @abstractmethod
+    def put_vectors(self, vectors: List[Dict[str, Any]]):
+        """Insert or replace vectors by key."""
+
+    @abstractmethod
+    def query_vectors(self, query_vector: List[float], top_k: int, filter: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Nearest vectors by cosine distance (closest first), with metadata."""
+
+    @abstractmethod
+    def get_vectors(self, keys: List[str]) -> List[Dict[str, Any]]:
+        """Stored vectors' keys and metadata (no embedding call needed); missing keys are skipped."""
+
+    @abstractmethod
+    def delete_vectors(self, keys: List[str]):
+        """Delete vectors by key; missing keys are ignored."""
+
+
+class S3VectorStore(VectorStore):
+    """Amazon S3 Vectors index."""
+
+    def __init__(self, bucket: str = VECTOR_BUCKET, index_name: str = INDEX_NAME, client=None):
+        import boto3
+        self.bucket = bucket
+        self.index_name = index_name
+        self.client = client or boto3.client('s3vectors')
+
+    def put_vectors(self, vectors: List[Dict[str, Any]]):
+        for batch in _batches(vectors, S3_VECTORS_BATCH_SIZE):
+            self.client.put_vectors(vectorBucketName=self.bucket, indexName=self.index_name, vectors=batch)
+
+    def query_vectors(self, query_vector: List[float], top_k: int, filter: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        params = dict(
+            vectorBucketName=self.bucket,
+            indexName=self.index_name,
+            queryVector={"float32": query_vector},
+            topK=top_k,
+            returnDistance=True,
+            returnMetadata=True
+        )
+        if filter:
+            params['filter'] = filter
+        return self.client.query_vectors(**params).get('vectors', [])
+
+    def get_vectors(self, keys: List[str]) -> List[Dict[str, Any]]:
+        vectors = []
+        for batch in _batches(list(keys), S3_VECTORS_BATCH_SIZE):
+            response = self.client.get_vectors(
+                vectorBucketName=self.bucket, indexName=self.index_name, keys=batch,
+                returnData=False, returnMetadata=True
+            )
+            vectors.extend(response.get('vectors', []))
+        return vectors
+
+    def delete_vectors(self, keys: List[str]):
+        for batch in _batches(list(keys), S3_VECTORS_BATCH_SIZE):
+            self.client.delete_vectors(vectorBucketName=self.bucket, indexName=self.index_name, keys=batch)
+
+
+class LocalVectorStore(VectorStore):
+    """
+    On-disk vector index for tests, dev containers and latency comparisons.
+
+    Layout of `path`:
+        vectors.f32  float32 matrix (capacity x dimension) of unit-normalized vectors, memory-mapped
+        index.json   dimension, row count, row -> key, key -> metadata
+        hnsw.bin     optional HNSW graph over the same rows
+    """
+
+    def __init__(self, path: str = LOCAL_VECTOR_STORE_PATH, use_hnsw: bool = LOCAL_VECTOR_STORE_HNSW):
+        import numpy as np
+        self._np = np
+        self.path = path
+        self.use_hnsw = use_hnsw
+        self._lock = threading.RLock()
+        self.dimension: Optional[int] = None
+        self.capacity = 0
+        self.count = 0
+        self.keys: List[Optional[str]] = []  # row -> key (None once deleted)
+        self.metadata: Dict[str, Dict[str, Any]] = {}
+        self._rows: Dict[str, int] = {}
+        self._matrix = None
+        self._hnsw = None
+        os.makedirs(path, exist_ok=True)
+        self._load()
+
+    # ------------------------------------------------------------------ storage
+
+    @property
+    def _vectors_file(self) -> str:
+        return os.path.join(self.path, 'vectors.f32')
+
+    @property
+    def _index_file(self) -> str:
+        return os.path.join(self.path, 'index.json')
+
+    @property
+    def _hnsw_file(self) -> str:
+        return os.path.join(self.path, 'hnsw.bin')
+
+    def _load(self):
+        if not os.path.exists(self._index_file):
+            return
+        with open(self._index_file) as f:
+            index = json.load(f)
+        self.dimension = index['dimension']
+        self.capacity = index['capacity']
+        self.count = index['count']
+        self.keys = index['keys']
+        self.metadata = index['metadata']
+        self._rows = {key: row for row, key in enumerate(self.keys) if key is not None}
+        self._matrix = self._np.memmap(self._vectors_file, dtype=self._np.float32, mode='r+', shape=(self.capacity, self.dimension))
+        self._load_hnsw()
+
+    def _save(self):
+        self._matrix.flush()
+        tmp = self._index_file + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump({
+                'dimension': self.dimension,
+                'capacity': self.capacity,
+                'count': self.count,
+                'keys': self.keys,
+                'metadata': self.metadata,
+            }, f)
+        os.replace(tmp, self._index_file)
+        if self._hnsw is not None:
+            self._hnsw.save_index(self._hnsw_file)
+
+    def _reserve(self, rows_needed: int):
+        """Grow the memory-mapped matrix (doubling) to hold `rows_needed` rows."""
+        if rows_needed <= self.capacity:
+            return
+        np = self._np
+        capacity = max(rows_needed, self.capacity * 2, 1024)
+        tmp = self._vectors_file + '.tmp'
+        matrix = np.memmap(tmp, dtype=np.float32, mode='w+', shape=(capacity, self.dimension))
+        if self._matrix is not None:
+            matrix[:self.count] = self._matrix[:self.count]
+            del self._matrix
+        matrix.flush()
+        del matrix
+        os.replace(tmp, self._vectors_file)
+        self._matrix = np.memmap(self._vectors_file, dtype=np.float32, mode='r+', shape=(capacity, self.dimension))
+        self.capacity = capacity
+        if self._hnsw is not None:
+            self._hnsw.resize_index(capacity)
+
+    def _load_hnsw(self):
+        if not self.use_hnsw:
+            return
+        try:
+            import hnswlib
+        except ImportError:
+            print("LocalVectorStore: hnswlib not installed, using exact search")
+            self.use_hnsw = False
+            return
+        self._hnsw = hnswlib.Index(space='cosine', dim=self.dimension)
+        if os.path.exists(self._hnsw_file):
+            self._hnsw.load_index(self._hnsw_file, max_elements=self.capacity, allow_replace_deleted=False)
+        else:
+            # Build from the stored rows
+            self._hnsw.init_index(max_elements=max(self.capacity, 1), ef_construction=200, M=16)
+            live = [row for row, key in enumerate(self.keys) if key is not None]
+            if live:
+                self._hnsw.add_items(self._matrix[live], live)
+        self._hnsw.set_ef(64)
+
+    def _normalize(self, vectors):
+        np = self._np
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+
+    # ---------------------------------------------------------------------- API
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def put_vectors(self, vectors: List[Dict[str, Any]]):
+        if not vectors:
+            return
+        np = self._np
+        data = np.asarray([v['data']['float32'] for v in vectors], dtype=np.float32)
+        with self._lock:
+            if self.dimension is None:
+                self.dimension = int(data.shape[1])
+                self._reserve(len(vectors))
+                self._load_hnsw()
+            if data.shape[1] != self.dimension:
+                raise ValueError(f"Vector dimension {data.shape[1]} does not match index dimension {self.dimension}")
+
+            rows = []
+            for vector in vectors:
+                key = vector['key']
+                row = self._rows.get(key)
+                if row is None:
+                    row = self.count
+                    self.count += 1
+                    self.keys.append(key)
+                    self._rows[key] = row
+                rows.append(row)
+                self.metadata[key] = vector.get('metadata', {})
+            self._reserve(self.count)
+
+            normalized = self._normalize(data)
+            self._matrix[rows] = normalized
+            if self._hnsw is not None:
+                self._hnsw.add_items(normalized, rows)
+            self._save()
+
+    def query_vectors(self, query_vector: List[float], top_k: int, filter: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        np = self._np
+        with self._lock:
+            if not self._rows:
+                return []
+            query = self._normalize(np.asarray([query_vector], dtype=np.float32))[0]
+
+            if self._hnsw is not None and not filter:
+                k = min(top_k, len(self._rows))
+                labels, distances = self._hnsw.knn_query(query, k=k)
+                hits = zip(labels[0].tolist(), distances[0].tolist())
+            else:
+                if filter:
+                    rows = np.asarray([row for key, row in self._rows.items() if matches_filter(self.metadata[key], filter)], dtype=np.int64)
+                else:
+                    rows = np.asarray(sorted(self._rows.values()), dtype=np.int64)
+                if rows.size == 0:
+                    return []
+                similarities = self._matrix[rows] @ query
+                k = min(top_k, rows.size)
+                top = np.argpartition(-similarities, k - 1)[:k]
+                top = top[np.argsort(-similarities[top])]
+                hits = ((int(rows[i]), 1.0 - float(similarities[i])) for i in top)
+
+            results = []
+            for row, distance in hits:
+                key = self.keys[row]
+                results.append({'key': key, 'distance': distance, 'metadata': self.metadata[key]})
+            return results
+
+    def get_vectors(self, keys: List[str]) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [{'key': key, 'metadata': self.metadata[key]} for key in keys if key in self._rows]
+
+    def delete_vectors(self, keys: List[str]):
+        with self._lock:
+            deleted = False
+            for key in keys:
+                row = self._rows.pop(key, None)
+                if row is None:
+                    continue
+                self.keys[row] = None
+                self.metadata.pop(key, None)
+                if self._hnsw is not None:
+                    self._hnsw.mark_deleted(row)
+                deleted = True
+            if deleted:
+                self._save()
+
+
+_store: Optional[VectorStore] = None
+
+
+def get_vector_store() -> VectorStore:
+    """The configured store (VECTOR_STORE=s3|local), shared by the process"""
+    global _store
+    if _store is None:
+        if VECTOR_STORE == 'local':
+            _store = LocalVectorStore()
+        elif VECTOR_STORE == 's3':
+            _store = S3VectorStore()
+        else:
+            raise ValueError(f"Unknown VECTOR_STORE '{VECTOR_STORE}' (use 's3' or 'local')")
+    return _store
@@ -3,6 +3,7 @@ Simplified draft_client.py using run-mcp-servers-with-aws-lambda package.
 Replace your existing draft_client.py with this version.
 """
 from typing import List
+import asyncio
 import json
 import os
 import logging
@@ -10,20 +11,33 @@ from agents import FunctionTool
 
 logger = logging.getLogger(__name__)
 
+# Draft tools that only read state; anything else (draft_specific_player) is never retried
+READ_ONLY_DRAFT_TOOLS = frozenset({"list_available_players"})
+
 # Detect if running in Lambda
 IS_LAMBDA = os.path.exists("/var/task") or os.getenv("WORKER_LAMBDA_FUNCTION_NAME")
 
-if IS_LAMBDA:
+from backend.mcp_clients.inprocess_mcp import DRAFT_MCP_IN_PROCESS
+
+# Lambda workers call the draft MCP Lambda unless the draft server runs in-process
+USE_LAMBDA_CLIENT = IS_LAMBDA and not DRAFT_MCP_IN_PROCESS
+
+if DRAFT_MCP_IN_PROCESS:
+    # Draft server tools/resources called directly in this process (no transport)
+    from backend.mcp_clients.inprocess_mcp import InProcessMCPPool
+    
+    logger.info("Using in-process draft server (DRAFT_MCP_IN_PROCESS)")
+    draft_session_pool = InProcessMCPPool(name="draft_server")
+elif IS_LAMBDA:
     # Use the package's Lambda MCP client
     from backend.mcp_clients.lambda_mcp_client import get_draft_mcp_client
     
     logger.info("Using Lambda-based MCP client for draft server")
     draft_client = get_draft_mcp_client()
 else:
-    # Use stdio for local development (unchanged)
-    import mcp
-    from mcp.client.stdio import stdio_client
+    # Use stdio for local development, through a persistent session pool
     from mcp import StdioServerParameters
+    from backend.mcp_clients.mcp_session_pool import MCPSessionPool
     
     logger.info("Using stdio-based MCP client for draft server (local dev)")
     
@@ -49,109 +63,127 @@ else:
         )
     
     params = get_drafter_params()
+    # One long-lived draft server shared by every caller in this process, or a
+    # shared streamable HTTP draft server when DRAFT_MCP_URL is set
+    DRAFT_MCP_URL = os.getenv("DRAFT_MCP_URL")
+    if DRAFT_MCP_URL:
+        logger.info(f"Using streamable HTTP draft server at {DRAFT_MCP_URL}")
+    draft_session_pool = MCPSessionPool(DRAFT_MCP_URL or params, name="draft_server")
+
+
+async def _read_resource_text(uri):
+    """Read a resource over the pooled session (stdio, HTTP or in-process)"""
+    result = await draft_session_pool.run(lambda session: session.read_resource(uri))
+    return result.contents[0].text
+
+
+async def close_draft_client():
+    """Stop the pooled draft server (local dev only; Lambda clients hold no processes)"""
+    if not USE_LAMBDA_CLIENT:
+        await draft_session_pool.close()
 
 
 async def list_draft_tools():
     """List available draft tools"""
-    if IS_LAMBDA:
+    if USE_LAMBDA_CLIENT:
         # The package handles all the protocol details
         return await draft_client.list_tools()
     else:
-        async with stdio_client(params) as streams:
-            async with mcp.ClientSession(*streams) as session:
-                await session.initialize()
-                tools_result = await session.list_tools()
-                return tools_result.tools
+        tools_result = await draft_session_pool.run(lambda session: session.list_tools())
+        return tools_result.tools
 
 
 async def call_draft_tool(tool_name, tool_args):
     """Call a draft tool"""
     logger.info(f"Calling draft tool: {tool_name}")
     
-    if IS_LAMBDA:
+    if USE_LAMBDA_CLIENT:
         # The package handles serialization/deserialization
         result = await draft_client.call_tool(tool_name, tool_args)
         logger.info(f"Draft Tool {tool_name} Result: {result}")
         return result
     else:
-        async with stdio_client(params) as streams:
-            async with mcp.ClientSession(*streams) as session:
-                await session.initialize()
-                result = await session.call_tool(tool_name, tool_args)
-                logger.info(f"Draft Tool {tool_name} Result: {result}")
-                return result
+        result = await draft_session_pool.run(
+            lambda session: session.call_tool(tool_name, tool_args),
+            idempotent=tool_name in READ_ONLY_DRAFT_TOOLS
+        )
+        logger.info(f"Draft Tool {tool_name} Result: {result}")
+        return result
 
 
 async def read_team_roster_resource(id, team_name):
     """Read team roster resource"""
     uri = f"draft://team_roster/{id}/{team_name}"
     
-    if IS_LAMBDA:
+    if USE_LAMBDA_CLIENT:
         # The package handles resource reading
         return await draft_client.read_resource(uri)
     else:
-        async with stdio_client(params) as streams:
-            async with mcp.ClientSession(*streams) as session:
-                await session.initialize()
-                result = await session.read_resource(uri)
-                return result.contents[0].text
+        return await _read_resource_text(uri)
 
 
 async def read_player_pool_resource(id):
     """Read player pool resource"""
     uri = f"draft://player_pool/{id.lower()}"
     
-    if IS_LAMBDA:
+    if USE_LAMBDA_CLIENT:
         return await draft_client.read_resource(uri)
     else:
-        async with stdio_client(params) as streams:
-            async with mcp.ClientSession(*streams) as session:
-                await session.initialize()
-                result = await session.read_resource(uri)
-                return result.contents[0].text
+        return await _read_resource_text(uri)
 
 
-async def read_draft_player_pool_available_resource(id):
-    """Read available player pool resource"""
-    uri = f"draft://player_pool/{id.lower()}/available"
+async def read_draft_player_pool_available_resource(id, position=None, sort_by="name", limit=25, cursor=None):
+    """Read a page of available players (JSON with players, next_cursor and total)"""
+    uri = f"draft://player_pool/{id.lower()}/available/{position or 'all'}/{sort_by}/{limit}/{cursor or 'start'}"
     
-    if IS_LAMBDA:
+    if USE_LAMBDA_CLIENT:
         return await draft_client.read_resource(uri)
     else:
-        async with stdio_client(params) as streams:
-            async with mcp.ClientSession(*streams) as session:
-                await session.initialize()
-                result = await session.read_resource(uri)
-                return result.contents[0].text
+        return await _read_resource_text(uri)
+
+
+async def read_draft_context_resource(id, team_name):
+    """Read the one-shot pick context (roster, needs, candidates, order, recent picks) for a team"""
+    uri = f"draft://context/{id.lower()}/{team_name}"
+    
+    if USE_LAMBDA_CLIENT:
+        return await draft_client.read_resource(uri)
+    else:
+        return await _read_resource_text(uri)
 
 
 async def read_draft_order_resource(id, round):
     """Read draft order resource"""
     uri = f"draft://draft_order/{id.lower()}/round/{round}"
     
-    if IS_LAMBDA:
+    if USE_LAMBDA_CLIENT:
         return await draft_client.read_resource(uri)
     else:
-        async with stdio_client(params) as streams:
-            async with mcp.ClientSession(*streams) as session:
-                await session.initialize()
-                result = await session.read_resource(uri)
-                return result.contents[0].text
+        return await _read_resource_text(uri)
 
 
 async def read_draft_history_resource(id):
     """Read draft history resource"""
     uri = f"draft://history/{id.lower()}"
     
-    if IS_LAMBDA:
+    if USE_LAMBDA_CLIENT:
         return await draft_client.read_resource(uri)
     else:
-        async with stdio_client(params) as streams:
-            async with mcp.ClientSession(*streams) as session:
-                await session.initialize()
-                result = await session.read_resource(uri)
-                return result.contents[0].text
+        return await _read_resource_text(uri)
+
+
+
+async def read_draft_resources(uris):
+    """
+    Read several draft resources at once: one batched invocation on Lambda,
+    concurrent reads over the pooled session locally.
 
+    Returns:
+        Resource text per URI, in order (or the exception if that read failed).
+    """
+    if USE_LAMBDA_CLIENT:
+        return await draft_client.read_resources(list(uris))
+    return await asyncio.gather(*(_read_resource_text(uri) for uri in uris), return_exceptions=True)
 
 def set_additional_properties_false(schema, defs=None, visited=None):
     """Helper function to set additionalProperties to false in JSON schemas"""
@@ -0,0 +1,173 @@
+"""
+In-process transport for the draft MCP server.
+
+When the worker and the draft logic run in the same process (e.g. a single
+container), going through stdio, HTTP or a Lambda means serializing every
+request, reloading the draft in another process and serializing the answer
+back. With DRAFT_MCP_IN_PROCESS=true the draft server's FastMCP instance is
+imported into this process instead and its tools and resources are
+dispatched as direct coroutine calls, sharing this process's draft view
+cache (so a pick saved here is visible to the next read immediately).
+
+The adapters mirror the interfaces the callers already use:
+- InProcessMCPSession / InProcessMCPPool: mcp.ClientSession / MCPSessionPool (draft_client)
+- InProcessMCPServer: agents.mcp.MCPServer (drafter agents)
+- InProcessMCPInvoker: LambdaMCPInvoker (Lambda worker pick path)
+"""
+import base64
+import json
+import logging
+import os
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
+
+from agents.mcp import MCPServer
+from mcp.types import (
+    BlobResourceContents,
+    CallToolResult,
+    EmptyResult,
+    ListToolsResult,
+    ReadResourceResult,
+    TextContent,
+    TextResourceContents,
+    Tool as MCPTool,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DRAFT_MCP_IN_PROCESS = os.getenv("DRAFT_MCP_IN_PROCESS", "false").lower() == "true"
+
+
+def get_draft_fastmcp():
+    """The draft server's FastMCP instance, imported on first use (it imports the draft models)"""
+    from backend.mcp_servers.draft_server import mcp
+    return mcp
+
+
+class InProcessMCPSession:
+    """ClientSession-compatible facade that calls a FastMCP server in this process."""
+
+    def __init__(self, server_factory: Callable[[], Any] = get_draft_fastmcp):
+        self._server_factory = server_factory
+        self._server = None
+
+    @property
+    def server(self):
+        if self._server is None:
+            self._server = self._server_factory()
+        return self._server
+
+    async def initialize(self):
+        self.server
+        return None
+
+    async def send_ping(self) -> EmptyResult:
+        return EmptyResult()
+
+    async def list_tools(self) -> ListToolsResult:
+        return ListToolsResult(tools=await self.server.list_tools())
+
+    async def call_tool(self, name: str, arguments: Optional[Dict[str, Any]] = None) -> CallToolResult:
+        """Run a tool; failures come back as isError results, as they would over a transport"""
+        try:
+            result = await self.server.call_tool(name, arguments or {})
+        except Exception as e:
+            logger.error(f"[InProcessMCP] Tool {name} failed: {e}", exc_info=True)
+            return CallToolResult(content=[TextContent(type="text", text=str(e))], isError=True)
+
+        # Newer FastMCP versions also return structured output alongside the content
+        if isinstance(result, tuple):
+            result = result[0]
+        if isinstance(result, dict):
+            result = [TextContent(type="text", text=json.dumps(result, default=str))]
+        return CallToolResult(content=list(result), isError=False)
+
+    async def read_resource(self, uri: str) -> ReadResourceResult:
+        contents = []
+        for item in await self.server.read_resource(str(uri)):
+            if isinstance(item.content, bytes):
+                contents.append(BlobResourceContents(uri=uri, mimeType=item.mime_type, blob=base64.b64encode(item.content).decode()))
+            else:
+                contents.append(TextResourceContents(uri=uri, mimeType=item.mime_type, text=item.content))
+        return ReadResourceResult(contents=contents)
+
+
+class InProcessMCPPool:
+    """Drop-in for MCPSessionPool: a single shared in-process session, nothing to start or restart."""
+
+    def __init__(self, name: str, server_factory: Callable[[], Any] = get_draft_fastmcp):
+        self.name = name
+        self._session = InProcessMCPSession(server_factory)
+
+    async def run(self, operation: Callable[[InProcessMCPSession], Awaitable[T]], idempotent: bool = True) -> T:
+        return await operation(self._session)
+
+    def stats(self) -> dict:
+        return {"name": self.name, "size": 1, "alive": 1, "restarts": 0, "transport": "in-process"}
+
+    async def close(self):
+        return None
+
+
+class InProcessMCPServer(MCPServer):
+    """Agents SDK MCP server backed by an in-process FastMCP server."""
+
+    def __init__(self, name: str = "draft_server", server_factory: Callable[[], Any] = get_draft_fastmcp):
+        self._name = name
+        self._session = InProcessMCPSession(server_factory)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    async def connect(self):
+        await self._session.initialize()
+
+    async def cleanup(self):
+        return None
+
+    async def list_tools(self) -> List[MCPTool]:
+        return (await self._session.list_tools()).tools
+
+    async def call_tool(self, tool_name: str, arguments: Optional[Dict[str, Any]]) -> CallToolResult:
+        return await self._session.call_tool(tool_name, arguments)
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.cleanup()
+
+
+class InProcessMCPInvoker:
+    """LambdaMCPInvoker-compatible invoker that calls the draft server in this process."""
+
+    def __init__(self, server_factory: Callable[[], Any] = get_draft_fastmcp):
+        self._session = InProcessMCPSession(server_factory)
+
+    async def call_tool(self, tool_name: str, arguments: dict) -> dict:
+        result = await self._session.call_tool(tool_name, arguments)
+        text = "".join(c.text for c in result.content if isinstance(c, TextContent))
+        if result.isError:
+            return {"status": "error", "error": text}
+        try:
+            return json.loads(text)
+        except ValueError:
+            return {"status": "success", "result": text}
+
+    async def list_tools(self) -> list:
+        tools = (await self._session.list_tools()).tools
+        return [{"name": t.name, "description": t.description or "", "inputSchema": t.inputSchema} for t in tools]
+
+
+_draft_invoker = None
+
+
+def get_inprocess_draft_invoker() -> InProcessMCPInvoker:
+    """In-process replacement for get_draft_mcp_invoker()"""
+    global _draft_invoker
+    if _draft_invoker is None:
+        _draft_invoker = InProcessMCPInvoker()
+    return _draft_invoker
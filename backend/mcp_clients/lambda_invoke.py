@@ -0,0 +1,49 @@
+"""
+Non-blocking Lambda invocation shared by the Lambda MCP clients.
+
+boto3 is synchronous, so invoking it directly from a coroutine blocks the
+event loop for the whole remote execution. Invocations run on a dedicated
+thread pool instead, so parallel tool calls and concurrent picks overlap.
+"""
+import asyncio
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import boto3
+from botocore.config import Config
+
+logger = logging.getLogger(__name__)
+
+LAMBDA_INVOKE_MAX_WORKERS = int(os.getenv("LAMBDA_INVOKE_MAX_WORKERS", "16"))
+
+# boto3 clients are thread-safe; size the connection pool to match the executor
+lambda_client = boto3.client(
+    'lambda',
+    region_name=os.getenv('AWS_REGION', 'us-east-2'),
+    config=Config(max_pool_connections=LAMBDA_INVOKE_MAX_WORKERS)
+)
+
+_executor = ThreadPoolExecutor(max_workers=LAMBDA_INVOKE_MAX_WORKERS, thread_name_prefix="lambda-invoke")
+
+
+def _invoke(function_name: str, payload: Any) -> Any:
+    response = lambda_client.invoke(
+        FunctionName=function_name,
+        InvocationType='RequestResponse',  # Synchronous
+        Payload=json.dumps(payload)
+    )
+    return json.loads(response['Payload'].read().decode())
+
+
+async def invoke_lambda(function_name: str, payload: Any) -> Any:
+    """
+    Invoke a Lambda function with a JSON payload without blocking the event loop.
+
+    Returns:
+        The decoded JSON response payload.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, _invoke, function_name, payload)
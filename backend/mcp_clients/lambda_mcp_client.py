@@ -2,16 +2,25 @@
 Lambda MCP client adapter (manual implementation - no external package needed).
 Replaces stdio-based MCP servers with Lambda function invocations.
 """
+import itertools
 import json
 import logging
-import boto3
 import os
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple, Union
+from backend.mcp_clients.lambda_invoke import invoke_lambda
 
 logger = logging.getLogger(__name__)
 
-# Initialize Lambda client
-lambda_client = boto3.client('lambda', region_name=os.getenv('AWS_REGION', 'us-east-2'))
+# JSON-RPC request ids; unique per process so batched responses can be matched to requests
+_request_ids = itertools.count(1)
+
+
+class LambdaMCPError(Exception):
+    """JSON-RPC error returned by an MCP Lambda for one request"""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
 
 
 class LambdaMCPClient:
@@ -42,19 +51,13 @@ class LambdaMCPClient:
                 'name': tool_name,
                 'arguments': arguments
             },
-            'id': 1
+            'id': next(_request_ids)
         }
         
         logger.info(f"[LambdaMCPClient] Invoking {self.function_name}.{tool_name}")
         
         try:
-            response = lambda_client.invoke(
-                FunctionName=self.function_name,
-                InvocationType='RequestResponse',  # Synchronous
-                Payload=json.dumps(payload)
-            )
-            
-            result = json.loads(response['Payload'].read().decode())
+            result = await invoke_lambda(self.function_name, payload)
             
             if 'error' in result:
                 error_msg = result['error'].get('message', 'Unknown error')
@@ -78,19 +81,13 @@ class LambdaMCPClient:
         payload = {
             'jsonrpc': '2.0',
             'method': 'tools/list',
-            'id': 1
+            'id': next(_request_ids)
         }
         
         logger.info(f"[LambdaMCPClient] Listing tools from {self.function_name}")
         
         try:
-            response = lambda_client.invoke(
-                FunctionName=self.function_name,
-                InvocationType='RequestResponse',
-                Payload=json.dumps(payload)
-            )
-            
-            result = json.loads(response['Payload'].read().decode())
+            result = await invoke_lambda(self.function_name, payload)
             
             if 'error' in result:
                 error_msg = result['error'].get('message', 'Unknown error')
@@ -121,19 +118,13 @@ class LambdaMCPClient:
             'params': {
                 'uri': uri
             },
-            'id': 1
+            'id': next(_request_ids)
         }
         
         logger.info(f"[LambdaMCPClient] Reading resource: {uri}")
         
         try:
-            response = lambda_client.invoke(
-                FunctionName=self.function_name,
-                InvocationType='RequestResponse',
-                Payload=json.dumps(payload)
-            )
-            
-            result = json.loads(response['Payload'].read().decode())
+            result = await invoke_lambda(self.function_name, payload)
             
             if 'error' in result:
                 error_msg = result['error'].get('message', 'Unknown error')
@@ -150,6 +141,63 @@ class LambdaMCPClient:
             logger.error(f"[LambdaMCPClient] Error reading resource: {e}", exc_info=True)
             raise
 
+    
+    async def batch(self, requests: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Union[Any, Exception]]:
+        """
+        Send several JSON-RPC requests in a single Lambda invocation.
+        
+        Args:
+            requests: (method, params) pairs, e.g. ('resources/read', {'uri': ...})
+            
+        Returns:
+            One entry per request, in request order: the JSON-RPC result, or a
+            LambdaMCPError if that request failed (other requests are unaffected).
+        """
+        if not requests:
+            return []
+        
+        payload = []
+        for method, params in requests:
+            request = {'jsonrpc': '2.0', 'method': method, 'id': next(_request_ids)}
+            if params is not None:
+                request['params'] = params
+            payload.append(request)
+        
+        logger.info(f"[LambdaMCPClient] Invoking {self.function_name} with a batch of {len(payload)} requests")
+        response = await invoke_lambda(self.function_name, payload)
+        
+        if isinstance(response, dict):
+            # Whole batch rejected (e.g. a Lambda that predates batching)
+            error = response.get('error') or {}
+            raise LambdaMCPError(error.get('code', -32600), error.get('message', f"Batch not supported: {response}"))
+        
+        by_id = {item.get('id'): item for item in response}
+        results = []
+        for request in payload:
+            item = by_id.get(request['id'])
+            if item is None:
+                results.append(LambdaMCPError(-32603, f"No response for {request['method']}"))
+            elif 'error' in item:
+                results.append(LambdaMCPError(item['error'].get('code', -32603), item['error'].get('message', 'Unknown error')))
+            else:
+                results.append(item.get('result'))
+        
+        failed = sum(1 for r in results if isinstance(r, Exception))
+        logger.info(f"[LambdaMCPClient] ✓ Batch finished ({len(results) - failed} ok, {failed} failed)")
+        return results
+    
+    async def read_resources(self, uris: List[str]) -> List[Union[str, Exception]]:
+        """Read several resources in one invocation; returns text or an exception per URI"""
+        results = await self.batch([('resources/read', {'uri': uri}) for uri in uris])
+        return [
+            r if isinstance(r, Exception) else ((r or {}).get('contents') or [{}])[0].get('text', '')
+            for r in results
+        ]
+    
+    async def call_tools(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Union[Any, Exception]]:
+        """Call several tools in one invocation; returns the result or an exception per call"""
+        return await self.batch([('tools/call', {'name': name, 'arguments': arguments}) for name, arguments in calls])
+
 
 # Factory functions for creating clients
 def get_draft_mcp_client() -> LambdaMCPClient:
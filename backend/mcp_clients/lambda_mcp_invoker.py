@@ -4,13 +4,11 @@ MCP Client that invokes separate Lambda functions for MCP operations
 
 import json
 import logging
-import boto3
 import os
+from backend.mcp_clients.lambda_invoke import invoke_lambda
 
 logger = logging.getLogger(__name__)
 
-lambda_client = boto3.client('lambda', region_name=os.getenv('AWS_REGION', 'us-east-2'))
-
 
 class LambdaMCPInvoker:
     """Invokes MCP Lambda functions for tool calls"""
@@ -29,13 +27,7 @@ class LambdaMCPInvoker:
         }
         
         try:
-            response = lambda_client.invoke(
-                FunctionName=self.lambda_function_name,
-                InvocationType='RequestResponse',  # Synchronous
-                Payload=json.dumps(payload)
-            )
-            
-            response_payload = json.loads(response['Payload'].read())
+            response_payload = await invoke_lambda(self.lambda_function_name, payload)
             
             if response_payload.get('statusCode') == 200:
                 body = json.loads(response_payload['body'])
@@ -59,13 +51,7 @@ class LambdaMCPInvoker:
         }
         
         try:
-            response = lambda_client.invoke(
-                FunctionName=self.lambda_function_name,
-                InvocationType='RequestResponse',
-                Payload=json.dumps(payload)
-            )
-            
-            response_payload = json.loads(response['Payload'].read())
+            response_payload = await invoke_lambda(self.lambda_function_name, payload)
             
             if response_payload.get('statusCode') == 200:
                 body = json.loads(response_payload['body'])
@@ -0,0 +1,247 @@
+"""
+Long-lived, health-checked pool of MCP client sessions.
+
+Spawning a stdio MCP server means launching a Python process and importing
+the backend, so doing it per request dominates the cost of a resource read.
+The pool starts each server once, keeps its ClientSession open and shares it
+between all callers in the process (MCP sessions multiplex concurrent
+requests), restarting a server if it dies or stops answering pings.
+
+The same pool can instead connect to a shared, long-running server over
+streamable HTTP by passing its URL instead of stdio parameters.
+"""
+import asyncio
+import itertools
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from contextlib import AsyncExitStack
+from typing import Any, Awaitable, Callable, List, Optional, TypeVar, Union
+
+import anyio
+import mcp
+from mcp import StdioServerParameters
+from mcp.client.stdio import stdio_client
+from mcp.client.streamable_http import streamablehttp_client
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+MCP_POOL_SIZE = int(os.getenv("MCP_POOL_SIZE", "1"))
+# Sessions idle for longer than this are pinged before reuse
+MCP_HEALTH_CHECK_SECONDS = float(os.getenv("MCP_HEALTH_CHECK_SECONDS", "30"))
+MCP_PING_TIMEOUT_SECONDS = float(os.getenv("MCP_PING_TIMEOUT_SECONDS", "5"))
+MCP_STARTUP_TIMEOUT_SECONDS = float(os.getenv("MCP_STARTUP_TIMEOUT_SECONDS", "60"))
+
+# Errors that mean the server process / transport is gone rather than the request failing
+TRANSPORT_ERRORS = (
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    anyio.EndOfStream,
+    BrokenPipeError,
+    ConnectionError,
+    EOFError,
+)
+
+
+class BackgroundMCPConnection(ABC):
+    """
+    Lifecycle shared by pooled MCP sessions and cached Agents SDK MCP server groups.
+
+    MCP transport clients must be entered and exited in the same task, so a
+    background task opens them (`_open`, on an AsyncExitStack), publishes the
+    result as `resource` and holds it until stopped. ensure() (re)starts the
+    task when it died, failed its health check (`_ping`, after
+    MCP_HEALTH_CHECK_SECONDS idle) or belongs to an event loop that has since
+    been closed.
+    """
+
+    log_prefix = "[MCPSessionPool]"
+
+    def __init__(self, name: str):
+        self.name = name
+        self.resource: Optional[Any] = None
+        self.restarts = 0
+        self.last_used = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._ready: Optional[asyncio.Event] = None
+        self._stop: Optional[asyncio.Event] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._error: Optional[BaseException] = None
+
+    @abstractmethod
+    async def _open(self, stack: AsyncExitStack) -> Any:
+        """Enter the transports on `stack` and return what ensure() hands out."""
+
+    async def _ping(self) -> bool:
+        return True
+
+    @property
+    def is_alive(self) -> bool:
+        return (
+            self.resource is not None
+            and self._task is not None
+            and not self._task.done()
+            and self._loop is asyncio.get_running_loop()
+        )
+
+    async def _serve(self):
+        try:
+            async with AsyncExitStack() as stack:
+                self.resource = await self._open(stack)
+                self._ready.set()
+                await self._stop.wait()
+        except Exception as e:
+            self._error = e
+            logger.error(f"{self.log_prefix} {self.name} stopped with error: {e}")
+        finally:
+            self.resource = None
+            self._ready.set()
+
+    async def _start(self):
+        self._loop = asyncio.get_running_loop()
+        self._ready = asyncio.Event()
+        self._stop = asyncio.Event()
+        self._error = None
+        started_at = time.monotonic()
+        self._task = self._loop.create_task(self._serve())
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout=MCP_STARTUP_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            await self._shutdown()
+            raise RuntimeError(f"MCP {self.name} did not start within {MCP_STARTUP_TIMEOUT_SECONDS:.0f}s")
+        if self.resource is None:
+            raise RuntimeError(f"MCP {self.name} failed to start: {self._error}")
+        self.last_used = time.monotonic()
+        logger.info(f"{self.log_prefix} {self.name} started in {time.monotonic() - started_at:.1f}s")
+
+    async def _shutdown(self):
+        task, self._task = self._task, None
+        self.resource = None
+        if task is None or task.done():
+            return
+        if self._loop is not asyncio.get_running_loop():
+            # The loop that owned the transports is gone (e.g. a previous asyncio.run)
+            return
+        self._stop.set()
+        try:
+            await asyncio.wait_for(task, timeout=MCP_PING_TIMEOUT_SECONDS)
+        except (asyncio.TimeoutError, Exception):
+            task.cancel()
+
+    async def _healthy(self) -> bool:
+        if not self.is_alive:
+            return False
+        if time.monotonic() - self.last_used < MCP_HEALTH_CHECK_SECONDS:
+            return True
+        return await self._ping()
+
+    async def ensure(self) -> Any:
+        """Return the live resource, (re)starting it if needed."""
+        if self._lock is None or self._loop is not asyncio.get_running_loop():
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if not await self._healthy():
+                if self._loop is not None:
+                    self.restarts += 1
+                    logger.warning(f"{self.log_prefix} Restarting {self.name} (restart #{self.restarts})")
+                await self._shutdown()
+                await self._start()
+            return self.resource
+
+    async def invalidate(self):
+        """Stop it so the next ensure() starts a fresh one (after a transport failure)."""
+        await self._shutdown()
+
+    async def close(self):
+        await self._shutdown()
+        self._loop = None
+
+
+class PooledMCPSession(BackgroundMCPConnection):
+    """One MCP server connection (stdio process or HTTP session) and its initialized ClientSession."""
+
+    def __init__(self, params: Union[StdioServerParameters, str], name: str):
+        super().__init__(name)
+        self.params = params
+
+    @property
+    def session(self) -> Optional[mcp.ClientSession]:
+        return self.resource
+
+    def _connect(self):
+        if isinstance(self.params, str):
+            return streamablehttp_client(self.params)
+        return stdio_client(self.params)
+
+    async def _open(self, stack: AsyncExitStack) -> mcp.ClientSession:
+        # stdio yields (read, write); streamable HTTP also yields a session id getter
+        streams = await stack.enter_async_context(self._connect())
+        session = await stack.enter_async_context(mcp.ClientSession(streams[0], streams[1]))
+        await session.initialize()
+        return session
+
+    async def _ping(self) -> bool:
+        try:
+            await asyncio.wait_for(self.session.send_ping(), timeout=MCP_PING_TIMEOUT_SECONDS)
+            return True
+        except Exception as e:
+            logger.warning(f"[MCPSessionPool] {self.name} failed health check: {e}")
+            return False
+
+
+class MCPSessionPool:
+    """
+    Round-robin pool of persistent MCP sessions for one server.
+
+    `params` is either stdio server parameters (the pool owns the server
+    processes) or the URL of a streamable HTTP server.
+    """
+
+    def __init__(self, params: Union[StdioServerParameters, str], name: str, size: int = MCP_POOL_SIZE):
+        self.name = name
+        self._members: List[PooledMCPSession] = [
+            PooledMCPSession(params, f"{name}#{i + 1}") for i in range(max(1, size))
+        ]
+        self._next = itertools.cycle(self._members)
+
+    async def run(self, operation: Callable[[mcp.ClientSession], Awaitable[T]], idempotent: bool = True) -> T:
+        """
+        Run one request on a pooled session.
+
+        If the server died mid-request the session is restarted and an
+        idempotent request retried once; a non-idempotent one (e.g. a pick)
+        may already have been applied, so its transport error is raised after
+        the restart. Errors returned by the server are not retried.
+        """
+        member = next(self._next)
+        session = await member.ensure()
+        try:
+            result = await operation(session)
+        except TRANSPORT_ERRORS as e:
+            if not idempotent:
+                logger.warning(f"[MCPSessionPool] {member.name} transport failed ({e!r}) on a non-idempotent request, not retrying")
+                await member.invalidate()
+                raise
+            logger.warning(f"[MCPSessionPool] {member.name} transport failed ({e!r}), retrying on a fresh session")
+            await member.invalidate()
+            session = await member.ensure()
+            result = await operation(session)
+        member.last_used = time.monotonic()
+        return result
+
+    def stats(self) -> dict:
+        return {
+            "name": self.name,
+            "size": len(self._members),
+            "alive": sum(1 for m in self._members if m.session is not None),
+            "restarts": sum(m.restarts for m in self._members),
+        }
+
+    async def close(self):
+        for member in self._members:
+            await member.close()
+        logger.info(f"[MCPSessionPool] {self.name} closed")
@@ -7,6 +7,7 @@ from typing import Dict
 import uuid
 import logging
 import time
+import argparse
 
 # ============================================================================
 # CRITICAL: Python Path Setup MUST happen before ANY other imports
@@ -46,9 +47,10 @@ try:
     from backend.models.draft_history import DraftHistory
     from backend.models.draft_selection_data import DraftSelectionData
     from backend.models.player_pool import PlayerPool
+    from backend.models.draft_views import get_player_pool_view, get_team_roster_view, get_draft_order_view, get_available_players_page, get_draft_context_view, DEFAULT_PAGE_SIZE
     from backend.templates.templates import drafter_instructions
     from mcp.server.fastmcp import FastMCP
-    from typing import List
+    from typing import List, Optional
     
     models_AVAILABLE = True
     logger.info(f"Backend models imported successfully in {time.time() - start_time:.2f}s")
@@ -57,9 +59,17 @@ except Exception as e:
     models_AVAILABLE = False
     raise
 
+# Transport: "stdio" (one server per client process) or "streamable-http"/"sse"
+# (one long-running server shared by every drafter agent and worker)
+DRAFT_MCP_TRANSPORT = os.getenv("DRAFT_MCP_TRANSPORT", "stdio")
+DRAFT_MCP_HOST = os.getenv("DRAFT_MCP_HOST", "0.0.0.0")
+DRAFT_MCP_PORT = int(os.getenv("DRAFT_MCP_PORT", "8001"))
+
 mcp = FastMCP(
     name="draft_server",
-    instructions=drafter_instructions()
+    instructions=drafter_instructions(),
+    host=DRAFT_MCP_HOST,
+    port=DRAFT_MCP_PORT
 )
 
 
@@ -195,86 +205,93 @@ async def read_draft_player_pool_resource(id: str) -> str:
     
     try:
         logger.info(f"[read_draft_player_pool_resource] Reading player pool for draft {id}")
-        draft = await Draft.get(id.lower())
+        player_pool_data = get_player_pool_view(id)
         
-        if not draft:
-            logger.error(f"[read_draft_player_pool_resource] Draft {id} not found")
+        if player_pool_data is None:
+            logger.error(f"[read_draft_player_pool_resource] Draft {id} not found or has no player pool")
             return json.dumps({"error": f"Draft {id} not found"})
         
-        player_pool_data = draft.get_draft_player_pool()
-        
-        # Ensure we return valid JSON
-        if isinstance(player_pool_data, str):
-            try:
-                json.loads(player_pool_data)  # Validate
-                logger.info(f"[read_draft_player_pool_resource] ✓ Returning player pool JSON string")
-                return player_pool_data
-            except json.JSONDecodeError:
-                logger.error(f"[read_draft_player_pool_resource] Invalid JSON from get_draft_player_pool")
-                return json.dumps({"error": "Invalid player pool data"})
-        else:
-            logger.info(f"[read_draft_player_pool_resource] ✓ Converting player pool to JSON")
-            return json.dumps(player_pool_data)
+        logger.info(f"[read_draft_player_pool_resource] ✓ Returning {len(player_pool_data.get('players', []))} players")
+        return json.dumps(player_pool_data, default=str)
             
     except Exception as e:
         logger.error(f"[read_draft_player_pool_resource] Error: {e}", exc_info=True)
         return json.dumps({"error": str(e)})
 
 
-@mcp.resource("draft://player_pool/{id}/available")
-async def read_draft_player_pool_available_resource(id: str) -> str:
-    """Get available (undrafted) players for a draft (returns JSON string)"""
+def _available_players_page_json(id: str, position=None, sort_by="name", order=None, limit=DEFAULT_PAGE_SIZE, cursor=None) -> str:
+    """Shared body of the available players resources and tool (returns JSON string)"""
     if not models_AVAILABLE:
         return json.dumps({"error": "Database models not available"})
     
     try:
-        logger.info(f"[read_draft_player_pool_available_resource] Reading available players for draft {id}")
-        draft = await Draft.get(id.lower())
+        logger.info(f"[available_players] Draft {id}: position={position}, sort_by={sort_by}, order={order}, limit={limit}, cursor={cursor}")
+        page = get_available_players_page(id, position=position, sort_by=sort_by, order=order, limit=limit, cursor=cursor)
         
-        if not draft:
-            logger.error(f"[read_draft_player_pool_available_resource] Draft {id} not found")
+        if page is None:
+            logger.error(f"[available_players] Draft {id} not found or has no player pool")
             return json.dumps({"error": f"Draft {id} not found"})
         
-        # Get player pool
-        player_pool = draft.player_pool
-        if not player_pool:
-            logger.error(f"[read_draft_player_pool_available_resource] Draft {id} has no player pool")
-            return json.dumps({"error": f"Draft {id} has no player pool"})
-        
-        logger.info(f"[read_draft_player_pool_available_resource] Player pool ID: {player_pool.id}")
-        
-        # Import Player model (adjust import based on your structure)
-        from backend.models.player import Player  # or wherever your Player model is
-        
-        # Query all players for this player pool that aren't drafted
-        available_players = await Player.filter(
-            player_pool_id=player_pool.id,
-            is_drafted=False
-        ).all()
-        
-        logger.info(f"[read_draft_player_pool_available_resource] Found {len(available_players)} available players")
-        
-        # Convert to JSON
-        players_data = []
-        for p in available_players:
-            player_dict = {
-                "id": p.id,
-                "name": p.name,
-                "position": p.position,
-                "team": p.team,
+        page["players"] = [
+            {
+                "id": p.get("id"),
+                "name": p.get("name"),
+                "position": p.get("position"),
+                "team": p.get("team"),
+                "stats": p.get("stats"),
             }
-            if hasattr(p, 'stats') and p.stats:
-                player_dict["stats"] = p.stats
-            players_data.append(player_dict)
-        
-        logger.info(f"[read_draft_player_pool_available_resource] ✓ Sample: {[p['name'] for p in players_data[:5]]}")
-        
-        return json.dumps(players_data)
-                
+            for p in page["players"]
+        ]
+        logger.info(f"[available_players] ✓ Returning {len(page['players'])} of {page['total']} available players")
+        return json.dumps(page, default=str)
+    
+    except ValueError as e:
+        logger.warning(f"[available_players] Invalid request: {e}")
+        return json.dumps({"error": str(e)})
     except Exception as e:
-        logger.error(f"[read_draft_player_pool_available_resource] Error: {e}", exc_info=True)
+        logger.error(f"[available_players] Error: {e}", exc_info=True)
         return json.dumps({"error": str(e)})
 
+
+@mcp.tool()
+async def list_available_players(draft_id: str, position: Optional[str] = None, sort_by: str = "name", order: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None) -> str:
+    """
+    List undrafted players one page at a time.
+    
+    Args:
+        draft_id: Id of the draft
+        position: Comma-separated positions to include (e.g. "P,OF"); omit for all positions
+        sort_by: "name", "position", "team" or a stat (r, hr, rbi, sb, avg, obp, slg, w, k, era, whip, s, at_bats, innings_pitched)
+        order: "asc" or "desc"; stats default to best first
+        limit: Players per page (max 100)
+        cursor: next_cursor from the previous page; omit for the first page
+    
+    Returns:
+        JSON with players, next_cursor (null on the last page) and total matching players
+    """
+    return _available_players_page_json(draft_id, position, sort_by, order, limit, cursor)
+
+
+@mcp.resource("draft://player_pool/{id}/available")
+async def read_draft_player_pool_available_resource(id: str) -> str:
+    """Get the first page of available (undrafted) players for a draft, sorted by name (returns JSON string)"""
+    return _available_players_page_json(id)
+
+
+@mcp.resource("draft://player_pool/{id}/available/{position}/{sort_by}/{limit}/{cursor}")
+async def read_draft_player_pool_available_page_resource(id: str, position: str, sort_by: str, limit: str, cursor: str) -> str:
+    """
+    Get a page of available players (returns JSON string).
+    Use position "all" for every position and cursor "start" for the first page.
+    """
+    return _available_players_page_json(
+        id,
+        position=None if position == "all" else position,
+        sort_by=sort_by,
+        limit=int(limit),
+        cursor=None if cursor == "start" else cursor
+    )
+
 @mcp.resource("draft://team_roster/{id}/{team_name}")
 async def read_draft_team_roster_resource(id: str, team_name: str) -> str:
     """Get the roster for a specific team in a draft (returns JSON string)"""
@@ -283,34 +300,45 @@ async def read_draft_team_roster_resource(id: str, team_name: str) -> str:
     
     try:
         logger.info(f"[read_draft_team_roster_resource] Reading roster for {team_name} in draft {id}")
-        draft = await Draft.get(id.lower())
+        roster_data = get_team_roster_view(id, team_name)
         
-        if not draft:
-            logger.error(f"[read_draft_team_roster_resource] Draft {id} not found")
-            return json.dumps({"error": f"Draft {id} not found"})
+        if roster_data is None:
+            logger.error(f"[read_draft_team_roster_resource] Team {team_name} not found in draft {id}")
+            return json.dumps({"error": f"Team {team_name} not found in draft {id}"})
         
-        roster_data = draft.get_team_roster(team_name)
-        
-        # Ensure we return valid JSON
-        if isinstance(roster_data, str):
-            # If it's already a JSON string, validate it
-            try:
-                json.loads(roster_data)  # Validate
-                logger.info(f"[read_draft_team_roster_resource] ✓ Returning roster JSON string")
-                return roster_data
-            except json.JSONDecodeError:
-                logger.error(f"[read_draft_team_roster_resource] Invalid JSON from get_team_roster: {roster_data[:100]}")
-                return json.dumps({"error": "Invalid roster data", "raw": str(roster_data)[:200]})
-        else:
-            # If it's a dict or list, convert to JSON
-            logger.info(f"[read_draft_team_roster_resource] ✓ Converting roster to JSON")
-            return json.dumps(roster_data)
+        logger.info(f"[read_draft_team_roster_resource] ✓ Returning roster JSON")
+        return json.dumps(roster_data, default=str)
             
     except Exception as e:
         logger.error(f"[read_draft_team_roster_resource] Error: {e}", exc_info=True)
         return json.dumps({"error": str(e)})
 
 
+@mcp.resource("draft://context/{id}/{team_name}")
+async def read_draft_context_resource(id: str, team_name: str) -> str:
+    """
+    Get everything a team needs for its next pick in one payload (returns JSON string):
+    roster, needed positions, ranked candidate shortlist, this round's draft order and recent picks.
+    """
+    if not models_AVAILABLE:
+        return json.dumps({"error": "Database models not available"})
+    
+    try:
+        logger.info(f"[read_draft_context_resource] Reading pick context for {team_name} in draft {id}")
+        context = get_draft_context_view(id, team_name)
+        
+        if context is None:
+            logger.error(f"[read_draft_context_resource] Team {team_name} not found in draft {id}")
+            return json.dumps({"error": f"Team {team_name} not found in draft {id}"})
+        
+        logger.info(f"[read_draft_context_resource] ✓ Needs {context['needed_positions']}, {len(context['candidates'])} candidates")
+        return json.dumps(context, default=str)
+    
+    except Exception as e:
+        logger.error(f"[read_draft_context_resource] Error: {e}", exc_info=True)
+        return json.dumps({"error": str(e)})
+
+
 @mcp.resource("draft://draft_order/{id}/round/{round}")
 async def get_draft_order(id: str, round: int) -> str:
     """Get the draft order for a specific round (returns JSON string)"""
@@ -319,27 +347,14 @@ async def get_draft_order(id: str, round: int) -> str:
     
     try:
         logger.info(f"[get_draft_order] Reading draft order for draft {id}, round {round}")
-        draft = await Draft.get(id.lower())
+        teams_data = get_draft_order_view(id, int(round))
         
-        if not draft:
+        if teams_data is None:
             logger.error(f"[get_draft_order] Draft {id} not found")
             return json.dumps({"error": f"Draft {id} not found"})
         
-        draft_order = draft.get_draft_order(int(round))
-        
-        # Convert Team objects to JSON-serializable dicts
-        if isinstance(draft_order, list):
-            teams_data = [
-                {
-                    "name": t.name if hasattr(t, 'name') else str(t),
-                    "strategy": t.strategy if hasattr(t, 'strategy') else None,
-                }
-                for t in draft_order
-            ]
-            logger.info(f"[get_draft_order] ✓ Returning {len(teams_data)} teams")
-            return json.dumps(teams_data)
-        else:
-            return json.dumps(draft_order, default=str)
+        logger.info(f"[get_draft_order] ✓ Returning {len(teams_data)} teams")
+        return json.dumps(teams_data)
             
     except Exception as e:
         logger.error(f"[get_draft_order] Error: {e}", exc_info=True)
@@ -377,5 +392,16 @@ async def read_draft_history_resource(id: str) -> str:
 
 
 if __name__ == "__main__":
-    logger.info("Starting MCP draft server with PostgreSQL RDS...")
-    mcp.run(transport='stdio')
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="MLB Draft Oracle draft MCP server")
+    parser.add_argument("--transport", choices=["stdio", "streamable-http", "sse"], default=DRAFT_MCP_TRANSPORT)
+    parser.add_argument("--host", default=DRAFT_MCP_HOST)
+    parser.add_argument("--port", type=int, default=DRAFT_MCP_PORT)
+    args = parser.parse_args()
+
+    if args.transport != "stdio":
+        mcp.settings.host = args.host
+        mcp.settings.port = args.port
+        logger.info(f"Starting MCP draft server with PostgreSQL RDS on {args.transport} http://{args.host}:{args.port}...")
+    else:
+        logger.info("Starting MCP draft server with PostgreSQL RDS...")
+    mcp.run(transport=args.transport)
\ No newline at end of file
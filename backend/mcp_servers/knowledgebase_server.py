@@ -1,31 +1,47 @@
 """
-MCP Server for searching the MLB Draft Oracle knowledge base (S3 Vectors).
+MCP Server for searching the MLB Draft Oracle knowledge base (S3 Vectors or a local vector store).
 """
 import os
 import sys
 import json
-import boto3
+import time
+import asyncio
 from pathlib import Path
 from dotenv import load_dotenv, find_dotenv
 from mcp.server.fastmcp import FastMCP
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 # Load environment variables
 load_dotenv(override=True, dotenv_path=find_dotenv())
 
+# Shared knowledge base modules live with the ingest Lambda (flat modules in backend/ingest)
+for ingest_dir in (Path(__file__).parent.parent / 'ingest', Path(__file__).parent.parent / 'backend' / 'ingest'):
+    if ingest_dir.exists():
+        sys.path.insert(0, str(ingest_dir))
+        break
+
+# Cached embeddings, the vector store and the BM25 index, shared with ingest
+from embeddings import get_embedding, get_embeddings
+from entity_linking import get_player_chunk_index, get_player_name_index
+from ingest_pipeline import timestamp_epoch
+from lexical_index import get_lexical_index, rrf_fuse, RRF_K
+from vector_store import get_vector_store, matches_filter, VECTOR_STORE, INDEX_NAME
+
 # Get configuration from environment
 VECTOR_BUCKET = os.getenv('VECTOR_BUCKET')
 SAGEMAKER_ENDPOINT = os.getenv('SAGEMAKER_ENDPOINT', 'mlbdraftoracle-embedding-endpoint')
-INDEX_NAME = 'draft-research'
+# Fuse BM25 keyword hits with vector hits (exact player names); false = vector search only
+HYBRID_SEARCH = os.getenv('HYBRID_SEARCH', 'true').lower() == 'true'
+# Recency decay: a result's score halves for every N days of age; 0 disables
+KB_RECENCY_HALF_LIFE_DAYS = float(os.getenv('KB_RECENCY_HALF_LIFE_DAYS', '30'))
 
-# Initialize AWS clients
+# Initialize the vector store (S3 Vectors, or local with VECTOR_STORE=local)
 try:
-    s3_vectors = boto3.client('s3vectors')
-    sagemaker_runtime = boto3.client('sagemaker-runtime')
+    vector_store = get_vector_store()
     CLIENTS_AVAILABLE = True
-    print("AWS clients initialized successfully")
+    print(f"Vector store initialized successfully ({VECTOR_STORE})")
 except Exception as e:
-    print(f"Warning: Could not initialize AWS clients: {e}")
+    print(f"Warning: Could not initialize vector store: {e}")
     CLIENTS_AVAILABLE = False
 
 # Initialize FastMCP server
@@ -39,42 +55,164 @@ mcp = FastMCP(
     - Team news and roster changes
     - Historical performance trends
     
-    Use this tool to search for relevant information when making draft decisions."""
+    Use this tool to search for relevant information when making draft decisions.
+    To research several players or topics, use search_knowledgebase_batch with one query each.
+    Recent documents rank higher; narrow results with topic, since/until or max_age_days
+    (e.g. max_age_days=14 for current injury news).
+    For everything known about one player, use get_player_knowledge (player id or name)."""
 )
 
 
-def get_embedding(text: str) -> List[float]:
+MAX_TOP_K = 10
+MAX_BATCH_QUERIES = 10
+MAX_PLAYER_CHUNKS = 50
+
+
+def _unavailable_error() -> Optional[str]:
+    """Error message if the knowledge base can't be searched, else None"""
+    if not CLIENTS_AVAILABLE:
+        return "Knowledge base not available - vector store not initialized"
+    if VECTOR_STORE == 's3' and not VECTOR_BUCKET:
+        return "Knowledge base not configured - VECTOR_BUCKET not set"
+    return None
+
+
+# Candidates taken from each retriever before fusion and re-ranking (S3 Vectors caps topK at 30)
+MAX_CANDIDATES = 30
+
+
+def _format_result(vector: Dict[str, Any], relevance_score: float, matched_by: Optional[List[str]] = None) -> Dict[str, Any]:
+    metadata = vector.get('metadata', {})
+    result = {
+        'relevance_score': round(relevance_score, 3),
+        'content': metadata.get('text', ''),
+        'topic': metadata.get('topic', 'Unknown'),
+        'timestamp': metadata.get('timestamp', 'Unknown'),
+        'id': vector.get('key', '')
+    }
+    if matched_by:
+        result['matched_by'] = matched_by
+    return result
+
+
+def _parse_date(value: str, end_of_day: bool = False) -> float:
+    """Epoch seconds for an ISO date or datetime; with end_of_day a bare date means the end of that day"""
+    epoch = timestamp_epoch(value)
+    if epoch is None:
+        raise ValueError(f"Invalid date {value!r} - expected YYYY-MM-DD or an ISO-8601 datetime")
+    if end_of_day and len(value.strip()) == 10:
+        epoch += 86400
+    return epoch
+
+
+def _build_filter(
+    topic: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    max_age_days: Optional[float] = None,
+) -> Optional[Dict[str, Any]]:
+    """Metadata filter (S3 Vectors syntax) for a topic and a date window on timestamp_epoch"""
+    conditions = []
+    if topic:
+        conditions.append({'topic': {'$eq': topic}})
+    lower_bounds = []
+    if since:
+        lower_bounds.append(_parse_date(since))
+    if max_age_days:
+        lower_bounds.append(time.time() - max_age_days * 86400)
+    if lower_bounds:
+        conditions.append({'timestamp_epoch': {'$gte': max(lower_bounds)}})
+    if until:
+        conditions.append({'timestamp_epoch': {'$lt': _parse_date(until, end_of_day=True)}})
+    if not conditions:
+        return None
+    return conditions[0] if len(conditions) == 1 else {'$and': conditions}
+
+
+def _recency_weight(metadata: Dict[str, Any], half_life_days: float) -> float:
+    """0.5 ** (age / half-life); documents without a parseable timestamp are not penalized"""
+    if not half_life_days:
+        return 1.0
+    epoch = metadata.get('timestamp_epoch')
+    if epoch is None:
+        epoch = timestamp_epoch(metadata.get('timestamp'))
+    if epoch is None:
+        return 1.0
+    age_days = max(0.0, (time.time() - epoch) / 86400)
+    return 0.5 ** (age_days / half_life_days)
+
+
+def _keyword_search(query: str, limit: int) -> List[str]:
+    """BM25 hits' keys, best first; empty if the index is unavailable"""
+    try:
+        return [key for key, _ in get_lexical_index().search(query, limit)]
+    except Exception as e:
+        print(f"Warning: keyword search unavailable: {e}")
+        return []
+
+
+def _search(
+    query: str,
+    query_embedding: List[float],
+    top_k: int,
+    filter: Optional[Dict[str, Any]] = None,
+    half_life_days: float = 0.0,
+) -> List[Dict[str, Any]]:
     """
-    Get embedding vector from SageMaker endpoint.
-    
-    Args:
-        text: The text to embed
-        
-    Returns:
-        List of floats representing the embedding vector
+    Hybrid search: vector and BM25 candidates (both restricted by `filter`)
+    fused by reciprocal rank, so a chunk naming the player ranks first even
+    when its embedding is only a middling match; then re-ranked by recency
+    decay. relevance_score is the fused score scaled to 1.0 for a fresh chunk
+    ranked first by both retrievers (cosine similarity without keyword hits).
     """
-    if not CLIENTS_AVAILABLE:
-        raise Exception("AWS clients not available")
+    candidates = min(max(top_k * 3, 10), MAX_CANDIDATES)
+    vector_hits = vector_store.query_vectors(query_embedding, top_k=candidates, filter=filter)
+    vectors = {vector['key']: vector for vector in vector_hits}
+    keyword_keys = _keyword_search(query, candidates) if HYBRID_SEARCH else []
+    
+    # Keyword-only hits need their metadata (no embedding call) and must pass the same filter
+    missing = [key for key in keyword_keys if key not in vectors]
+    if missing:
+        fetched = {vector['key']: vector for vector in vector_store.get_vectors(missing)}
+        keyword_keys = [
+            key for key in keyword_keys
+            if key in vectors or (key in fetched and matches_filter(fetched[key].get('metadata', {}), filter))
+        ]
+        vectors.update((key, fetched[key]) for key in keyword_keys if key not in vectors)
     
-    response = sagemaker_runtime.invoke_endpoint(
-        EndpointName=SAGEMAKER_ENDPOINT,
-        ContentType='application/json',
-        Body=json.dumps({'inputs': text})
-    )
+    if keyword_keys:
+        keyword_set = set(keyword_keys)
+        ranked = [
+            (key, score * (RRF_K + 1) / 2)
+            for key, score in rrf_fuse([[vector['key'] for vector in vector_hits], keyword_keys])
+        ]
+    else:
+        # Convert distance to similarity
+        ranked = [(vector['key'], 1 - vector.get('distance', 1.0)) for vector in vector_hits]
     
-    result = json.loads(response['Body'].read().decode())
+    scored = []
+    for key, score in ranked:
+        vector = vectors[key]
+        matched_by = None
+        if keyword_keys:
+            matched_by = [name for name, hit in (('vector', 'distance' in vector), ('keyword', key in keyword_set)) if hit]
+        scored.append((score * _recency_weight(vector.get('metadata', {}), half_life_days), vector, matched_by))
     
-    # HuggingFace returns nested array [[[embedding]]], extract the actual embedding
-    if isinstance(result, list) and len(result) > 0:
-        if isinstance(result[0], list) and len(result[0]) > 0:
-            if isinstance(result[0][0], list):
-                return result[0][0]  # Extract from [[[embedding]]]
-            return result[0]  # Extract from [[embedding]]
-    return result  # Return as-is if not nested
+    # Sort by relevance score descending
+    scored.sort(key=lambda item: item[0], reverse=True)
+    return [_format_result(vector, score, matched_by) for score, vector, matched_by in scored[:top_k]]
 
 
 @mcp.tool()
-async def search_knowledgebase(query: str, top_k: int = 5) -> str:
+async def search_knowledgebase(
+    query: str,
+    top_k: int = 5,
+    topic: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    max_age_days: Optional[float] = None,
+    recency_half_life_days: Optional[float] = None,
+) -> str:
     """
     Search the MLB Draft Oracle knowledge base for relevant information.
     
@@ -82,80 +220,225 @@ async def search_knowledgebase(query: str, top_k: int = 5) -> str:
         query: The search query (e.g., "Bryce Harper recent performance", 
                "top catchers 2025", "injury reports pitchers")
         top_k: Number of results to return (default: 5, max: 10)
+        topic: Only documents with exactly this topic (e.g., "Bryce Harper")
+        since: Only documents from this date on (YYYY-MM-DD or ISO-8601)
+        until: Only documents up to this date (inclusive)
+        max_age_days: Only documents at most this many days old
+        recency_half_life_days: Score halves every N days of age (default: 30, 0 = rank by relevance only)
     
     Returns:
         JSON string containing search results with relevance scores and content
     """
-    if not CLIENTS_AVAILABLE:
+    error = _unavailable_error()
+    if error:
         return json.dumps({
-            "error": "Knowledge base not available - AWS clients not initialized",
+            "error": error,
             "results": []
         })
     
-    if not VECTOR_BUCKET:
+    # Validate top_k
+    top_k = min(max(1, top_k), MAX_TOP_K)
+    half_life_days = KB_RECENCY_HALF_LIFE_DAYS if recency_half_life_days is None else max(0.0, recency_half_life_days)
+    
+    try:
+        filter = _build_filter(topic, since, until, max_age_days)
+    except ValueError as e:
         return json.dumps({
-            "error": "Knowledge base not configured - VECTOR_BUCKET not set",
+            "error": str(e),
+            "query": query,
             "results": []
         })
     
-    # Validate top_k
-    top_k = min(max(1, top_k), 10)
-    
     try:
         # Get embedding for query
-        print(f"Searching knowledge base for: {query}")
-        query_embedding = get_embedding(query)
+        print(f"Searching knowledge base for: {query}" + (f" (filter: {filter})" if filter else ""))
+        query_embedding = await asyncio.to_thread(get_embedding, query)
+        
+        # Search the vector store (fused with keyword hits, re-ranked by recency)
+        results = await asyncio.to_thread(_search, query, query_embedding, top_k, filter, half_life_days)
+        
+        return json.dumps({
+            "query": query,
+            "results_count": len(results),
+            "results": results
+        }, indent=2)
         
-        # Search S3 Vectors
-        response = s3_vectors.query_vectors(
-            vectorBucketName=VECTOR_BUCKET,
-            indexName=INDEX_NAME,
-            queryVector={"float32": query_embedding},
-            topK=top_k,
-            returnDistance=True,
-            returnMetadata=True
+    except Exception as e:
+        error_msg = f"Error searching knowledge base: {str(e)}"
+        print(error_msg)
+        import traceback
+        traceback.print_exc()
+        
+        return json.dumps({
+            "error": error_msg,
+            "query": query,
+            "results": []
+        })
+
+
+@mcp.tool()
+async def search_knowledgebase_batch(
+    queries: List[str],
+    top_k: int = 5,
+    topic: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    max_age_days: Optional[float] = None,
+    recency_half_life_days: Optional[float] = None,
+) -> str:
+    """
+    Search the knowledge base for several queries at once (e.g. one per candidate player).
+    Use this instead of calling search_knowledgebase repeatedly.
+    
+    Args:
+        queries: The search queries (max 10), e.g. ["Bryce Harper injury", "Adley Rutschman 2025 outlook"]
+        top_k: Number of results to return per query (default: 5, max: 10)
+        topic, since, until, max_age_days, recency_half_life_days: As for search_knowledgebase,
+            applied to every query
+    
+    Returns:
+        JSON string with one result group per query, in the order given
+    """
+    error = _unavailable_error()
+    if error:
+        return json.dumps({
+            "error": error,
+            "queries": []
+        })
+    
+    queries = [q for q in queries if q and q.strip()][:MAX_BATCH_QUERIES]
+    if not queries:
+        return json.dumps({
+            "error": "No queries given",
+            "queries": []
+        })
+    top_k = min(max(1, top_k), MAX_TOP_K)
+    half_life_days = KB_RECENCY_HALF_LIFE_DAYS if recency_half_life_days is None else max(0.0, recency_half_life_days)
+    
+    try:
+        filter = _build_filter(topic, since, until, max_age_days)
+    except ValueError as e:
+        return json.dumps({
+            "error": str(e),
+            "queries": []
+        })
+    
+    try:
+        # One batched embedding request for every query not already cached
+        print(f"Searching knowledge base for {len(queries)} queries: {queries}")
+        query_embeddings = await asyncio.to_thread(get_embeddings, queries)
+        
+        # Searches run concurrently
+        searches = await asyncio.gather(
+            *(
+                asyncio.to_thread(_search, query, embedding, top_k, filter, half_life_days)
+                for query, embedding in zip(queries, query_embeddings)
+            ),
+            return_exceptions=True
         )
         
-        # Format results
-        results = []
-        for vector in response.get('vectors', []):
-            metadata = vector.get('metadata', {})
-            distance = vector.get('distance', 1.0)
-            similarity_score = 1 - distance  # Convert distance to similarity
-            
-            results.append({
-                'relevance_score': round(similarity_score, 3),
-                'content': metadata.get('text', ''),
-                'topic': metadata.get('topic', 'Unknown'),
-                'timestamp': metadata.get('timestamp', 'Unknown'),
-                'id': vector.get('key', '')
+        groups = []
+        for query, results in zip(queries, searches):
+            if isinstance(results, Exception):
+                groups.append({"query": query, "error": f"Error searching knowledge base: {results}", "results_count": 0, "results": []})
+            else:
+                groups.append({"query": query, "results_count": len(results), "results": results})
+        
+        return json.dumps({
+            "queries_count": len(groups),
+            "queries": groups
+        }, indent=2)
+        
+    except Exception as e:
+        error_msg = f"Error searching knowledge base: {str(e)}"
+        print(error_msg)
+        import traceback
+        traceback.print_exc()
+        
+        return json.dumps({
+            "error": error_msg,
+            "queries": [{"query": query, "results_count": 0, "results": []} for query in queries]
+        })
+
+
+@mcp.tool()
+async def get_player_knowledge(player_id: Optional[int] = None, player_name: Optional[str] = None, limit: int = 20) -> str:
+    """
+    Get every knowledge base entry that mentions a player, newest first.
+    A direct lookup (no similarity search): use it for "everything we know about player X".
+    
+    Args:
+        player_id: MLB player id (preferred, from the player pool)
+        player_name: Full player name, used when no id is given (e.g. "Ronald Acuna Jr.")
+        limit: Maximum number of entries to return (default: 20, max: 50)
+    
+    Returns:
+        JSON string with the player's entries (content, topic, timestamp)
+    """
+    error = _unavailable_error()
+    if error:
+        return json.dumps({
+            "error": error,
+            "results": []
+        })
+    
+    limit = min(max(1, limit), MAX_PLAYER_CHUNKS)
+    
+    try:
+        if player_id is not None:
+            player_ids = [int(player_id)]
+        elif player_name:
+            player_ids = await asyncio.to_thread(lambda: get_player_name_index().lookup(player_name))
+            if not player_ids:
+                return json.dumps({
+                    "error": f"No player named {player_name!r} in the player pool",
+                    "player_name": player_name,
+                    "results": []
+                })
+        else:
+            return json.dumps({
+                "error": "Give player_id or player_name",
+                "results": []
             })
         
-        # Sort by relevance score descending
-        results.sort(key=lambda x: x['relevance_score'], reverse=True)
+        print(f"Looking up knowledge base entries for players {player_ids}")
+        keys = await asyncio.to_thread(get_player_chunk_index().keys, player_ids, limit)
+        vectors = await asyncio.to_thread(vector_store.get_vectors, keys) if keys else []
+        
+        # get_vectors doesn't preserve order; keep the index's newest-first order
+        by_key = {vector['key']: vector for vector in vectors}
+        results = []
+        for key in keys:
+            if key in by_key:
+                result = _format_result(by_key[key], 1.0)
+                del result['relevance_score']
+                results.append(result)
         
         return json.dumps({
-            "query": query,
+            "player_ids": player_ids,
+            "player_name": player_name,
             "results_count": len(results),
             "results": results
         }, indent=2)
         
     except Exception as e:
-        error_msg = f"Error searching knowledge base: {str(e)}"
+        error_msg = f"Error looking up player knowledge: {str(e)}"
         print(error_msg)
         import traceback
         traceback.print_exc()
         
         return json.dumps({
             "error": error_msg,
-            "query": query,
             "results": []
         })
 
 
 if __name__ == "__main__":
     print("Starting MCP knowledge base server...")
+    print(f"Vector Store: {VECTOR_STORE}")
     print(f"Vector Bucket: {VECTOR_BUCKET}")
     print(f"Index Name: {INDEX_NAME}")
+    print(f"Hybrid Search: {HYBRID_SEARCH}")
+    print(f"Recency Half-Life (days): {KB_RECENCY_HALF_LIFE_DAYS}")
     print(f"Clients Available: {CLIENTS_AVAILABLE}")
     mcp.run(transport='stdio')
\ No newline at end of file
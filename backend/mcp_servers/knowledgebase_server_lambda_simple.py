@@ -17,7 +17,7 @@ logger = logging.getLogger(__name__)
 from dotenv import load_dotenv, find_dotenv
 load_dotenv(override=True, dotenv_path=find_dotenv())
 
-from backend.mcp_servers.knowledgebase_server import search_knowledgebase
+from backend.mcp_servers.knowledgebase_server import search_knowledgebase, search_knowledgebase_batch, get_player_knowledge
 
 def handler(event, context):
     """Lambda handler for knowledgebase MCP server"""
@@ -27,24 +27,69 @@ def handler(event, context):
         request_id = event.get('id', 1)
         
         if method == 'tools/list':
-            tools = [{
-                "name": "search_knowledgebase",
-                "description": "Search the MLB Draft Oracle knowledge base",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "query": {"type": "string"},
-                        "top_k": {"type": "integer", "default": 5}
-                    },
-                    "required": ["query"]
+            tools = [
+                {
+                    "name": "search_knowledgebase",
+                    "description": "Search the MLB Draft Oracle knowledge base",
+                    "inputSchema": {
+                        "type": "object",
+                        "properties": {
+                            "query": {"type": "string"},
+                            "top_k": {"type": "integer", "default": 5},
+                            "topic": {"type": "string"},
+                            "since": {"type": "string", "description": "YYYY-MM-DD or ISO-8601"},
+                            "until": {"type": "string", "description": "YYYY-MM-DD or ISO-8601"},
+                            "max_age_days": {"type": "number"},
+                            "recency_half_life_days": {"type": "number"}
+                        },
+                        "required": ["query"]
+                    }
+                },
+                {
+                    "name": "search_knowledgebase_batch",
+                    "description": "Search the MLB Draft Oracle knowledge base for several queries in one call (max 10)",
+                    "inputSchema": {
+                        "type": "object",
+                        "properties": {
+                            "queries": {"type": "array", "items": {"type": "string"}},
+                            "top_k": {"type": "integer", "default": 5},
+                            "topic": {"type": "string"},
+                            "since": {"type": "string", "description": "YYYY-MM-DD or ISO-8601"},
+                            "until": {"type": "string", "description": "YYYY-MM-DD or ISO-8601"},
+                            "max_age_days": {"type": "number"},
+                            "recency_half_life_days": {"type": "number"}
+                        },
+                        "required": ["queries"]
+                    }
+                },
+                {
+                    "name": "get_player_knowledge",
+                    "description": "Get every MLB Draft Oracle knowledge base entry that mentions a player, newest first",
+                    "inputSchema": {
+                        "type": "object",
+                        "properties": {
+                            "player_id": {"type": "integer"},
+                            "player_name": {"type": "string"},
+                            "limit": {"type": "integer", "default": 20}
+                        }
+                    }
                 }
-            }]
+            ]
             return {"jsonrpc": "2.0", "result": {"tools": tools}, "id": request_id}
         
         elif method == 'tools/call':
             import asyncio
+            tool_name = params.get('name', 'search_knowledgebase')
             arguments = params.get('arguments', {})
-            result = asyncio.run(search_knowledgebase(**arguments))
+            
+            if tool_name == 'search_knowledgebase':
+                result = asyncio.run(search_knowledgebase(**arguments))
+            elif tool_name == 'search_knowledgebase_batch':
+                result = asyncio.run(search_knowledgebase_batch(**arguments))
+            elif tool_name == 'get_player_knowledge':
+                result = asyncio.run(get_player_knowledge(**arguments))
+            else:
+                return {"jsonrpc": "2.0", "error": {"code": -32601, "message": f"Unknown tool: {tool_name}"}, "id": request_id}
             return {"jsonrpc": "2.0", "result": result, "id": request_id}
         
         else:
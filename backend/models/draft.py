@@ -12,19 +12,24 @@ from backend.models.draft_teams import DraftTeams
 from backend.models.draft_task import DraftTask
 from backend.models.draft_selection_data import DraftSelectionData
 from backend.models.player_pool import PlayerPool
-from backend.mcp_clients.draft_client import read_team_roster_resource, read_draft_history_resource
-from backend.utils.util import NO_OF_TEAMS, NO_OF_ROUNDS
+from backend.models.draft_views import invalidate_draft_views
+from backend.mcp_clients.draft_client import read_draft_history_resource, read_draft_resources
+from backend.utils.util import DrafterMode, NO_OF_TEAMS, NO_OF_ROUNDS, snake_draft_order
 from backend.draft_agents.draft_name_generator.draft_name_generator_agent import get_draft_name_generator
 from backend.templates.templates import draft_name_generator_message
 # MEMORY STORAGE DISABLED - Using PostgreSQL RDS only
 # from backend.data.memory import save_draft_state, load_draft_state
 from agents import Runner
+import asyncio
 import uuid
 import math
 import os
 
 use_local_db = True
 
+# Default drafter for new drafts: "llm" (researcher + drafter agents) or "heuristic" (no LLM)
+DEFAULT_DRAFTER_MODE = DrafterMode(os.getenv("DRAFTER_MODE", DrafterMode.LLM.value))
+
 class Draft(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid4()))
     name: str = Field(description="Name of the draft.", default="")
@@ -34,6 +39,7 @@ class Draft(BaseModel):
     current_round: int = Field(default=1, description="Current round.")
     current_pick: int = Field(default=1, description="Current pick.")
     is_complete: bool = Field(default=False, description="Is draft complete")
+    drafter_mode: DrafterMode = Field(default=DEFAULT_DRAFTER_MODE, description="Default drafter for teams without their own mode")
 
     @classmethod
     def from_dict(cls, data):
@@ -56,48 +62,27 @@ class Draft(BaseModel):
             teams=teams,
             current_round=data.get("current_round", 1),
             current_pick=data.get("current_pick", 1),
-            is_complete=data.get("is_complete", False)
+            is_complete=data.get("is_complete", False),
+            drafter_mode=data.get("drafter_mode") or DEFAULT_DRAFTER_MODE
         )
     
     @classmethod
     async def get(cls, id: Optional[str]):
-        # Generate draft name first (MOVED OUTSIDE the if block)
-        draft_name_generator_agent = await get_draft_name_generator()
-        message = draft_name_generator_message()
-        result = await Runner.run(draft_name_generator_agent, message)
-        draft_name = result.final_output
         if(id is None):
             id = str(uuid.uuid4())
-            draft_name_generator_agent = await get_draft_name_generator()
-            message = draft_name_generator_message()
-            result = await Runner.run(draft_name_generator_agent, message)
-            draft_name = result.final_output        
 
-        import ast
-        
         # Load from PostgreSQL database only (memory storage disabled)
         fields = read_draft(id.lower())
         
         if not fields:
-            # Initialize teams first
-            teams = await DraftTeams.get(id.lower(), NO_OF_TEAMS)
-            player_pool = await PlayerPool.get(id=None)
-            
-            fields = {
-                "id": id,
-                "name": draft_name,
-                "num_rounds": NO_OF_ROUNDS,
-                "player_pool": player_pool.model_dump(by_alias=True, mode="json"),
-                "teams": teams.model_dump(by_alias=True, mode="json"),
-                "current_round": 1,
-                "current_pick": 1,
-                "is_complete": False
-            }
-            
-            # Save to PostgreSQL database only
-            write_draft(id.lower(), fields)
-            await DraftHistory.get(id.lower())
-        
+            fields = await bootstrap_draft(id)
+
+        return await cls._from_fields(id, fields)
+
+    @classmethod
+    async def _from_fields(cls, id: str, fields: dict):
+        import ast
+
         # Ensure teams is properly loaded from fields
         if fields and 'teams' in fields and fields['teams'] is not None:
             if isinstance(fields['teams'], dict):
@@ -124,12 +109,23 @@ class Draft(BaseModel):
         
         return cls(**fields)
 
+    async def reload(self) -> "Draft":
+        """
+        Refresh this draft in place from the database. Picks made through the
+        draft MCP server save their own copy of the draft, so in-process picks
+        reload first instead of committing over them from stale memory.
+        """
+        fields = read_draft(self.id.lower())
+        if not fields:
+            raise ValueError(f"Draft {self.id} no longer exists")
+        fresh = await Draft._from_fields(self.id, fields)
+        for name in type(self).model_fields:
+            setattr(self, name, getattr(fresh, name))
+        return self
+
     def get_draft_order(self, round_num: int) -> List[Team]:
         """Get the draft order for a specific round. Snake draft: odd rounds use normal order, even rounds reverse."""
-        base_order = self.teams.teams
-        if round_num % 2 == 0:
-            return list(reversed(base_order))
-        return base_order
+        return snake_draft_order(self.teams.teams, round_num)
 
     def get_team_for_pick(self, round_num: int, pick_num: int) -> Team:
         """Get the team that should draft at a specific pick number."""
@@ -171,6 +167,7 @@ class Draft(BaseModel):
         try:
             data = self.model_dump(by_alias=True)
             write_draft(self.id.lower(), data)
+            invalidate_draft_views(self.id)
             logging.info(f"Draft {self.id} saved to PostgreSQL")
         except Exception as e:
             logging.error(f"Error saving draft {self.id}: {e}", exc_info=True)
@@ -201,15 +198,17 @@ class Draft(BaseModel):
             if drafted_position not in needed_positions_set:
                 print(f"Error: Position {drafted_position} already filled.")
                 raise Exception(f"Error: Position {drafted_position} already filled.")
-            
-            # Add to team roster
-            self.roster_player(team, selected_player)
 
-            # Mark player as drafted in player pool
             players_in_pool = [player for player in self.player_pool.players if player.id == selected_player.id]
             if players_in_pool is None or not players_in_pool: 
                 raise Exception(f"Error: Selected player {selected_player.name} does not exist in player pool.")
+            if players_in_pool[0].is_drafted:
+                raise Exception(f"Error: Selected player {selected_player.name} has already been drafted.")
             
+            # Add to team roster
+            self.roster_player(team, selected_player)
+
+            # Mark player as drafted in player pool
             players_in_pool[0].mark_drafted()
             self.player_pool.save()
 
@@ -222,7 +221,7 @@ class Draft(BaseModel):
                 self.is_complete = True
             else:
                 self.current_pick += 1
-                math.ceil(self.current_pick/NO_OF_TEAMS)
+                self.current_round = math.ceil(self.current_pick / len(self.teams.teams))
             
             # Save to PostgreSQL database only (memory storage disabled)
             self.save()
@@ -246,11 +245,13 @@ class Draft(BaseModel):
     async def run_draft(self) -> Tuple[Any, DraftHistory]:
         try:
             for round_num in range(1, self.num_rounds + 1):
+                self.current_round = round_num
                 draft_order = self.get_draft_order(round_num)
                 for team in draft_order:
-                    await team.select_player(self, self.current_round, self.current_pick)
-                    self.current_pick += 1   
-                self.current_round += 1
+                    pick_num = self.current_pick
+                    await team.select_player(self, round_num, pick_num)
+                    # In-process picks (heuristic drafter) already advance current_pick via draft_player
+                    self.current_pick = pick_num + 1
             
             # Print draft history
             import json
@@ -291,9 +292,12 @@ class Draft(BaseModel):
             
             # Print final rosters 
             print("\n=== Final Rosters ===")
-            for team in draft.teams.teams:
+            teams = draft.teams.teams
+            rosters = await read_draft_resources(
+                [f"draft://team_roster/{draft.id.lower()}/{team.name.lower()}" for team in teams]
+            )
+            for team, roster in zip(teams, rosters):
                 print(f"\n{team.name} Roster:")
-                roster = await read_team_roster_resource(draft.id.lower(), team.name.lower())
                 print(roster)
             print(f"\n=== Draft History ===")
             print(history)
@@ -311,4 +315,52 @@ class Draft(BaseModel):
                 logging.error(f"Failed to save draft state after draft.run error: {save_error}", exc_info=True)
             
             print(f"Error running MLB Draft Oracle simulation: {e}")
-            raise
\ No newline at end of file
+            raise
+
+
+async def generate_draft_name() -> str:
+    """Generate a draft name with the draft name generator agent"""
+    draft_name_generator_agent = await get_draft_name_generator()
+    message = draft_name_generator_message()
+    result = await Runner.run(draft_name_generator_agent, message)
+    return result.final_output
+
+
+async def bootstrap_draft(id: str) -> dict:
+    """
+    Create and save a new draft.
+
+    The draft name, the teams (plus their draft history) and the player pool
+    don't depend on each other, so they are built concurrently and
+    time-to-first-pick is bounded by the slowest stage rather than their sum.
+    History items come straight from the team order instead of reloading the draft.
+    """
+    logging.info(f"Bootstrapping new draft {id}")
+
+    async def teams_and_history() -> DraftTeams:
+        teams = await DraftTeams.get(id.lower(), NO_OF_TEAMS)
+        DraftHistory.create(id.lower(), teams.teams, NO_OF_ROUNDS)
+        return teams
+
+    draft_name, teams, player_pool = await asyncio.gather(
+        generate_draft_name(),
+        teams_and_history(),
+        PlayerPool.get(id=None),
+    )
+
+    fields = {
+        "id": id,
+        "name": draft_name,
+        "num_rounds": NO_OF_ROUNDS,
+        "player_pool": player_pool.model_dump(by_alias=True, mode="json"),
+        "teams": teams.model_dump(by_alias=True, mode="json"),
+        "current_round": 1,
+        "current_pick": 1,
+        "is_complete": False,
+        "drafter_mode": DEFAULT_DRAFTER_MODE.value
+    }
+
+    # Save to PostgreSQL database only
+    write_draft(id.lower(), fields)
+    logging.info(f"Draft {id} bootstrapped with {len(teams.teams)} teams and {len(player_pool.players)} players")
+    return fields
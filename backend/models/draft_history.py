@@ -1,6 +1,7 @@
 from typing import List
 from backend.models.players import Player
 from backend.data.postgresql.unified_db import read_draft_history, write_draft_history
+from backend.utils.util import snake_draft_order
 from pydantic import BaseModel, Field
 import logging
 
@@ -34,6 +35,15 @@ class DraftHistory(BaseModel):
             logger.info(f"Initialized draft history for {id} in PostgreSQL RDS")
         return cls(**fields)
 
+    @classmethod
+    def create(cls, id: str, teams: list, num_rounds: int):
+        """Create and save the empty draft history for a new draft directly from its team order."""
+        items = build_draft_history_items(teams, num_rounds)
+        history = cls(draft_id=id.lower(), items=items)
+        history.save()
+        logger.info(f"Initialized draft history for {id} in PostgreSQL RDS")
+        return history
+
     def update_draft_history(self, round: int, pick: int, selection: Player, rationale: str):
         """Update draft history in PostgreSQL RDS"""
         history_item = next((item for item in self.items if item.round == round and item.pick==pick), None)
@@ -53,18 +63,22 @@ class DraftHistory(BaseModel):
         logger.debug(f"Saved draft history for {self.draft_id} to PostgreSQL RDS")
 
 
-async def initialize_draft_history_items(id: str) -> List[DraftHistoryItem]:
-    """Initialize draft history items for a new draft"""
-    from backend.models.draft import Draft
-    draft = await Draft.get(id.lower())
+def build_draft_history_items(teams: list, num_rounds: int) -> List[DraftHistoryItem]:
+    """Build empty history items (one per pick) from the base team order."""
     items = []
     current_pick = 1
 
-    for round_num in range(1, draft.num_rounds + 1):
-        draft_order = draft.get_draft_order(round_num)
-        for team in draft_order:
+    for round_num in range(1, num_rounds + 1):
+        for team in snake_draft_order(teams, round_num):
             items.append(DraftHistoryItem(round=round_num, pick=current_pick, team=team.name, selection="", rationale=""))
             current_pick+=1
-    
+    return items
+
+
+async def initialize_draft_history_items(id: str) -> List[DraftHistoryItem]:
+    """Initialize draft history items for an existing draft that has no history yet"""
+    from backend.models.draft import Draft
+    draft = await Draft.get(id.lower())
+    items = build_draft_history_items(draft.teams.teams, draft.num_rounds)
     logger.info(f"Initialized {len(items)} draft history items for draft {id}")
     return items
\ No newline at end of file
@@ -0,0 +1,267 @@
+"""
+Read-only projections of a draft for the draft MCP resources.
+
+Each view reads only the slice of the draft document it needs (teams or
+player pool) instead of materializing the whole Draft, and is cached
+in-process until the draft is written again (Draft.save) or the entry expires.
+Picks made by another process (the app committing in-process picks while the
+draft MCP server serves reads) are caught by comparing the draft's pick
+counters, read on every call, with the ones the cached views were built from.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+import base64
+import bisect
+import json
+import logging
+import math
+import os
+from backend.data.postgresql.unified_db import read_draft_field, read_draft_version
+from backend.models.player_stats import PlayerStatistics
+from backend.utils.util import snake_draft_order
+from backend.utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Expiry bounds staleness for other processes' writes that aren't picks; picks and same-process writes invalidate immediately
+DRAFT_VIEW_CACHE_TTL_SECONDS = float(os.getenv("DRAFT_VIEW_CACHE_TTL_SECONDS", "5"))
+
+_view_cache = TTLCache(maxsize=512, ttl=DRAFT_VIEW_CACHE_TTL_SECONDS)
+
+
+def invalidate_draft_views(draft_id: str):
+    """Drop every cached view of a draft; call after the draft is written."""
+    draft_id = draft_id.lower()
+    removed = _view_cache.invalidate(lambda key: key[0] == draft_id)
+    if removed:
+        logger.debug(f"Invalidated {removed} cached views for draft {draft_id}")
+
+
+def _check_draft_version(draft_id: str):
+    """Drop a draft's cached views if a pick was made (in any process) since they were cached."""
+    draft_id = draft_id.lower()
+    version = read_draft_version(draft_id)
+    key = (draft_id, "version")
+    if _view_cache.get(key) != version:
+        invalidate_draft_views(draft_id)
+        _view_cache.set(key, version)
+
+
+def _cached_field(draft_id: str, *path: str) -> Optional[Any]:
+    _check_draft_version(draft_id)
+    key = (draft_id.lower(), "field") + path
+    value = _view_cache.get(key)
+    if value is None:
+        value = read_draft_field(draft_id, *path)
+        if value is not None:
+            _view_cache.set(key, value)
+    return value
+
+
+def get_draft_teams_view(draft_id: str) -> Optional[List[Dict[str, Any]]]:
+    """Teams of a draft (in base draft order) as stored, or None if the draft doesn't exist."""
+    return _cached_field(draft_id, "teams", "teams")
+
+
+def get_team_roster_view(draft_id: str, team_name: str) -> Optional[Dict[str, Any]]:
+    """Roster ({position: player or None}) of one team, or None if the draft or team doesn't exist."""
+    teams = get_draft_teams_view(draft_id)
+    if teams is None:
+        return None
+    team = next((t for t in teams if t.get("name", "").lower() == team_name.lower()), None)
+    return team.get("roster", {}) if team else None
+
+
+def get_draft_order_view(draft_id: str, round_num: int) -> Optional[List[Dict[str, Any]]]:
+    """Team names and strategies in pick order for a round."""
+    teams = get_draft_teams_view(draft_id)
+    if teams is None:
+        return None
+    return [{"name": t.get("name"), "strategy": t.get("strategy")} for t in snake_draft_order(teams, round_num)]
+
+
+def get_player_pool_view(draft_id: str) -> Optional[Dict[str, Any]]:
+    """The draft's player pool as stored, or None if the draft doesn't exist."""
+    return _cached_field(draft_id, "player_pool")
+
+
+def get_available_players_view(draft_id: str) -> Optional[List[Dict[str, Any]]]:
+    """Undrafted players of the draft's pool."""
+    pool = get_player_pool_view(draft_id)
+    if pool is None:
+        return None
+    return [p for p in pool.get("players", []) if not p.get("is_drafted")]
+
+
+# ============================================================================
+# AVAILABLE PLAYERS PAGES
+# ============================================================================
+
+TEXT_SORT_KEYS = {"name", "position", "team"}
+STAT_SORT_KEYS = set(PlayerStatistics.model_fields)
+# Rate stats where lower is better sort ascending by default; other stats sort best (highest) first
+ASCENDING_STATS = {"era", "whip"}
+DEFAULT_PAGE_SIZE = 25
+MAX_PAGE_SIZE = 100
+
+
+def _stat_number(value) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _sort_key(player: Dict[str, Any], sort_by: str, descending: bool) -> tuple:
+    """Total order for keyset pagination: (missing last, value, player id)."""
+    if sort_by in TEXT_SORT_KEYS:
+        return (0, str(player.get(sort_by) or "").lower(), player.get("id", 0))
+    value = _stat_number((player.get("stats") or {}).get(sort_by))
+    if value is None:
+        return (1, 0.0, player.get("id", 0))
+    return (0, -value if descending else value, player.get("id", 0))
+
+
+def encode_cursor(key: tuple) -> str:
+    return base64.urlsafe_b64encode(json.dumps(list(key)).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple:
+    try:
+        return tuple(json.loads(base64.urlsafe_b64decode(cursor.encode()).decode()))
+    except Exception:
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+
+def _available_players_index(draft_id: str, positions: Tuple[str, ...], sort_by: str, descending: bool) -> Optional[Tuple[List[tuple], List[Dict[str, Any]]]]:
+    """Sorted (keys, players) of available players for a filter/sort, cached with the draft's other views."""
+    _check_draft_version(draft_id)
+    cache_key = (draft_id.lower(), "available_index", positions, sort_by, descending)
+    index = _view_cache.get(cache_key)
+    if index is None:
+        available = get_available_players_view(draft_id)
+        if available is None:
+            return None
+        if positions:
+            available = [p for p in available if p.get("position") in positions]
+        ranked = sorted(((_sort_key(p, sort_by, descending), p) for p in available), key=lambda kp: kp[0])
+        index = ([k for k, _ in ranked], [p for _, p in ranked])
+        _view_cache.set(cache_key, index)
+    return index
+
+
+def get_available_players_page(draft_id: str, position: Optional[str] = None, sort_by: str = "name", order: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    One page of undrafted players.
+
+    Args:
+        position: Comma-separated positions to include (e.g. "P,OF"); all positions when empty
+        sort_by: "name", "position", "team" or a PlayerStatistics field (e.g. "hr", "era")
+        order: "asc" or "desc"; stats default to best first, text fields only sort ascending
+        limit: Page size (1-100)
+        cursor: next_cursor from the previous page
+
+    Returns:
+        {"players", "next_cursor", "total", "limit", "sort_by", "order"}, or None if the draft doesn't exist.
+
+    Raises:
+        ValueError: For an unknown sort key, order or an invalid cursor.
+    """
+    if sort_by not in TEXT_SORT_KEYS and sort_by not in STAT_SORT_KEYS:
+        raise ValueError(f"Unknown sort key '{sort_by}'. Use one of: {', '.join(sorted(TEXT_SORT_KEYS | STAT_SORT_KEYS))}")
+    if order not in (None, "asc", "desc"):
+        raise ValueError(f"Unknown order '{order}'. Use 'asc' or 'desc'.")
+    if sort_by in TEXT_SORT_KEYS:
+        if order == "desc":
+            raise ValueError(f"Sorting by {sort_by} only supports ascending order")
+        order = "asc"
+    elif order is None:
+        order = "asc" if sort_by in ASCENDING_STATS else "desc"
+    limit = max(1, min(int(limit or DEFAULT_PAGE_SIZE), MAX_PAGE_SIZE))
+    positions = tuple(sorted({p.strip() for p in (position or "").split(",") if p.strip()}))
+
+    index = _available_players_index(draft_id, positions, sort_by, order == "desc")
+    if index is None:
+        return None
+    keys, players = index
+
+    # Keyset pagination: players drafted between pages don't shift later pages
+    start = bisect.bisect_right(keys, decode_cursor(cursor)) if cursor else 0
+    page = players[start:start + limit]
+    end = start + len(page)
+    return {
+        "players": page,
+        "next_cursor": encode_cursor(keys[end - 1]) if page and end < len(keys) else None,
+        "total": len(players),
+        "limit": limit,
+        "sort_by": sort_by,
+        "order": order,
+    }
+
+
+# ============================================================================
+# PICK CONTEXT
+# ============================================================================
+
+CONTEXT_SHORTLIST_SIZE = 10
+CONTEXT_RECENT_PICKS = 5
+
+
+def get_draft_context_view(draft_id: str, team_name: str, shortlist_size: int = CONTEXT_SHORTLIST_SIZE, recent_picks: int = CONTEXT_RECENT_PICKS) -> Optional[Dict[str, Any]]:
+    """
+    Everything a team needs to make its next pick, from one read of the draft
+    (plus its history): roster, needed positions, a ranked shortlist of
+    available players for the team's strategy, this round's order and recent picks.
+
+    Returns:
+        The context dict, or None if the draft or team doesn't exist.
+    """
+    _check_draft_version(draft_id)
+    cache_key = (draft_id.lower(), "context", team_name.lower(), shortlist_size, recent_picks)
+    context = _view_cache.get(cache_key)
+    if context is not None:
+        return context
+
+    from backend.data.postgresql.unified_db import read_draft, read_draft_history
+    from backend.models.players import Player
+    from backend.draft_agents.heuristic_drafter.heuristic_drafter import rank_players
+
+    fields = read_draft(draft_id.lower())
+    if not fields:
+        return None
+    teams = (fields.get("teams") or {}).get("teams") or []
+    team = next((t for t in teams if t.get("name", "").lower() == team_name.lower()), None)
+    if team is None:
+        return None
+
+    roster = team.get("roster", {})
+    needed_positions = sorted(pos for pos, player in roster.items() if player is None)
+    available = [p for p in (fields.get("player_pool") or {}).get("players", []) if not p.get("is_drafted")]
+    ranked = rank_players([Player.from_dict(p) for p in available], needed_positions, team.get("strategy"))
+
+    current_pick = fields.get("current_pick", 1)
+    # Derived rather than read: drafts saved before draft_player persisted the round still say round 1
+    current_round = math.ceil(current_pick / len(teams)) if teams else fields.get("current_round", 1)
+    round_order = [t.get("name") for t in snake_draft_order(teams, current_round)]
+
+    history = read_draft_history(draft_id.lower()) or {}
+    made_picks = [item for item in history.get("items", []) if item.get("selection")]
+
+    context = {
+        "draft_id": draft_id.lower(),
+        "team_name": team.get("name"),
+        "strategy": team.get("strategy"),
+        "round": current_round,
+        "pick": current_pick,
+        "is_complete": fields.get("is_complete", False),
+        "roster": roster,
+        "needed_positions": needed_positions,
+        "available_count": len(available),
+        "candidates": [
+            {"id": p.id, "name": p.name, "position": p.position, "team": p.team, "score": score, "stats": p.stats.model_dump()}
+            for p, score in ranked[:shortlist_size]
+        ],
+        "draft_order": round_order,
+        "recent_picks": made_picks[-recent_picks:] if recent_picks else [],
+    }
+    _view_cache.set(cache_key, context)
+    return context
@@ -7,6 +7,7 @@ from backend.utils.util import outfield_postion_set, pitcher_position_set, hitte
 from backend.data.postgresql.unified_db import read_player_pool, write_player_pool, get_latest_player_pool, player_pool_exists
 from uuid import uuid4
 import uuid
+import asyncio
 import socket
 import time
 from functools import wraps
@@ -147,7 +148,8 @@ async def initialize_player_pool(id: str) -> PlayerPool:
     season = 2025
     
     try:
-        names_set = await get_players_from_statsapi(names_set=set(), season=season)
+        # statsapi is blocking; run it off the event loop so draft bootstrap stages overlap
+        names_set = await asyncio.to_thread(get_players_from_statsapi, names_set=set(), season=season)
         
         if not names_set:
             logger.warning("No player names fetched from MLB Stats API")
@@ -171,7 +173,8 @@ async def initialize_player_pool(id: str) -> PlayerPool:
     }
     
     # Add players to pool
-    await add_to_player_pool(
+    await asyncio.to_thread(
+        add_to_player_pool,
         names_set=names_set, 
         player_pool=player_pool, 
         player_position_count_map=player_position_count_map, 
@@ -185,7 +188,7 @@ async def initialize_player_pool(id: str) -> PlayerPool:
     return PlayerPool(id=id, players=player_pool)
 
 
-async def add_to_player_pool(names_set: set, player_pool: list, player_position_count_map: dict, season: int):
+def add_to_player_pool(names_set: set, player_pool: list, player_position_count_map: dict, season: int):
     """
     Add players to the pool by fetching their stats from MLB Stats API.
     Each player is saved to PostgreSQL RDS individually.
@@ -350,7 +353,7 @@ async def add_to_player_pool(names_set: set, player_pool: list, player_position_
     logger.info(f"Successfully processed and saved {processed} players to PostgreSQL RDS")
 
 
-async def get_players_from_statsapi(names_set: set, season: int) -> set:
+def get_players_from_statsapi(names_set: set, season: int) -> set:
     """
     Fetch player names from MLB Stats API leader boards.
     
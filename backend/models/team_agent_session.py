@@ -0,0 +1,66 @@
+from typing import List, Optional
+from backend.models.players import Player
+from backend.data.postgresql.unified_db import read_agent_session, write_agent_session
+from pydantic import BaseModel, Field
+import logging
+
+logger = logging.getLogger(__name__)
+
+RESEARCHER_ROLE = "researcher"
+DRAFTER_ROLE = "drafter"
+
+
+class TeamAgentSession(BaseModel):
+    """
+    Conversation state a team's agents carry across picks in one draft.
+
+    The agents chain onto their previous response (Responses API
+    previous_response_id), so after the first pick only the changes since
+    the team's last pick need to be sent.
+    """
+    draft_id: str = Field(description="Id of the draft.")
+    team_name: str = Field(description="Name of the team.")
+    response_ids: dict[str, str] = Field(default_factory=dict, description="Last response id per agent role.")
+    seen_drafted_player_ids: List[int] = Field(default_factory=list, description="Players already reported as drafted to the agents.")
+    last_round: int = Field(default=0, description="Round of the team's last pick in this session.")
+    last_pick: int = Field(default=0, description="Overall pick number of the team's last pick in this session.")
+
+    @staticmethod
+    def session_id(draft_id: str, team_name: str) -> str:
+        return f"{draft_id.lower()}:{team_name.lower()}"
+
+    @classmethod
+    def get(cls, draft_id: str, team_name: str) -> "TeamAgentSession":
+        """Load the team's session for a draft, or start a new one"""
+        fields = read_agent_session(cls.session_id(draft_id, team_name))
+        if not fields:
+            logger.info(f"Starting new agent session for {team_name} in draft {draft_id}")
+            return cls(draft_id=draft_id.lower(), team_name=team_name)
+        return cls(**fields)
+
+    def get_response_id(self, role: str) -> Optional[str]:
+        return self.response_ids.get(role)
+
+    def set_response_id(self, role: str, response_id: Optional[str]):
+        if response_id:
+            self.response_ids[role] = response_id
+        else:
+            self.response_ids.pop(role, None)
+
+    def drafted_since_last_pick(self, draft) -> List[Player]:
+        """Players drafted (by any team) that the agents have not been told about yet."""
+        if not draft.player_pool:
+            return []
+        seen = set(self.seen_drafted_player_ids)
+        return [p for p in draft.player_pool.players if p.is_drafted and p.id not in seen]
+
+    def record_pick(self, draft, round: int, pick: int):
+        """Mark the current pool state as known to the agents."""
+        if draft.player_pool:
+            self.seen_drafted_player_ids = [p.id for p in draft.player_pool.players if p.is_drafted]
+        self.last_round = round
+        self.last_pick = pick
+
+    def save(self):
+        write_agent_session(self.session_id(self.draft_id, self.team_name), self.model_dump(mode="json"))
+        logger.debug(f"Saved agent session for {self.team_name} in draft {self.draft_id}")
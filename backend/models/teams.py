@@ -1,13 +1,15 @@
 from typing import Dict, List, Optional
 import json
 from pydantic import BaseModel, Field
-from backend.utils.util import Position, NO_OF_TEAMS, NO_OF_ROUNDS
+from backend.utils.util import Position, DrafterMode, NO_OF_TEAMS, NO_OF_ROUNDS
 from backend.models.players import Player
 from backend.data.postgresql.unified_db import write_team, read_team
 from agents import FunctionTool, Agent, Runner, trace
-from contextlib import AsyncExitStack
-from backend.templates.templates import team_input, drafter_agent_instructions, researcher_agent_instructions
-from backend.mcp_clients.draft_client import get_draft_tools, read_team_roster_resource, read_draft_player_pool_available_resource
+from backend.templates.templates import team_input, drafter_agent_instructions, researcher_agent_instructions, structured_drafter_agent_instructions, agent_session_instructions, agent_session_update_message
+from backend.models.draft_selection_data import DraftSelectionData
+from backend.models.team_agent_session import TeamAgentSession, RESEARCHER_ROLE, DRAFTER_ROLE
+from backend.mcp_clients.draft_client import get_draft_tools, read_team_roster_resource, read_draft_player_pool_available_resource, read_draft_context_resource
+from backend.utils.pick_deadline import PickDeadline, run_with_budget
 import math
 import logging
 import asyncio
@@ -18,6 +20,23 @@ logger = logging.getLogger(__name__)
 RESEARCHER_MAX_TURNS = 30
 DRAFTER_MAX_TURNS = 100
 
+# Wall-clock budgets (seconds). The whole pick must finish well inside the 15 minute async Lambda timeout.
+PICK_TIMEOUT_SECONDS = float(os.getenv("PICK_TIMEOUT_SECONDS", "600"))
+RESEARCHER_TIMEOUT_SECONDS = float(os.getenv("RESEARCHER_TIMEOUT_SECONDS", "180"))
+DRAFTER_TIMEOUT_SECONDS = float(os.getenv("DRAFTER_TIMEOUT_SECONDS", "300"))
+# Structured-output drafter: the agent returns its pick and the worker commits it locally
+STRUCTURED_DRAFTER_MAX_TURNS = 3
+STRUCTURED_DRAFTER_MAX_ATTEMPTS = 3
+# Draft with the heuristic drafter when the drafter agent runs out of time
+HEURISTIC_FALLBACK = os.getenv("HEURISTIC_FALLBACK", "true").lower() == "true"
+# Continue each team's agent conversations across picks, sending only what changed since the last pick
+AGENT_SESSION_REUSE = os.getenv("AGENT_SESSION_REUSE", "false").lower() == "true"
+
+NO_RESEARCH_MESSAGE = (
+    "No research is available for this pick (the researcher ran out of time). "
+    "Choose the best player from the available players list for the needed positions and strategy."
+)
+
 # Detect if running in Lambda environment
 IS_LAMBDA = os.path.exists("/var/task") or os.getenv("AWS_LAMBDA_FUNCTION_NAME")
 
@@ -35,6 +54,7 @@ class Team(BaseModel):
     strategy: str = Field(description="Strategy of the team")
     roster: Dict[str, Optional[Player]] = Field(description="team's roster of positions and player drafted for respective position ")
     drafted_players: List[Player] = Field(description="List of players drafted by team")
+    drafter_mode: Optional[DrafterMode] = Field(default=None, description="Drafter used for this team's picks. Falls back to the draft's mode when unset.")
 
     @classmethod
     def from_dict(cls, data):
@@ -48,7 +68,8 @@ class Team(BaseModel):
             name=data["name"],
             strategy=data["strategy"],
             roster=roster,
-            drafted_players=drafted_players
+            drafted_players=drafted_players,
+            drafter_mode=data.get("drafter_mode")
         )
 
     @classmethod
@@ -108,17 +129,293 @@ class Team(BaseModel):
         )
         return self._agent
 
+    def _get_draft_team(self, draft) -> "Team":
+        """Return this team's entry in the draft (the source of truth for roster, strategy and mode)."""
+        draft_team = next((t for t in draft.teams.teams if t.name.lower() == self.name.lower()), None)
+        if draft_team is None:
+            raise ValueError(f"Team {self.name} not found in draft {draft.id}.")
+        return draft_team
+
+    def get_drafter_mode(self, draft) -> DrafterMode:
+        """Team-level drafter mode if set, otherwise the draft's."""
+        draft_team = self._get_draft_team(draft)
+        return draft_team.drafter_mode or self.drafter_mode or draft.drafter_mode
+
+    async def _commit_pick(self, draft, round: int, pick: int, selected_player: Player, rationale: str) -> str:
+        """Commit a pick chosen in this process directly against the loaded draft (no MCP hop)."""
+        draft_team = self._get_draft_team(draft)
+        result = await draft.draft_player(
+            team=draft_team,
+            round=round,
+            pick=pick,
+            selected_player=selected_player,
+            rationale=rationale
+        )
+        logger.info(f"[_commit_pick] ✓ Team {draft_team.name} drafted {result.player_name} (ID: {result.player_id})")
+        return f"Successfully drafted {result.player_name} for {draft_team.name}. {rationale}"
+
+    async def select_player_heuristic(self, draft, round: int, pick: int) -> str:
+        """Draft the best available player for the team's needs and strategy without any LLM calls."""
+        from backend.draft_agents.heuristic_drafter.heuristic_drafter import select_heuristic_player
+
+        # Earlier picks may have been committed by the draft MCP server
+        await draft.reload()
+        draft_team = self._get_draft_team(draft)
+        needed_positions = draft_team.get_needed_positions()
+        logger.info(f"[select_player_heuristic] Team {draft_team.name} needs {needed_positions}")
+
+        selection = select_heuristic_player(draft.get_undrafted_players(), needed_positions, draft_team.strategy)
+        if selection is None:
+            error_msg = (
+                f"DRAFT FAILED for {self.name} at Round {round}, Pick {pick}. "
+                f"No available players for needed positions {needed_positions}."
+            )
+            logger.error(f"[select_player_heuristic] {error_msg}")
+            raise Exception(error_msg)
+
+        selected_player, rationale = selection
+        return await self._commit_pick(draft, round, pick, selected_player, rationale)
+
+    async def _read_pick_context(self, draft) -> Optional[dict]:
+        """One-shot pick context from the draft MCP server, or None if it can't be read."""
+        try:
+            context_json = await read_draft_context_resource(draft.id.lower(), self.name)
+            context = json.loads(context_json) if isinstance(context_json, str) else context_json
+        except Exception as e:
+            logger.warning(f"[_read_pick_context] Could not read pick context for {self.name}: {e}")
+            return None
+        if not isinstance(context, dict) or "error" in context:
+            logger.warning(f"[_read_pick_context] Pick context unavailable for {self.name}: {context}")
+            return None
+        return context
+
+    def _create_structured_drafter(self, instructions: str) -> Agent:
+        """Drafter that returns its pick as DraftSelectionData instead of calling draft_specific_player."""
+        logger.info("[_create_structured_drafter] Creating structured-output Drafter agent (no tools)")
+        return Agent(
+            name="Drafter",
+            instructions=instructions,
+            model="gpt-41-mini",
+            output_type=DraftSelectionData,
+        )
+
+    def _validate_pick_decision(self, draft, decision: DraftSelectionData):
+        """
+        Resolve a structured pick to an available player at a needed position.
+
+        Returns:
+            (player, None) if the pick is valid, otherwise (None, error message).
+        """
+        available_players = draft.get_undrafted_players()
+        player = next((p for p in available_players if p.id == decision.player_id), None)
+        if player is None:
+            player = next((p for p in available_players if p.name.lower() == decision.player_name.lower()), None)
+        if player is None:
+            return None, f"Player '{decision.player_name}' (ID: {decision.player_id}) is not in the available players list."
+
+        needed_positions = self._get_draft_team(draft).get_needed_positions()
+        if player.position not in needed_positions:
+            return None, f"Position {player.position} is already filled. Needed positions: {', '.join(sorted(needed_positions))}."
+        return player, None
+
+    async def _run_agent(self, agent: Agent, role: str, input: str, team_context: TeamContext, max_turns: int, deadline: PickDeadline, stage_seconds: float, stage: str, session: Optional[TeamAgentSession] = None, session_input: Optional[str] = None):
+        """
+        Run one agent stage within its time budget.
+
+        With a session that already has a conversation for this role, the agent
+        continues it and only `session_input` (the changes since the last pick) is
+        sent. Otherwise - or if the previous response can no longer be continued -
+        the full `input` starts a new conversation.
+
+        Returns:
+            The run result, or None if the stage timed out.
+        """
+        previous_response_id = session.get_response_id(role) if session and session_input else None
+
+        def run(run_input: str, previous_id: Optional[str]):
+            return Runner.run(
+                starting_agent=agent,
+                input=run_input,
+                context=team_context,
+                max_turns=max_turns,
+                previous_response_id=previous_id
+            )
+
+        if previous_response_id:
+            logger.info(f"[_run_agent] Continuing {role} session for {self.name} from {previous_response_id}")
+            try:
+                result = await run_with_budget(run(session_input, previous_response_id), timeout=deadline.budget(stage_seconds), stage=stage)
+            except Exception as e:
+                logger.warning(f"[_run_agent] Could not continue {role} session for {self.name} ({e}) - resending full context")
+                session.set_response_id(role, None)
+                result = await run_with_budget(run(input, None), timeout=deadline.budget(stage_seconds), stage=stage)
+        else:
+            result = await run_with_budget(run(input, None), timeout=deadline.budget(stage_seconds), stage=stage)
+
+        if session and result is not None:
+            session.set_response_id(role, result.last_response_id)
+        return result
+
+    async def _run_structured_drafter(self, draft, round: int, pick: int, drafter_agent: Agent, research: str, team_context: TeamContext, deadline: PickDeadline, session: Optional[TeamAgentSession] = None, drafter_message: str = "", session_update: Optional[str] = None) -> str:
+        """Ask the drafter for a typed pick, validate it locally and commit it without an MCP round trip."""
+        drafter_deadline = PickDeadline(deadline.budget(DRAFTER_TIMEOUT_SECONDS))
+        research_input = f"Researcher recommendations: {research}"
+        # With a session the drafter's instructions are generic, so a new conversation starts with the full briefing
+        drafter_input = f"{drafter_message}\n\n{research_input}" if session else research_input
+        session_input = f"{session_update}\n\n{research_input}" if session_update else None
+        last_error = "Drafter timed out"
+
+        for attempt in range(1, STRUCTURED_DRAFTER_MAX_ATTEMPTS + 1):
+            logger.info(f"[_run_structured_drafter] ===== RUNNING STRUCTURED DRAFTER (attempt {attempt}) =====")
+            drafter_result = await self._run_agent(
+                drafter_agent, DRAFTER_ROLE, drafter_input, team_context,
+                max_turns=STRUCTURED_DRAFTER_MAX_TURNS,
+                deadline=drafter_deadline,
+                stage_seconds=DRAFTER_TIMEOUT_SECONDS,
+                stage=f"Structured drafter for {self.name}",
+                session=session,
+                session_input=session_input
+            )
+            if drafter_result is None:
+                last_error = "Drafter timed out"
+                break
+
+            decision = drafter_result.final_output
+            logger.info(f"[_run_structured_drafter] Decision: {decision}")
+            await draft.reload()
+            selected_player, last_error = self._validate_pick_decision(draft, decision)
+            if selected_player:
+                return await self._commit_pick(draft, round, pick, selected_player, decision.reason)
+
+            logger.warning(f"[_run_structured_drafter] Rejected pick: {last_error}")
+            rejection = f"Your previous pick was rejected: {last_error} Choose a different player from the available players list."
+            drafter_input = f"{drafter_input}\n\n{rejection}"
+            # The session now holds the rejected attempt, so only the feedback needs to be sent
+            session_input = rejection if session else None
+
+        if HEURISTIC_FALLBACK:
+            logger.warning(f"[_run_structured_drafter] No valid pick ({last_error}) - falling back to heuristic pick")
+            return await self.select_player_heuristic(draft, round, pick)
+
+        error_msg = f"DRAFT FAILED for {self.name} at Round {round}, Pick {pick}. {last_error}"
+        logger.error(f"[_run_structured_drafter] {error_msg}")
+        raise Exception(error_msg)
+
+    async def _run_pick_agents(self, draft, round: int, pick: int, roster: dict, researcher_agent: Agent, researcher_message: str, drafter_agent: Agent, team_context: TeamContext, deadline: PickDeadline, structured: bool = False, session: Optional[TeamAgentSession] = None, drafter_message: str = "", session_update: Optional[str] = None) -> str:
+        """
+        Run researcher then drafter, each within its own time budget.
+
+        A researcher overrun degrades to drafting without research; a drafter
+        overrun degrades to the heuristic pick (if enabled). With a session,
+        both agents continue the team's conversations from earlier picks and
+        only receive `session_update`.
+        """
+        logger.info("[_run_pick_agents] ===== RUNNING RESEARCHER AGENT =====")
+        researcher_result = await self._run_agent(
+            researcher_agent, RESEARCHER_ROLE, researcher_message, team_context,
+            max_turns=RESEARCHER_MAX_TURNS,
+            deadline=deadline,
+            stage_seconds=RESEARCHER_TIMEOUT_SECONDS,
+            stage=f"Researcher for {self.name}",
+            session=session,
+            session_input=session_update
+        )
+        if researcher_result is not None:
+            research = researcher_result.final_output
+            logger.info(f"[_run_pick_agents] Researcher output: {research}")
+        else:
+            research = NO_RESEARCH_MESSAGE
+            logger.warning("[_run_pick_agents] Researcher timed out - drafting without research")
+
+        if structured:
+            return await self._run_structured_drafter(draft, round, pick, drafter_agent, research, team_context, deadline, session, drafter_message, session_update)
+
+        logger.info("[_run_pick_agents] ===== RUNNING DRAFTER AGENT =====")
+        research_input = f"Researcher recommendations: {research}"
+        drafter_result = await self._run_agent(
+            drafter_agent, DRAFTER_ROLE,
+            f"{drafter_message}\n\n{research_input}" if session else research_input,
+            team_context,
+            max_turns=DRAFTER_MAX_TURNS,
+            deadline=deadline,
+            stage_seconds=DRAFTER_TIMEOUT_SECONDS,
+            stage=f"Drafter for {self.name}",
+            session=session,
+            session_input=f"{session_update}\n\n{research_input}" if session_update else None
+        )
+        drafter_output = drafter_result.final_output if drafter_result is not None else "Drafter timed out"
+
+        # ====================================================================
+        # CHECK IF DRAFT WAS SUCCESSFUL BY COMPARING ROSTER SIZE
+        # ====================================================================
+        logger.info("[_run_pick_agents] Checking if draft was successful...")
+        roster_before_count = len([v for v in roster.values() if v is not None]) if roster else 0
+        logger.info(f"[_run_pick_agents] Roster count before draft: {roster_before_count}")
+
+        roster_with_selected_player = await read_team_roster_resource(draft.id.lower(), self.name.lower())
+        try:
+            roster_after = json.loads(roster_with_selected_player) if isinstance(roster_with_selected_player, str) else roster_with_selected_player
+            roster_after_count = len([v for v in roster_after.values() if v is not None]) if roster_after else 0
+            logger.info(f"[_run_pick_agents] Roster count after draft: {roster_after_count}")
+        except Exception as e:
+            logger.error(f"[_run_pick_agents] Error parsing roster after draft: {e}")
+            roster_after_count = roster_before_count  # Assume no change if error
+
+        if roster_after_count <= roster_before_count:
+            if drafter_result is None and HEURISTIC_FALLBACK:
+                # The cancelled drafter may have committed its pick after the roster read
+                await draft.reload()
+                roster_now_count = len([v for v in self._get_draft_team(draft).roster.values() if v is not None])
+                if draft.current_pick != pick or roster_now_count > roster_before_count:
+                    logger.warning(f"[_run_pick_agents] Drafter timed out after {deadline.elapsed():.0f}s but its pick was committed - skipping heuristic pick")
+                    return str(drafter_output)
+                logger.warning(f"[_run_pick_agents] Drafter timed out after {deadline.elapsed():.0f}s - falling back to heuristic pick")
+                return await self.select_player_heuristic(draft, round, pick)
+
+            # NO PLAYER WAS DRAFTED - ALL ATTEMPTS FAILED
+            error_msg = (
+                f"DRAFT FAILED for {self.name} at Round {round}, Pick {pick}. "
+                f"Agent attempted to draft players but all attempts failed. "
+                f"Drafter output: {drafter_output}"
+            )
+            logger.error(f"[_run_pick_agents] {error_msg}")
+            raise Exception(error_msg)
+
+        # Success - player was drafted
+        logger.info(f"[_run_pick_agents] ✓ Draft successful in {deadline.elapsed():.0f}s! Team {self.name} roster updated")
+        logger.info(f"[_run_pick_agents] Roster after: {roster_with_selected_player}")
+        logger.info(f"[_run_pick_agents] Drafter output: {drafter_output}")
+        return str(drafter_output)
+
     async def select_player(self, draft, round: int, pick: int) -> str:
         """Select player for team - uses Lambda MCP invokers in Lambda, stdio in local dev"""
         logger.info(f"Team {self.name} selecting player in Round {round}, Pick {pick}")
         if draft.is_complete:
             return "Draft is complete"
+
+        drafter_mode = self.get_drafter_mode(draft)
+        if drafter_mode == DrafterMode.HEURISTIC:
+            logger.info(f"[select_player] Using heuristic drafter for {self.name}")
+            return await self.select_player_heuristic(draft, round, pick)
+
+        deadline = PickDeadline(PICK_TIMEOUT_SECONDS)
         
         with trace(f"{self.name}-drafting Round: {round} Pick: {pick}"):
             try:
                 # Get draft context
                 strategy = self.get_strategy()
-                roster_json = await read_team_roster_resource(draft.id.lower(), self.name.lower())
+                structured = drafter_mode == DrafterMode.STRUCTURED
+                pick_context = None
+                if structured:
+                    # The pick is committed in-process, so the loaded draft is the source of truth
+                    roster_json = {pos: (p.to_dict() if p else None) for pos, p in self._get_draft_team(draft).roster.items()}
+                else:
+                    # Roster, needs and a candidate shortlist in one round trip; fall back to the roster resource
+                    pick_context = await self._read_pick_context(draft)
+                    if pick_context:
+                        roster_json = pick_context["roster"]
+                    else:
+                        roster_json = await read_team_roster_resource(draft.id.lower(), self.name.lower())
                 
                 # Handle empty roster
                 if not roster_json or (isinstance(roster_json, str) and roster_json.strip() == ""):
@@ -155,6 +452,8 @@ class Team(BaseModel):
                                 "name": p.name,
                                 "position": p.position,
                             }
+                            if structured:
+                                player_dict["id"] = p.id
                             players_data.append(player_dict)
                         
                         player_pool_json = json.dumps(players_data)
@@ -173,8 +472,9 @@ class Team(BaseModel):
                     
                     # Create a simplified list with just names and positions for easier validation
                     if isinstance(player_pool_data, list):
+                        # "id" is only present for structured picks (added with the player data above)
                         simple_player_list = [
-                            {"name": p.get("name", ""), "position": p.get("position", "")} 
+                            {"name": p.get("name", ""), "position": p.get("position", ""), **({"id": p["id"]} if "id" in p else {})}
                             for p in player_pool_data
                         ]
                         simple_player_list_str = json.dumps(simple_player_list, indent=2)
@@ -189,7 +489,8 @@ class Team(BaseModel):
                     simple_player_list_str = player_pool_json
 
                 # Prepare agent instructions
-                drafter_message = drafter_agent_instructions(
+                drafter_instructions_template = structured_drafter_agent_instructions if structured else drafter_agent_instructions
+                drafter_message = drafter_instructions_template(
                     draft_id=draft.id, 
                     team_name=self.name, 
                     strategy=strategy, 
@@ -205,6 +506,9 @@ class Team(BaseModel):
                     needed_positions=needed_positions, 
                     available_players=simple_player_list_str
                 )
+                if pick_context and pick_context.get("candidates"):
+                    shortlist = ", ".join(f"{c['name']} ({c['position']})" for c in pick_context["candidates"])
+                    researcher_message += f"\n**Top available candidates by 2025 stats for this strategy (start your research here):** {shortlist}\n"
                 
                 team_context = TeamContext(
                     draft_id=draft.id.lower(), 
@@ -216,6 +520,29 @@ class Team(BaseModel):
                     pick=pick
                 )
 
+                # Per-team session: agents get generic instructions and the full briefing goes
+                # into the first conversation turn, so later picks only send what changed
+                session = TeamAgentSession.get(draft.id, self.name) if AGENT_SESSION_REUSE else None
+                session_update = None
+                if session:
+                    drafted_players = [
+                        f"{p.name} ({p.position})" + (f" [id {p.id}]" if structured else "")
+                        for p in session.drafted_since_last_pick(draft)
+                    ]
+                    session_update = agent_session_update_message(
+                        draft_id=draft.id,
+                        team_name=self.name,
+                        needed_positions=needed_positions,
+                        drafted_players=drafted_players,
+                        round=round,
+                        pick=pick
+                    )
+                    researcher_instructions = agent_session_instructions("researcher", self.name, strategy)
+                    drafter_instructions = agent_session_instructions("drafter", self.name, strategy)
+                else:
+                    researcher_instructions = researcher_message
+                    drafter_instructions = drafter_message
+
                 if IS_LAMBDA:
                     logger.info("[select_player] Using Lambda MCP invokers (separate Lambda functions)")
                     
@@ -223,16 +550,17 @@ class Team(BaseModel):
                         get_draft_mcp_invoker,
                         get_search_mcp_invoker
                     )
+                    from backend.mcp_clients.inprocess_mcp import DRAFT_MCP_IN_PROCESS, get_inprocess_draft_invoker
                     
-                    # Get invokers
-                    draft_invoker = get_draft_mcp_invoker()
+                    # Get invokers (the draft server may run in this process instead of its own Lambda)
+                    draft_invoker = get_inprocess_draft_invoker() if DRAFT_MCP_IN_PROCESS else get_draft_mcp_invoker()
                     search_invoker = get_search_mcp_invoker()
                     
                     logger.info("[select_player] Lambda MCP invokers initialized")
                     
                     # Get tools from MCP Lambdas
                     logger.info("[select_player] Fetching tools from MCP Lambdas...")
-                    draft_tools_raw = await draft_invoker.list_tools()
+                    draft_tools_raw = [] if structured else await draft_invoker.list_tools()
                     
                     logger.info(f"[select_player] Got {len(draft_tools_raw)} draft tools from MCP Lambda")
                     logger.info(f"[select_player] Raw draft tools: {[t['name'] for t in draft_tools_raw]}")
@@ -301,13 +629,16 @@ class Team(BaseModel):
                     logger.info(f"[select_player] Draft tool names: {[t.name for t in draft_tools]}")
                     
                     # Create drafter agent with FunctionTool objects
-                    logger.info(f"[select_player] Creating Drafter agent with {len(draft_tools)} tools")
-                    drafter_agent = Agent(
-                        name="Drafter",
-                        instructions=drafter_message,
-                        model="gpt-41-mini",
-                        tools=draft_tools,
-                    )
+                    if structured:
+                        drafter_agent = self._create_structured_drafter(drafter_instructions)
+                    else:
+                        logger.info(f"[select_player] Creating Drafter agent with {len(draft_tools)} tools")
+                        drafter_agent = Agent(
+                            name="Drafter",
+                            instructions=drafter_instructions,
+                            model="gpt-41-mini",
+                            tools=draft_tools,
+                        )
                     
                     logger.info(f"[select_player] Drafter agent created. Agent tools: {getattr(drafter_agent, 'tools', 'NO TOOLS ATTR')}")
                     
@@ -350,186 +681,86 @@ class Team(BaseModel):
                     logger.info(f"[select_player] Creating Researcher agent with {len(researcher_tools)} tools")
                     researcher_agent = Agent(
                         name="Researcher",
-                        instructions=researcher_message,
+                        instructions=researcher_instructions,
                         model="gpt-41-mini",
                         tools=researcher_tools,
                     )
                     
                     logger.info(f"[select_player] Researcher agent created. Agent tools: {getattr(researcher_agent, 'tools', 'NO TOOLS ATTR')}")
                     
-                    # Run agents
-                    logger.info("[select_player] ===== RUNNING RESEARCHER AGENT =====")
-                    logger.info(f"[select_player] Researcher has {len(researcher_tools)} tools available")
-                    researcher_result = await Runner.run(
-                        starting_agent=researcher_agent,
-                        input=researcher_message,
-                        context=team_context,
-                        max_turns=RESEARCHER_MAX_TURNS
+                    selection = await self._run_pick_agents(
+                        draft, round, pick, roster,
+                        researcher_agent=researcher_agent,
+                        researcher_message=researcher_message,
+                        drafter_agent=drafter_agent,
+                        team_context=team_context,
+                        deadline=deadline,
+                        structured=structured,
+                        session=session,
+                        drafter_message=drafter_message,
+                        session_update=session_update
                     )
-                    
-                    logger.info(f"[select_player] Researcher output: {researcher_result.final_output}")
-                    
-                    logger.info("[select_player] ===== RUNNING DRAFTER AGENT =====")
-                    logger.info(f"[select_player] Drafter has {len(draft_tools)} tools available")
-                    drafter_result = await Runner.run(
-                        starting_agent=drafter_agent,
-                        input=f"Researcher recommendations: {researcher_result.final_output}",
-                        context=team_context,
-                        max_turns=DRAFTER_MAX_TURNS
-                    )
-                    
-                    roster_with_selected_player = await read_team_roster_resource(draft.id.lower(), self.name.lower())
-                    logger.info(f"Team {self.name} roster updated: {roster_with_selected_player}")
-                    logger.info(f"Drafter output: {drafter_result.final_output}")
-                    # ====================================================================
-                    # CHECK IF DRAFT WAS SUCCESSFUL BY COMPARING ROSTER SIZE
-                    # ====================================================================
-                    logger.info("[select_player] Checking if draft was successful...")
-
-                    # Get roster before draft (we already have it as roster)
-                    roster_before_count = len([v for v in roster.values() if v is not None]) if roster else 0
-                    logger.info(f"[select_player] Roster count before draft: {roster_before_count}")
-
-                    # Get roster after draft
-                    roster_with_selected_player = await read_team_roster_resource(draft.id.lower(), self.name.lower())
-                    try:
-                        roster_after = json.loads(roster_with_selected_player) if isinstance(roster_with_selected_player, str) else roster_with_selected_player
-                        roster_after_count = len([v for v in roster_after.values() if v is not None]) if roster_after else 0
-                        logger.info(f"[select_player] Roster count after draft: {roster_after_count}")
-                    except Exception as e:
-                        logger.error(f"[select_player] Error parsing roster after draft: {e}")
-                        roster_after_count = roster_before_count  # Assume no change if error
-
-                    # Check if a player was actually drafted
-                    if roster_after_count <= roster_before_count:
-                        # NO PLAYER WAS DRAFTED - ALL ATTEMPTS FAILED
-                        error_msg = (
-                            f"DRAFT FAILED for {self.name} at Round {round}, Pick {pick}. "
-                            f"Agent attempted to draft players but all 50 attempts failed. "
-                            f"Drafter output: {drafter_result.final_output}"
-                        )
-                        logger.error(f"[select_player] {error_msg}")
-                        
-                        # Raise exception to stop draft execution
-                        raise Exception(error_msg)
-
-                    # Success - player was drafted
-                    logger.info(f"[select_player] ✓ Draft successful! Team {self.name} roster updated")
-                    logger.info(f"[select_player] Roster after: {roster_with_selected_player}")
-                    logger.info(f"[select_player] Drafter output: {drafter_result.final_output}")
-                    
-                    return str(drafter_result.final_output)
                 else:
                     # ================================================================
-                    # Local development - use stdio MCP servers
+                    # Local development - use cached stdio MCP servers
                     # ================================================================
-                    logger.info("[select_player] Using stdio MCP servers (local dev)")
+                    logger.info("[select_player] Using cached MCP servers (local dev)")
                     
-                    from agents.mcp import MCPServerStdio
-                    from backend.config.mcp_params import drafter_mcp_server_params, researcher_mcp_server_params
+                    from backend.utils.mcp_cache import get_cached_mcp_servers, invalidate_mcp_servers
+                    from backend.mcp_clients.mcp_session_pool import TRANSPORT_ERRORS
                     from backend.draft_agents.research_agents.researcher_tool import get_researcher_tool
                     
-                    async with AsyncExitStack() as stack:
-                        # Initialize drafter MCP servers
-                        drafter_mcp_servers = []
-                        for i, params in enumerate(drafter_mcp_server_params):
-                            logger.info(f"[select_player] Starting Drafter MCP server {i+1}...")
-                            server = MCPServerStdio(params=params)
-                            await stack.enter_async_context(server)
-                            drafter_mcp_servers.append(server)
-                            logger.info(f"[select_player] Drafter MCP server {i+1} started")
-                        
-                        # Initialize researcher MCP servers
-                        researcher_mcp_servers = []
-                        for i, params in enumerate(researcher_mcp_server_params):
-                            logger.info(f"[select_player] Starting Researcher MCP server {i+1}...")
-                            server = MCPServerStdio(params=params)
-                            await stack.enter_async_context(server)
-                            researcher_mcp_servers.append(server)
-                            logger.info(f"[select_player] Researcher MCP server {i+1} started")
-                        
-                        logger.info("[select_player] All MCP servers initialized successfully")
-                        
+                    # Servers are started once and reused across picks (health-checked, restarted if dead)
+                    drafter_mcp_servers, researcher_mcp_servers = await get_cached_mcp_servers(include_drafter=not structured)
+                    logger.info("[select_player] MCP servers ready")
+                    
+                    if structured:
+                        drafter_agent = self._create_structured_drafter(drafter_instructions)
+                    else:
                         # Get draft tools
                         draft_tools = await get_draft_tools()
                         
                         # Create drafter agent with MCP servers
                         drafter_agent = Agent(
                             name="Drafter",
-                            instructions=drafter_message,
+                            instructions=drafter_instructions,
                             model="gpt-41-mini",
                             tools=draft_tools,
                             mcp_servers=drafter_mcp_servers,
                         )
-                        
-                        # Create researcher agent
-                        research_tool = await get_researcher_tool(researcher_mcp_servers)
-                        research_agent = Agent(
-                            name="Researcher",
-                            instructions=researcher_message,
-                            model="gpt-41-mini",
-                            tools=[research_tool],
-                            mcp_servers=researcher_mcp_servers,
-                        )
-                        
-                        # Run researcher
-                        logger.info("[select_player] Running Researcher agent...")
-                        researcher_result = await Runner.run(
-                            starting_agent=research_agent,
-                            input=researcher_message,
-                            context=team_context,
-                            max_turns=RESEARCHER_MAX_TURNS
-                        )
-                        
-                        logger.info(f"[select_player] Researcher output: {researcher_result.final_output}")
-                        
-                        # Run drafter
-                        logger.info("[select_player] Running Drafter agent...")
-                        drafter_result = await Runner.run(
-                        starting_agent=drafter_agent,
-                        input=f"Researcher recommendations: {researcher_result.final_output}",
-                        context=team_context,
-                        max_turns=DRAFTER_MAX_TURNS
+                    
+                    # Create researcher agent
+                    research_tool = await get_researcher_tool(researcher_mcp_servers)
+                    research_agent = Agent(
+                        name="Researcher",
+                        instructions=researcher_instructions,
+                        model="gpt-41-mini",
+                        tools=[research_tool],
+                        mcp_servers=researcher_mcp_servers,
                     )
-
-                    # ====================================================================
-                    # CHECK IF DRAFT WAS SUCCESSFUL BY COMPARING ROSTER SIZE
-                    # ====================================================================
-                    logger.info("[select_player] Checking if draft was successful...")
-
-                    # Get roster before draft (we already have it as roster)
-                    roster_before_count = len([v for v in roster.values() if v is not None]) if roster else 0
-                    logger.info(f"[select_player] Roster count before draft: {roster_before_count}")
-
-                    # Get roster after draft
-                    roster_with_selected_player = await read_team_roster_resource(draft.id.lower(), self.name.lower())
+                    
                     try:
-                        roster_after = json.loads(roster_with_selected_player) if isinstance(roster_with_selected_player, str) else roster_with_selected_player
-                        roster_after_count = len([v for v in roster_after.values() if v is not None]) if roster_after else 0
-                        logger.info(f"[select_player] Roster count after draft: {roster_after_count}")
-                    except Exception as e:
-                        logger.error(f"[select_player] Error parsing roster after draft: {e}")
-                        roster_after_count = roster_before_count  # Assume no change if error
-
-                    # Check if a player was actually drafted
-                    if roster_after_count <= roster_before_count:
-                        # NO PLAYER WAS DRAFTED - ALL ATTEMPTS FAILED
-                        error_msg = (
-                            f"DRAFT FAILED for {self.name} at Round {round}, Pick {pick}. "
-                            f"Agent attempted to draft players but all 5 attempts failed. "
-                            f"Drafter output: {drafter_result.final_output}"
+                        selection = await self._run_pick_agents(
+                            draft, round, pick, roster,
+                            researcher_agent=research_agent,
+                            researcher_message=researcher_message,
+                            drafter_agent=drafter_agent,
+                            team_context=team_context,
+                            deadline=deadline,
+                            structured=structured,
+                            session=session,
+                            drafter_message=drafter_message,
+                            session_update=session_update
                         )
-                        logger.error(f"[select_player] {error_msg}")
-                        
-                        # Raise exception to propagate to frontend
-                        raise Exception(error_msg)
-
-                    # Success - player was drafted
-                    logger.info(f"[select_player] ✓ Draft successful! Team {self.name} roster updated")
-                    logger.info(f"[select_player] Roster after: {roster_with_selected_player}")
-                    logger.info(f"[select_player] Drafter output: {drafter_result.final_output}")
-
-                    return str(drafter_result.final_output)
+                    except TRANSPORT_ERRORS:
+                        # A server died mid-pick; restart them on the next pick
+                        await invalidate_mcp_servers()
+                        raise
+
+                if session:
+                    session.record_pick(draft, round, pick)
+                    session.save()
+                return selection
                 
             except Exception as e:
                 logger.error(f"[select_player] Error: {e}", exc_info=True)
@@ -540,7 +771,8 @@ class Team(BaseModel):
             'name': self.name,
             'strategy': self.strategy,
             'roster': {pos: player.to_dict() if player else None for pos, player in self.roster.items()},
-            'drafted_players': [player.to_dict() for player in self.drafted_players]
+            'drafted_players': [player.to_dict() for player in self.drafted_players],
+            'drafter_mode': self.drafter_mode.value if self.drafter_mode else None
         }
 
 
@@ -3,11 +3,10 @@ from datetime import datetime
 def team_instructions(draft_id, name, strategy, needed_positions, available_players, round, pick):
     return f"""
 Your team name is {name}, participating in the fantasy baseball draft {draft_id}. Your strategy is {strategy}. Needed positions are {needed_positions}. Follow these steps strictly in sequence to draft exactly one player per round:
-Use the 'Researcher' tool to identify one player from the provided list of available players whose position matches the needed positions ({needed_positions}). Prioritize hitters based on past performance (e.g., batting average, home runs, RBIs) and projected future performance, aligning with {strategy} strategy. If the 'Researcher' tool fails (e.g., due to timeout), wait 10 seconds and retry until it succeeds.
+Use the 'Researcher' tool to identify one player from the provided list of available players whose position matches the needed positions ({needed_positions}). Prioritize hitters based on past performance (e.g., batting average, home runs, RBIs) and projected future performance, aligning with {strategy} strategy. If the 'Researcher' tool fails (e.g., due to timeout), retry it once; if it fails again, choose from the available players without research.
 After successfully identifying one player with the 'Researcher' tool, make a single call to the 'draft_specific_player' tool to draft that player for round {round}, pick {pick}. Do not make more than 1 call to 'draft_specific_player'. Do not attempt to draft multiple players.
 If the 'draft_specific_player' call fails, returns. Ensure only one call to the 'draft_specific_player' tool is made.
 After a successful draft, immediately stop all further calls to tools for the current round. Do not proceed with additional drafts or researching until the next round.
-If rate limit errors occur, wait 10 seconds before retrying the failed tool call. Do not prompt the user with questions.
 Do NOT prompt the user with questions.
 """
 
@@ -39,7 +38,6 @@ Here is the current datetime:
 {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
 
 Do not prompt user with questions.
-If you get rate limit errors on calls, wait 10 seconds, and try again.
 Now, carry out analysis, make your decision and draft only 1 player for your team from {available_players} whose position exists in {needed_positions}, and that fits your strategy.
 After you've successfully drafted only 1 player using the draft_specific_player tool, respond with a brief 2-3 sentence appraisal of why you selected the player and how the player will improve your roster, and end further calls.
 Do NOT prompt the user with questions.
@@ -248,6 +246,58 @@ Current time: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
 Draft ID: {draft_id}
 """
 
+def structured_drafter_agent_instructions(draft_id, team_name, strategy, needed_positions, available_players, round, pick):
+    from datetime import datetime
+    return f"""You are a fantasy baseball drafter. Choose EXACTLY ONE player to draft.
+
+**AVAILABLE PLAYERS LIST:**
+{available_players}
+
+**YOUR TASK:**
+Choose one player for {team_name} (Round {round}, Pick {pick}) using strategy: {strategy}
+Player must match one of these positions: {needed_positions}
+
+**HOW TO RESPOND:**
+You do NOT have any tools. Do not try to draft the player yourself.
+Return your decision with:
+- player_id: the EXACT id of the player from the available players list
+- player_name: the EXACT name of the player from the available players list
+- reason: a brief 1-2 sentence rationale for the pick based on the strategy and the researcher's recommendations
+
+**RULES:**
+- The player MUST appear in the available players list above
+- The player's position MUST be one of: {needed_positions}
+- If your previous pick was rejected, choose a DIFFERENT player
+- DO NOT prompt user with questions
+
+Current time: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+Draft ID: {draft_id}
+"""
+
+def agent_session_instructions(role, team_name, strategy):
+    return f"""You are the fantasy baseball {role} for team {team_name} (strategy: {strategy}) for this whole draft.
+
+The first message of this conversation is your full briefing: your task, the rules you must follow and the available players list.
+Later messages only contain what changed since your last pick: the new round and pick, the players drafted since then and your remaining needed positions.
+
+**RULES:**
+- Keep following every rule from your briefing
+- Players reported as drafted are NO LONGER available - never choose or recommend them
+- Only consider your remaining needed positions
+- DO NOT prompt user with questions
+"""
+
+def agent_session_update_message(draft_id, team_name, needed_positions, drafted_players, round, pick):
+    drafted = "\n".join(f"- {player}" for player in drafted_players) or "- None"
+    return f"""**UPDATE FOR {team_name}: Round {round}, Pick {pick}** (Draft ID: {draft_id})
+
+Players drafted since your last pick (REMOVE them from the available players list):
+{drafted}
+
+Your remaining needed positions: {needed_positions}
+Use round_num={round} and pick_num={pick} for this pick.
+"""
+
 def researcher_agent_instructions(draft_id, team_name, strategy, needed_positions, available_players):
     return f"""
 You are a fantasy baseball researcher for the 2025 MLB season.
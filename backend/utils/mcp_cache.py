@@ -1,67 +1,124 @@
 """
-Global MCP server cache for Lambda
+Global MCP server cache for the pick path.
+
+Starting the drafter and researcher MCP servers (a Python process importing
+the backend, an npx package) used to happen on every pick. The servers are
+now started once per process and reused across picks (and across warm
+Lambda invocations): each group is health-checked before reuse, restarted
+if a server died, stopped answering pings or belongs to an event loop that
+has since been closed, and shut down cleanly on exit. The lifecycle is
+the same one the draft client's session pool uses (BackgroundMCPConnection).
 """
+import asyncio
 import logging
+import time
 from contextlib import AsyncExitStack
-from agents.mcp import MCPServerStdio
-from backend.config.mcp_params import drafter_mcp_server_params, researcher_mcp_server_params
+from typing import Callable, List, Tuple
+
+from agents.mcp import MCPServer, MCPServerStdio, MCPServerStreamableHttp
+from backend.config.mcp_params import drafter_mcp_server_params, drafter_mcp_server_url, researcher_mcp_server_params
+from backend.mcp_clients.inprocess_mcp import DRAFT_MCP_IN_PROCESS, InProcessMCPServer
+from backend.mcp_clients.mcp_session_pool import MCP_PING_TIMEOUT_SECONDS, BackgroundMCPConnection
 
 logger = logging.getLogger(__name__)
 
-# Global cache (survives across warm Lambda invocations)
-_mcp_stack = None
-_drafter_servers = None
-_researcher_servers = None
+def create_drafter_mcp_server(params: dict):
+    """Drafter MCP server: in-process, the shared HTTP draft server if configured, else a stdio subprocess"""
+    if DRAFT_MCP_IN_PROCESS:
+        return InProcessMCPServer(name="draft_server")
+    if drafter_mcp_server_url:
+        return MCPServerStreamableHttp(params={"url": drafter_mcp_server_url}, name="draft_server")
+    return MCPServerStdio(params=params)
+
+
+class MCPServerGroup(BackgroundMCPConnection):
+    """A set of Agents SDK MCP servers started together and kept running (by a background task, via an AsyncExitStack)."""
+
+    log_prefix = "[MCPServerGroup]"
+
+    def __init__(self, name: str, factories: List[Callable[[], MCPServer]]):
+        super().__init__(name)
+        self.factories = factories
+
+    @property
+    def servers(self) -> List[MCPServer]:
+        return self.resource or []
+
+    async def _open(self, stack: AsyncExitStack) -> List[MCPServer]:
+        servers = []
+        for i, factory in enumerate(self.factories):
+            servers.append(await stack.enter_async_context(factory()))
+            logger.info(f"[MCPServerGroup] ✓ {self.name} server {i + 1} started")
+        return servers
+
+    async def _ping_server(self, server: MCPServer) -> bool:
+        # Servers without a client session (in-process) have nothing to ping
+        session = getattr(server, "session", None)
+        if session is None:
+            return not hasattr(server, "session")
+        try:
+            await asyncio.wait_for(session.send_ping(), timeout=MCP_PING_TIMEOUT_SECONDS)
+            return True
+        except Exception as e:
+            logger.warning(f"[MCPServerGroup] {self.name} server {server.name} failed health check: {e}")
+            return False
+
+    async def _ping(self) -> bool:
+        for server in self.servers:
+            if not await self._ping_server(server):
+                return False
+        return True
+
+    async def ensure(self) -> List[MCPServer]:
+        """Return running servers, (re)starting the group if needed."""
+        servers = await super().ensure()
+        self.last_used = time.monotonic()
+        return servers
 
-async def get_cached_mcp_servers():
+
+# Global cache (survives across picks and warm Lambda invocations)
+_drafter_group = MCPServerGroup(
+    "drafter",
+    [lambda params=params: create_drafter_mcp_server(params) for params in drafter_mcp_server_params]
+)
+_researcher_group = MCPServerGroup(
+    "researcher",
+    [lambda params=params: MCPServerStdio(params=params) for params in researcher_mcp_server_params]
+)
+
+
+async def get_cached_mcp_servers(include_drafter: bool = True) -> Tuple[List[MCPServer], List[MCPServer]]:
     """
     Get or create cached MCP servers.
-    Reuses servers across Lambda invocations for faster performance.
+    Reuses servers across picks and Lambda invocations; unhealthy servers are restarted.
+
+    Args:
+        include_drafter: False when the drafter doesn't use MCP servers (structured picks);
+            the drafter servers are then neither started nor checked.
+
+    Returns:
+        (drafter_servers, researcher_servers)
     """
-    global _mcp_stack, _drafter_servers, _researcher_servers
-    
-    # If already initialized, return cached servers
-    if _drafter_servers is not None and _researcher_servers is not None:
-        logger.info("Using cached MCP servers (warm start)")
-        return _drafter_servers, _researcher_servers
-    
-    # Cold start - initialize servers
-    logger.info("Initializing MCP servers (cold start)")
-    _mcp_stack = AsyncExitStack()
-    
-    # Initialize drafter servers
-    _drafter_servers = []
-    for i, params in enumerate(drafter_mcp_server_params):
-        try:
-            server = await _mcp_stack.enter_async_context(MCPServerStdio(params=params))
-            _drafter_servers.append(server)
-            logger.info(f"✓ Drafter MCP server {i+1} initialized")
-        except Exception as e:
-            logger.error(f"✗ Failed to initialize drafter MCP server {i+1}: {e}")
-            raise
-    
-    # Initialize researcher servers
-    _researcher_servers = []
-    for i, params in enumerate(researcher_mcp_server_params):
-        try:
-            server = await _mcp_stack.enter_async_context(MCPServerStdio(params=params))
-            _researcher_servers.append(server)
-            logger.info(f"✓ Researcher MCP server {i+1} initialized")
-        except Exception as e:
-            logger.error(f"✗ Failed to initialize researcher MCP server {i+1}: {e}")
-            raise
-    
-    logger.info("All MCP servers initialized and cached")
-    return _drafter_servers, _researcher_servers
+    drafter_servers = await _drafter_group.ensure() if include_drafter else []
+    researcher_servers = await _researcher_group.ensure()
+    return drafter_servers, researcher_servers
+
+
+async def invalidate_mcp_servers():
+    """Drop the cached servers after a transport failure; the next pick restarts them."""
+    await _drafter_group.invalidate()
+    await _researcher_group.invalidate()
+
+
+def mcp_server_stats() -> dict:
+    return {
+        group.name: {"running": len(group.servers), "restarts": group.restarts}
+        for group in (_drafter_group, _researcher_group)
+    }
 
 
 async def cleanup_mcp_servers():
-    """Cleanup MCP servers (call on Lambda shutdown if needed)"""
-    global _mcp_stack, _drafter_servers, _researcher_servers
-    
-    if _mcp_stack:
-        await _mcp_stack.aclose()
-        _mcp_stack = None
-        _drafter_servers = None
-        _researcher_servers = None
-        logger.info("MCP servers cleaned up")
\ No newline at end of file
+    """Stop the cached MCP servers (call on shutdown)"""
+    await _drafter_group.close()
+    await _researcher_group.close()
+    logger.info("MCP servers cleaned up")
@@ -0,0 +1,59 @@
+"""
+Wall-clock budgets for a single draft pick.
+
+A pick gets an overall deadline; each stage (researcher, drafter) asks the
+deadline for its own budget, capped by whatever time is left overall.
+"""
+import asyncio
+import inspect
+import logging
+import time
+from typing import Any, Awaitable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PickDeadline:
+    """Tracks the remaining wall-clock time for one pick."""
+
+    def __init__(self, total_seconds: float):
+        self.total_seconds = total_seconds
+        self.started_at = time.monotonic()
+        self.expires_at = self.started_at + total_seconds
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def budget(self, stage_seconds: float) -> float:
+        """Time a stage may use: its own budget, capped by what is left of the pick."""
+        return max(0.0, min(stage_seconds, self.remaining()))
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+
+async def run_with_budget(awaitable: Awaitable[Any], timeout: float, stage: str) -> Optional[Any]:
+    """
+    Await a stage with a timeout, cancelling it on overrun.
+
+    Returns:
+        The stage result, or None if the stage timed out (or had no budget left).
+    """
+    if timeout <= 0:
+        logger.warning(f"[run_with_budget] No time left for {stage}, skipping")
+        if inspect.iscoroutine(awaitable):
+            awaitable.close()
+        return None
+
+    started_at = time.monotonic()
+    try:
+        result = await asyncio.wait_for(awaitable, timeout=timeout)
+        logger.info(f"[run_with_budget] {stage} finished in {time.monotonic() - started_at:.1f}s (budget {timeout:.0f}s)")
+        return result
+    except asyncio.TimeoutError:
+        logger.warning(f"[run_with_budget] {stage} exceeded its {timeout:.0f}s budget and was cancelled")
+        return None
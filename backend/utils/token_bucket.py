@@ -0,0 +1,74 @@
+"""
+Client-side token-bucket rate limiter.
+
+Tokens refill continuously at `rate` per second up to `capacity` (the burst
+size). Callers wait in code for a token instead of hitting the API's rate
+limit and retrying.
+"""
+import asyncio
+import threading
+import time
+from typing import Mapping, Optional
+
+
+class TokenBucket:
+    """Thread-safe token bucket; acquire() blocks, acquire_async() sleeps without blocking the loop."""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token, possibly in advance; returns how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def _unreserve(self):
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + 1)
+
+    def pause(self, seconds: float):
+        """Hold off every caller for `seconds` (e.g. after the API reports a rate limit)."""
+        with self._lock:
+            self._tokens = min(self._tokens, 1 - seconds * self.rate)
+            self._updated_at = time.monotonic()
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a token.
+
+        Returns:
+            False (without consuming a token) if the wait would exceed `timeout`.
+        """
+        wait = self._reserve()
+        if timeout is not None and wait > timeout:
+            self._unreserve()
+            return False
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+    async def acquire_async(self, timeout: Optional[float] = None) -> bool:
+        wait = self._reserve()
+        if timeout is not None and wait > timeout:
+            self._unreserve()
+            return False
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return True
+
+
+def retry_after_seconds(headers: Mapping[str, str], default: float = 1.0) -> float:
+    """Seconds until a rate limit resets, from Retry-After or Brave's X-RateLimit-Reset (per-second window first)"""
+    value = headers.get("Retry-After") or headers.get("X-RateLimit-Reset", "")
+    try:
+        return float(value.split(",")[0].strip())
+    except ValueError:
+        return default
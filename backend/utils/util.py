@@ -27,6 +27,11 @@ class Position(Enum):
             json_schema=core_schema.str_schema(),
         )
 
+class DrafterMode(str, Enum):
+    LLM = "llm"
+    STRUCTURED = "structured"
+    HEURISTIC = "heuristic"
+
 mlbstatsapi_position_map = {
             'First Baseman': Position.FIRST_BASE,
             # 'Second Baseman': Position.SECOND_BASE,
@@ -70,5 +75,11 @@ draft_strategy_set = {early_ace_strategy,
                       pitching_heavy_strategy
                       }
 
+def snake_draft_order(teams: list, round_num: int) -> list:
+    """Snake draft: odd rounds use the base order, even rounds reverse it."""
+    if round_num % 2 == 0:
+        return list(reversed(teams))
+    return list(teams)
+
 NO_OF_TEAMS = 2
 NO_OF_ROUNDS = 4
\ No newline at end of file
@@ -82,6 +82,8 @@ resource "aws_lambda_function" "mcp_knowledgebase_server" {
       DEPLOYMENT_ENVIRONMENT  = "LAMBDA"
       VECTOR_BUCKET          = var.vector_bucket
       SAGEMAKER_ENDPOINT     = var.sagemaker_endpoint
+      # Key manifest, BM25 index and player links; /tmp SQLite is refused in Lambda
+      KB_MANIFEST_URL        = var.kb_manifest_url
     }
   }
   
@@ -227,6 +229,12 @@ variable "db_secret_arn" {
   type        = string
 }
 
+variable "kb_manifest_url" {
+  description = "SQLAlchemy URL of the Postgres database for the knowledge base key manifest"
+  type        = string
+  sensitive   = true
+}
+
 variable "vector_bucket" {
   description = "Name of the S3 vector bucket"
   type        = string
@@ -7,20 +7,64 @@ import json
 import logging
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from backend.utils.token_bucket import TokenBucket, retry_after_seconds
+from backend.utils.ttl_cache import TTLCache
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+BRAVE_SEARCH_URL = "https://api.search.brave.com/res/v1/web/search"
+
+# Match these to the Brave plan (Free: 1 request/second)
+BRAVE_RATE_LIMIT_PER_SECOND = float(os.getenv("BRAVE_RATE_LIMIT_PER_SECOND", "1"))
+BRAVE_RATE_LIMIT_BURST = float(os.getenv("BRAVE_RATE_LIMIT_BURST", "1"))
+# Longest a call waits for its turn before reporting the rate limit instead
+BRAVE_RATE_LIMIT_MAX_WAIT_SECONDS = float(os.getenv("BRAVE_RATE_LIMIT_MAX_WAIT_SECONDS", "20"))
+BRAVE_CACHE_TTL_SECONDS = float(os.getenv("BRAVE_CACHE_TTL_SECONDS", "3600"))
+BRAVE_CACHE_SIZE = int(os.getenv("BRAVE_CACHE_SIZE", "512"))
+
+# Module-level state is shared by every invocation of a warm Lambda container
+_rate_limiter = TokenBucket(rate=BRAVE_RATE_LIMIT_PER_SECOND, capacity=BRAVE_RATE_LIMIT_BURST)
+_result_cache = TTLCache(maxsize=BRAVE_CACHE_SIZE, ttl=BRAVE_CACHE_TTL_SECONDS)
+
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=10))
+
+
+def normalize_query(query: str) -> str:
+    """Cache key for a query: case- and whitespace-insensitive"""
+    return " ".join(query.lower().split())
+
+
+def _rate_limited_get(params: dict, headers: dict) -> requests.Response:
+    """GET once a rate-limit token is available; on a 429, wait out the reset once and retry"""
+    for attempt in range(2):
+        if not _rate_limiter.acquire(timeout=BRAVE_RATE_LIMIT_MAX_WAIT_SECONDS):
+            raise RuntimeError(f"Brave rate limit: no request slot within {BRAVE_RATE_LIMIT_MAX_WAIT_SECONDS:.0f}s")
+        response = _session.get(BRAVE_SEARCH_URL, headers=headers, params=params, timeout=30)
+        if response.status_code != 429 or attempt == 1:
+            return response
+        retry_after = retry_after_seconds(response.headers)
+        logger.warning(f"[brave_search] Rate limited by Brave, retrying in {retry_after:.1f}s")
+        _rate_limiter.pause(retry_after)
+    return response
+
 
 def brave_search(query: str, count: int = 10) -> dict:
-    """Execute Brave search"""
+    """Execute Brave search (rate limited, cached by normalized query)"""
     api_key = os.getenv("BRAVE_API_KEY")
     
     if not api_key:
         return {"error": "BRAVE_API_KEY not set"}
     
+    cache_key = (normalize_query(query), count)
+    cached = _result_cache.get(cache_key)
+    if cached is not None:
+        logger.info(f"[brave_search] Cache hit for '{query}'")
+        return cached
+    
     try:
-        url = "https://api.search.brave.com/res/v1/web/search"
         headers = {
             "Accept": "application/json",
             "X-Subscription-Token": api_key
@@ -30,10 +74,12 @@ def brave_search(query: str, count: int = 10) -> dict:
             "count": count
         }
         
-        response = requests.get(url, headers=headers, params=params, timeout=30)
+        response = _rate_limited_get(params, headers)
         response.raise_for_status()
         
-        return response.json()
+        result = response.json()
+        _result_cache.set(cache_key, result)
+        return result
         
     except Exception as e:
         logger.error(f"[brave_search] Error: {e}")
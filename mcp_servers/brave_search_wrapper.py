@@ -4,20 +4,45 @@ import os
 import json
 import asyncio
 import uuid
-from typing import Dict
+from typing import Dict, Optional, Set
 from pathlib import Path
 
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from mcp.server.fastmcp import FastMCP
+import httpx
 import logging
+from backend.utils.token_bucket import TokenBucket, retry_after_seconds
+from backend.utils.ttl_cache import TTLCache
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+BRAVE_SEARCH_URL = "https://api.search.brave.com/res/v1/web/search"
+BRAVE_RESULT_COUNT = 5
+
+# Finished tasks are kept long enough to be polled, then evicted (oldest first when full)
+SEARCH_TASK_TTL_SECONDS = float(os.getenv("SEARCH_TASK_TTL_SECONDS", "600"))
+SEARCH_TASK_MAX = int(os.getenv("SEARCH_TASK_MAX", "256"))
+# Successful results are reused for identical queries from any agent
+SEARCH_RESULT_TTL_SECONDS = float(os.getenv("SEARCH_RESULT_TTL_SECONDS", "3600"))
+SEARCH_RESULT_CACHE_SIZE = int(os.getenv("SEARCH_RESULT_CACHE_SIZE", "512"))
+# Match these to the Brave plan (Free: 1 request/second); searches queue in code instead of failing
+BRAVE_RATE_LIMIT_PER_SECOND = float(os.getenv("BRAVE_RATE_LIMIT_PER_SECOND", "1"))
+BRAVE_RATE_LIMIT_BURST = float(os.getenv("BRAVE_RATE_LIMIT_BURST", "1"))
+
 # Storage for search tasks
-search_tasks: Dict[str, dict] = {}
+search_tasks = TTLCache(maxsize=SEARCH_TASK_MAX, ttl=SEARCH_TASK_TTL_SECONDS)
+# Normalized query -> formatted results
+search_results = TTLCache(maxsize=SEARCH_RESULT_CACHE_SIZE, ttl=SEARCH_RESULT_TTL_SECONDS)
+# Normalized query -> task id of the search currently running for it (single flight)
+inflight_searches: Dict[str, str] = {}
+# Strong references so running searches aren't garbage collected
+_background_tasks: Set[asyncio.Task] = set()
+
+_http_client: Optional[httpx.AsyncClient] = None
+_rate_limiter = TokenBucket(rate=BRAVE_RATE_LIMIT_PER_SECOND, capacity=BRAVE_RATE_LIMIT_BURST)
 
 mcp = FastMCP(
     name="brave_search_wrapper",
@@ -25,6 +50,22 @@ mcp = FastMCP(
 )
 
 
+def normalize_query(query: str) -> str:
+    """Cache key for a query: case- and whitespace-insensitive"""
+    return " ".join(query.lower().split())
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Shared pooled client (keep-alive connections to the Brave API across searches)"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5)
+        )
+    return _http_client
+
+
 @mcp.tool()
 async def brave_search_async(query: str) -> str:
     """
@@ -37,18 +78,49 @@ async def brave_search_async(query: str) -> str:
     Returns:
         JSON with task_id for checking status later
     """
+    key = normalize_query(query)
+    
+    # Identical query already running: share its task instead of searching again
+    task_id = inflight_searches.get(key)
+    if task_id is not None and task_id in search_tasks:
+        logger.info(f"Task {task_id}: Joining in-flight search for '{query}'")
+        return json.dumps({
+            "status": "accepted",
+            "task_id": task_id,
+            "message": f"Search started for: {query}"
+        })
+    
     task_id = f"search_{uuid.uuid4().hex[:8]}"
     
-    search_tasks[task_id] = {
+    cached = search_results.get(key)
+    if cached is not None:
+        search_tasks.set(task_id, {
+            "status": "completed",
+            "message": f"Found {len(cached)} results",
+            "query": query,
+            "results": cached,
+            "cached": True
+        })
+        logger.info(f"Task {task_id}: ✓ Served '{query}' from cache")
+        return json.dumps({
+            "status": "accepted",
+            "task_id": task_id,
+            "message": f"Search completed for: {query}"
+        })
+    
+    search_tasks.set(task_id, {
         "status": "processing",
         "message": f"Searching for: {query}",
         "query": query
-    }
+    })
+    inflight_searches[key] = task_id
     
     logger.info(f"Task {task_id}: Starting search for '{query}'")
     
     # Start background search
-    asyncio.create_task(_process_search_in_background(task_id, query))
+    task = asyncio.create_task(_process_search_in_background(task_id, query))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
     
     return json.dumps({
         "status": "accepted",
@@ -59,64 +131,69 @@ async def brave_search_async(query: str) -> str:
 
 async def _process_search_in_background(task_id: str, query: str):
     """Background task to actually perform the search"""
+    key = normalize_query(query)
     try:
-        import httpx
-        
         brave_api_key = os.getenv("BRAVE_API_KEY")
         if not brave_api_key:
-            search_tasks[task_id] = {
+            search_tasks.set(task_id, {
                 "status": "error",
                 "error": "BRAVE_API_KEY not set"
-            }
+            })
             return
         
-        search_tasks[task_id]["status"] = "searching"
+        search_tasks.set(task_id, {**search_tasks.get(task_id, {}), "status": "searching"})
         
-        # Make actual Brave Search API call
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://api.search.brave.com/res/v1/web/search",
-                headers={
-                    "Accept": "application/json",
-                    "X-Subscription-Token": brave_api_key
-                },
-                params={"q": query, "count": 5},
-                timeout=10.0
-            )
+        # Make actual Brave Search API call once a rate-limit slot is free
+        await _rate_limiter.acquire_async()
+        response = await get_http_client().get(
+            BRAVE_SEARCH_URL,
+            headers={
+                "Accept": "application/json",
+                "X-Subscription-Token": brave_api_key
+            },
+            params={"q": query, "count": BRAVE_RESULT_COUNT}
+        )
+        
+        if response.status_code == 200:
+            data = response.json()
+            results = data.get("web", {}).get("results", [])
+            
+            # Format results
+            formatted_results = []
+            for result in results[:BRAVE_RESULT_COUNT]:
+                formatted_results.append({
+                    "title": result.get("title", ""),
+                    "url": result.get("url", ""),
+                    "description": result.get("description", "")
+                })
+            
+            search_results.set(key, formatted_results)
+            search_tasks.set(task_id, {
+                "status": "completed",
+                "message": f"Found {len(formatted_results)} results",
+                "query": query,
+                "results": formatted_results
+            })
             
-            if response.status_code == 200:
-                data = response.json()
-                results = data.get("web", {}).get("results", [])
-                
-                # Format results
-                formatted_results = []
-                for i, result in enumerate(results[:5], 1):
-                    formatted_results.append({
-                        "title": result.get("title", ""),
-                        "url": result.get("url", ""),
-                        "description": result.get("description", "")
-                    })
-                
-                search_tasks[task_id] = {
-                    "status": "completed",
-                    "message": f"Found {len(formatted_results)} results",
-                    "query": query,
-                    "results": formatted_results
-                }
-                
-                logger.info(f"Task {task_id}: ✓ Search completed with {len(formatted_results)} results")
-            else:
-                search_tasks[task_id] = {
-                    "status": "error",
-                    "error": f"Search failed with status {response.status_code}"
-                }
+            logger.info(f"Task {task_id}: ✓ Search completed with {len(formatted_results)} results")
+        else:
+            if response.status_code == 429:
+                # Hold off later searches until Brave's rate limit window resets
+                _rate_limiter.pause(retry_after_seconds(response.headers))
+            search_tasks.set(task_id, {
+                "status": "error",
+                "error": f"Search failed with status {response.status_code}"
+            })
         
     except Exception as e:
         logger.error(f"Task {task_id}: Error - {e}", exc_info=True)
-        search_tasks[task_id] = {
+        search_tasks.set(task_id, {
             "status": "error",
             "error": str(e)
-        }
+        })
+    finally:
+        if inflight_searches.get(key) == task_id:
+            del inflight_searches[key]
 
 
 @mcp.tool()
@@ -130,13 +207,14 @@ async def check_search_status(task_id: str) -> str:
     Returns:
         JSON with current status and results if completed
     """
-    if task_id not in search_tasks:
+    task = search_tasks.get(task_id)
+    if task is None:
         return json.dumps({
             "status": "not_found",
-            "error": f"Task {task_id} not found"
+            "error": f"Task {task_id} not found or expired"
         })
     
-    return json.dumps(search_tasks[task_id])
+    return json.dumps(task)
 
 
 if __name__ == "__main__":
@@ -16,6 +16,42 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+TOOLS = [
+    {
+        "name": "draft_specific_player",
+        "description": "Draft a specific player for a team",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "draft_id": {"type": "string"},
+                "team_name": {"type": "string"},
+                "player_name": {"type": "string"},
+                "round_num": {"type": "integer"},
+                "pick_num": {"type": "integer"},
+                "rationale": {"type": "string"}
+            },
+            "required": ["draft_id", "team_name", "player_name", "round_num", "pick_num"]
+        }
+    },
+    {
+        "name": "list_available_players",
+        "description": "List undrafted players one page at a time, filtered by position and sorted by name or a stat (e.g. hr, era). Pass next_cursor from the previous page to continue.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "draft_id": {"type": "string"},
+                "position": {"type": ["string", "null"], "description": "Comma-separated positions, e.g. \"P,OF\""},
+                "sort_by": {"type": ["string", "null"], "description": "name, position, team or a stat"},
+                "order": {"type": ["string", "null"], "enum": ["asc", "desc", None]},
+                "limit": {"type": ["integer", "null"]},
+                "cursor": {"type": ["string", "null"]}
+            },
+            "required": ["draft_id"]
+        }
+    }
+]
+
+
 async def handle_tool_call_async(tool_name: str, arguments: dict) -> dict:
     """Handle tool calls - executes the actual draft logic"""
     
@@ -139,17 +175,152 @@ async def handle_tool_call_async(tool_name: str, arguments: dict) -> dict:
             logger.error(f"[draft_specific_player] {error_msg}", exc_info=True)
             return {"status": "error", "error": error_msg}
     
+    elif tool_name == "list_available_players":
+        from backend.models.draft_views import get_available_players_page
+        
+        try:
+            draft_id = arguments["draft_id"]
+            page = get_available_players_page(
+                draft_id,
+                position=arguments.get("position"),
+                sort_by=arguments.get("sort_by") or "name",
+                order=arguments.get("order"),
+                limit=arguments.get("limit") or 25,
+                cursor=arguments.get("cursor")
+            )
+            if page is None:
+                return {"status": "error", "error": f"Draft {draft_id} not found"}
+            
+            page["players"] = [
+                {k: p.get(k) for k in ("id", "name", "position", "team", "stats")}
+                for p in page["players"]
+            ]
+            logger.info(f"[list_available_players] Returning {len(page['players'])} of {page['total']} players")
+            return {"status": "completed", **page}
+        
+        except ValueError as e:
+            return {"status": "error", "error": str(e)}
+        except Exception as e:
+            logger.error(f"[list_available_players] Error: {e}", exc_info=True)
+            return {"status": "error", "error": f"Error listing players: {str(e)}"}
+    
     else:
         return {"status": "error", "error": f"Unknown tool: {tool_name}"}
 
 
+async def read_resource_async(uri: str) -> str:
+    """Read a draft:// resource (same URIs as the FastMCP draft server); returns JSON text"""
+    from backend.models.draft_views import (
+        get_player_pool_view, get_available_players_page, get_team_roster_view,
+        get_draft_context_view, get_draft_order_view
+    )
+    from backend.data.postgresql.unified_db import read_draft_history
+    
+    parts = uri.removeprefix("draft://").split("/")
+    kind, args = parts[0], parts[1:]
+    
+    if kind == "player_pool" and len(args) == 1:
+        data = get_player_pool_view(args[0])
+    elif kind == "player_pool" and len(args) == 2 and args[1] == "available":
+        data = get_available_players_page(args[0])
+    elif kind == "player_pool" and len(args) == 6 and args[1] == "available":
+        draft_id, _, position, sort_by, limit, cursor = args
+        data = get_available_players_page(
+            draft_id,
+            position=None if position == "all" else position,
+            sort_by=sort_by,
+            limit=int(limit),
+            cursor=None if cursor == "start" else cursor
+        )
+    elif kind == "team_roster" and len(args) == 2:
+        data = get_team_roster_view(args[0], args[1])
+    elif kind == "context" and len(args) == 2:
+        data = get_draft_context_view(args[0], args[1])
+    elif kind == "draft_order" and len(args) == 3 and args[1] == "round":
+        data = get_draft_order_view(args[0], int(args[2]))
+    elif kind == "history" and len(args) == 1:
+        data = read_draft_history(args[0].lower())
+    else:
+        raise LookupError(f"Unknown resource: {uri}")
+    
+    if data is None:
+        raise LookupError(f"Resource not found: {uri}")
+    return json.dumps(data, default=str)
+
+
+# JSON-RPC error codes
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+INVALID_REQUEST = -32600
+
+
+async def handle_jsonrpc_async(request: dict):
+    """
+    Handle one JSON-RPC 2.0 MCP request (tools/list, tools/call, resources/read, ping).
+
+    Returns:
+        The JSON-RPC response, or None for notifications (no id).
+    """
+    request_id = request.get("id") if isinstance(request, dict) else None
+    
+    def error(code: int, message: str) -> dict:
+        return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+    
+    if not isinstance(request, dict) or request.get("jsonrpc") != "2.0" or "method" not in request:
+        return error(INVALID_REQUEST, "Invalid JSON-RPC request")
+    
+    method = request["method"]
+    params = request.get("params") or {}
+    
+    try:
+        if method == "tools/list":
+            result = {"tools": TOOLS}
+        elif method == "tools/call":
+            if "name" not in params:
+                return error(INVALID_PARAMS, "tools/call requires a tool name")
+            tool_result = await handle_tool_call_async(params["name"], params.get("arguments") or {})
+            result = {
+                "content": [{"type": "text", "text": json.dumps(tool_result, default=str)}],
+                "isError": tool_result.get("status") == "error"
+            }
+        elif method == "resources/read":
+            if "uri" not in params:
+                return error(INVALID_PARAMS, "resources/read requires a uri")
+            text = await read_resource_async(params["uri"])
+            result = {"contents": [{"uri": params["uri"], "mimeType": "application/json", "text": text}]}
+        elif method == "ping":
+            result = {}
+        else:
+            return error(METHOD_NOT_FOUND, f"Method not found: {method}")
+    except LookupError as e:
+        return error(INVALID_PARAMS, str(e))
+    except Exception as e:
+        logger.error(f"[MCP Draft Lambda] {method} failed: {e}", exc_info=True)
+        return error(INTERNAL_ERROR, str(e))
+    
+    if request_id is None:
+        return None
+    return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+async def handle_jsonrpc_batch_async(requests: list) -> list:
+    """Handle a JSON-RPC batch in one invocation; requests run concurrently, responses keep request order."""
+    if not requests:
+        return [{"jsonrpc": "2.0", "id": None, "error": {"code": INVALID_REQUEST, "message": "Empty batch"}}]
+    responses = await asyncio.gather(*(handle_jsonrpc_async(request) for request in requests))
+    return [response for response in responses if response is not None]
+
+
 def handler(event, context):
     """
     Lambda handler for MCP Draft Server
     
     Receives tool call requests from mlb-draft-oracle-worker and executes them.
+    Also accepts MCP JSON-RPC 2.0 requests (tools/list, tools/call, resources/read,
+    ping), either a single request object or a batch (list) handled in one invocation.
     
-    Event format:
+    Action event format:
     {
         "action": "call_tool",
         "tool_name": "draft_specific_player",
@@ -165,6 +336,13 @@ def handler(event, context):
     """
     logger.info(f"[MCP Draft Lambda] Received event: {json.dumps(event, default=str)[:500]}")
     
+    # JSON-RPC 2.0 (LambdaMCPClient): a single request or a batch
+    if isinstance(event, list):
+        logger.info(f"[MCP Draft Lambda] JSON-RPC batch of {len(event)} requests")
+        return asyncio.run(handle_jsonrpc_batch_async(event))
+    if isinstance(event, dict) and event.get("jsonrpc") == "2.0":
+        return asyncio.run(handle_jsonrpc_async(event))
+    
     try:
         action = event.get("action")
         
@@ -186,28 +364,10 @@ def handler(event, context):
         
         elif action == "list_tools":
             # Return available tools
-            tools = [
-                {
-                    "name": "draft_specific_player",
-                    "description": "Draft a specific player for a team",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "draft_id": {"type": "string"},
-                            "team_name": {"type": "string"},
-                            "player_name": {"type": "string"},
-                            "round_num": {"type": "integer"},
-                            "pick_num": {"type": "integer"},
-                            "rationale": {"type": "string"}
-                        },
-                        "required": ["draft_id", "team_name", "player_name", "round_num", "pick_num"]
-                    }
-                }
-            ]
             
             return {
                 "statusCode": 200,
-                "body": json.dumps({"tools": tools})
+                "body": json.dumps({"tools": TOOLS})
             }
         
         else:
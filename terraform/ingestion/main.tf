@@ -137,6 +137,12 @@ resource "aws_iam_role_policy" "lambda_policy" {
   })
 }
 
+# ENI permissions for running inside the VPC
+resource "aws_iam_role_policy_attachment" "lambda_vpc_access" {
+  role       = aws_iam_role.lambda_role.name
+  policy_arn = "arn:aws:iam::aws:policy/service-role/AWSLambdaVPCAccessExecutionRole"
+}
+
 # Lambda function
 resource "aws_lambda_function" "ingest" {
   function_name = "mlbdraftoracle-ingest"
@@ -153,8 +159,20 @@ resource "aws_lambda_function" "ingest" {
   
   environment {
     variables = {
-      VECTOR_BUCKET      = aws_s3_bucket.vectors.id
-      SAGEMAKER_ENDPOINT = var.sagemaker_endpoint_name
+      VECTOR_BUCKET          = aws_s3_bucket.vectors.id
+      SAGEMAKER_ENDPOINT     = var.sagemaker_endpoint_name
+      DEPLOYMENT_ENVIRONMENT = "LAMBDA"
+      # Key manifest, BM25 index and player links; /tmp SQLite is refused in Lambda
+      KB_MANIFEST_URL        = var.kb_manifest_url
+    }
+  }
+  
+  # Reach the RDS database holding the manifest
+  dynamic "vpc_config" {
+    for_each = length(var.private_subnet_ids) > 0 ? [1] : []
+    content {
+      subnet_ids         = var.private_subnet_ids
+      security_group_ids = var.security_group_ids
     }
   }
   
@@ -6,4 +6,22 @@ variable "aws_region" {
 variable "sagemaker_endpoint_name" {
   description = "Name of the SageMaker endpoint"
   type        = string
-}
\ No newline at end of file
+}
+
+variable "kb_manifest_url" {
+  description = "SQLAlchemy URL of the Postgres database for the knowledge base key manifest"
+  type        = string
+  sensitive   = true
+}
+
+variable "private_subnet_ids" {
+  description = "Private subnet IDs with access to the manifest database"
+  type        = list(string)
+  default     = []
+}
+
+variable "security_group_ids" {
+  description = "Security group IDs for the ingest Lambda"
+  type        = list(string)
+  default     = []
+}